@@ -14,6 +14,7 @@ from dearpypixl.core.appitem import AppItem as AppItem
 from dearpypixl.core.appitem import ContainerItem as ContainerItem
 from dearpypixl.core.appitem import ChildItem as ChildItem
 from dearpypixl.core.appitem import CompositeItem as CompositeItem
+from dearpypixl.core.cache import batch as batch
 from dearpypixl.core.errors import DearPyGuiError as DearPyGuiError
 from dearpypixl.core.errors import TextureNotFoundError as TextureNotFoundError
 from dearpypixl.core.errors import IncompatibleTypeError as IncompatibleTypeError
@@ -37,4 +38,16 @@ if not _management._DPX_NO_INIT:
     from dearpypixl.lib.constants import *
     from dearpypixl.lib.functions import *  # must be last to pull any patched API
 
+    from dearpypixl.lib import items as _items
+    # only when the library was generated with `--lazy-items` (not the default)
+    if "__getattr__" in vars(_items):
+        def __getattr__(name: str, /):
+            # item types are not star-imported from lazily-generated libraries
+            from dearpypixl.lib import items
+            try:
+                return getattr(items, name)
+            except AttributeError:
+                raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    del _items
+
 del _sys, _management
@@ -5,8 +5,11 @@ High-level use of DearPyGui's functional API on items created by
 these types is generally not supported — use the appropriate interface
 instead.
 """
+from dearpypixl.core import cache
+from dearpypixl.core import dispatch
 from dearpypixl.core import metautil
 from dearpypixl.core import appitem
+from dearpypixl.core import redraw
 from dearpypixl.core.protocols import Descriptor, DataDescriptor
 from dearpypixl.lib import items as _items
 from dearpypixl import color as _colors
@@ -14,6 +17,7 @@ from dearpypixl import style as _styles
 
 from dearpygui import _dearpygui
 
+import types
 import typing
 if typing.TYPE_CHECKING:
     from dearpypixl.core.protocols import Item, ItemChildCommand, Array
@@ -153,12 +157,15 @@ def _cast_method[O, **P, T](method: typing.Callable[typing.Concatenate[O, P], T]
 def _delegator_property[T](path, source, type: T) -> T:
     return metautil.create_compitem_prop_delegate(path, source)  # type: ignore
 
-def _delegate_callback(self, callback, app_data = None, /):
-    match metautil.get_positional_arity(callback):
-        case 0: callback()
-        case 1: callback(self)
-        case 2: callback(self, app_data)
-        case _: callback(self, app_data, self.user_data)
+def _delegate_callback(self, callback, app_data = None, /, *, __arity=metautil.get_positional_arity, __dispatcher=dispatch.dispatcher):
+    match __arity(callback):
+        case 0: result = callback()
+        case 1: result = callback(self)
+        case 2: result = callback(self, app_data)
+        case _: result = callback(self, app_data, self.user_data)
+    # `async def` callbacks
+    if result is not None and isinstance(result, types.CoroutineType):
+        __dispatcher.run_coroutine(result)
 
 
 type _ItemPosition = DataDescriptor[list[int], Array[int, typing.Literal[0, 2]]]
@@ -255,7 +262,7 @@ class InputTextCombo(_mvGroupComposite):
     def value(self, value: str, /) -> None:
         item = f"{self.tag}/input"
         _dearpygui.set_value(item, '')
-        _dearpygui.configure_item(item, hint=value)
+        cache.configure_item(item, hint=value)
 
     @property
     def items(self, /) -> tuple[typing.Any, ...]:
@@ -275,7 +282,7 @@ class InputTextCombo(_mvGroupComposite):
             raise
         else:
             menu = f"{self.tag}/menu"
-            _dearpygui.configure_item(menu, user_data=items)
+            cache.configure_item(menu, user_data=items)
             _dearpygui.delete_item(menu, children_only=True, slot=1)
             stage.unstage(menu)
 
@@ -284,20 +291,20 @@ class InputTextCombo(_mvGroupComposite):
         return _dearpygui.get_item_configuration(f"{self.tag}/button")["user_data"]
     @on_activate_callback.setter
     def on_activate_callback(self, value: typing.Callable | None, /) -> None:
-        _dearpygui.configure_item(f"{self.tag}/button", user_data=value)
+        cache.configure_item(f"{self.tag}/button", user_data=value)
     @on_activate_callback.deleter
     def on_activate_callback(self, /) -> None:
-        _dearpygui.configure_item(f"{self.tag}/button", user_data=None)
+        cache.configure_item(f"{self.tag}/button", user_data=None)
 
     @property
     def on_edit_callback(self, /):
         return _dearpygui.get_item_configuration(f"{self.tag}/input")["user_data"]
     @on_edit_callback.setter
     def on_edit_callback(self, value: typing.Callable | None, /) -> None:
-        _dearpygui.configure_item(f"{self.tag}/input", user_data=value)
+        cache.configure_item(f"{self.tag}/input", user_data=value)
     @on_edit_callback.deleter
     def on_edit_callback(self, /) -> None:
-        _dearpygui.configure_item(f"{self.tag}/input", user_data=None)
+        cache.configure_item(f"{self.tag}/input", user_data=None)
 
     _OTHER_CONFIG = frozenset(("items", "on_edit_callback", "on_activate_callback"))
 
@@ -435,16 +442,17 @@ class InputTextCombo(_mvGroupComposite):
         if pos is not None:
             group_config['pos'] = pos
 
-        for k,v in kwargs.items():
-            if k in GROUP_CONFIG:
-                group_config[k] = v
-            elif k in INPUT_CONFIG:
-                input_config[k] = v
-            elif k in OTHER_CONFIG:
-                setattr(self, k, v)
+        with cache.batch():
+            for k,v in kwargs.items():
+                if k in GROUP_CONFIG:
+                    group_config[k] = v
+                elif k in INPUT_CONFIG:
+                    input_config[k] = v
+                elif k in OTHER_CONFIG:
+                    setattr(self, k, v)
 
-        _dearpygui.configure_item(self, **group_config)
-        _dearpygui.configure_item(f"{self.tag}/input", **input_config)
+            cache.configure_item(self, **group_config)
+            cache.configure_item(f"{self.tag}/input", **input_config)
 
     def configuration(self, /) -> dict[str, typing.Any]:
         group_config = _dearpygui.get_item_configuration(self)
@@ -465,10 +473,10 @@ class InputTextCombo(_mvGroupComposite):
         state = self.state()
         width = state["rect_size"][0]
         pos   = state["rect_min"][0], state["rect_max"][1]
-        _dearpygui.configure_item(f"{self.tag}/menu", show=True, pos=pos, min_size=(width, 100), width=width)
+        cache.configure_item(f"{self.tag}/menu", show=True, pos=pos, min_size=(width, 100), width=width)
 
     def hide_menu(self, /):
-        _dearpygui.configure_item(f"{self.tag}/menu", show=False)
+        cache.configure_item(f"{self.tag}/menu", show=False)
 
     def init_button(self, /, *, parent: Item = 0, tag: Item = 0, callback = None) -> Item:
         """Returns an item that will be used to display the item menu when
@@ -637,7 +645,7 @@ class ItemSelector(appitem.CompositeItem, _items.mvCombo):
             filter_key=filter_key, drop_callback=drop_callback, drag_callback=drag_callback,
             payload_type=payload_type, tracked=tracked, track_offset=track_offset, pos=pos,
         )
-        _dearpygui.configure_item(self, callback=self.on_edit)
+        cache.configure_item(self, callback=self.on_edit)
 
         if itemgetter is not None:
             self.itemgetter = itemgetter
@@ -706,7 +714,7 @@ class ItemSelector(appitem.CompositeItem, _items.mvCombo):
         reprlist.insert(0, '')
 
         caches = self._caches = (reprlist, itemlist)
-        _dearpygui.configure_item(self, items=reprlist)
+        cache.configure_item(self, items=reprlist)
 
         return caches
 
@@ -739,6 +747,7 @@ class ItemSelector(appitem.CompositeItem, _items.mvCombo):
 
         if not value:
             _dearpygui.set_value(self, '')
+            redraw.mark()
 
             if callback is not None:
                 _delegate_callback(self, callback, None)
@@ -756,12 +765,14 @@ class ItemSelector(appitem.CompositeItem, _items.mvCombo):
             raise TypeError(f"expected an existing item's identifier or string representation, got {value!r}")
 
         _dearpygui.set_value(self, self.formatter(value))
+        redraw.mark()
 
         if callback is not None:
             _delegate_callback(self, callback, value)
     @value.deleter
     def value(self, /) -> None:
         _dearpygui.set_value(self, '')
+        redraw.mark()
 
     # we need an additional event to fire when the dropdown button is clicked
     # but before showing the menu -- `handlers` should never be `None`
@@ -869,14 +880,16 @@ class SplitLabelButton(_mvChildWindowComposite):
     @value.setter
     def value(self, value: str | None, /) -> None:
         if not value:
-            self.l_text = self.r_text = ''
-            return
-        l_text, _, r_text = value.partition("##")
-        self.l_text = l_text
-        self.r_text = r_text
+            l_text = r_text = ''
+        else:
+            l_text, _, r_text = value.partition("##")
+        with cache.batch():
+            self.l_text = l_text
+            self.r_text = r_text
     @value.deleter
     def value(self, /) -> None:
-        self.l_text = self.r_text = ''
+        with cache.batch():
+            self.l_text = self.r_text = ''
 
     @property
     def l_text(self, /) -> str:
@@ -892,7 +905,7 @@ class SplitLabelButton(_mvChildWindowComposite):
     def l_text(self, value: str, /) -> None:
         path = f"{self.tag}/l_item"
         _dearpygui.set_value(path, value)
-        _dearpygui.configure_item(path, label=value)
+        cache.configure_item(path, label=value)
     @l_text.deleter
     def l_text(self, /) -> None:
         self.l_text = ''
@@ -911,7 +924,7 @@ class SplitLabelButton(_mvChildWindowComposite):
     def r_text(self, value: str, /) -> None:
         path = f"{self.tag}/r_item"
         _dearpygui.set_value(path, value)
-        _dearpygui.configure_item(path, label=value)
+        cache.configure_item(path, label=value)
     @r_text.deleter
     def r_text(self, /) -> None:
         self.r_text = ''
@@ -963,11 +976,12 @@ class SplitLabelButton(_mvChildWindowComposite):
         return self
 
     def configure(self, **kwargs) -> None:
-        if "enabled" in kwargs:
-            self.enabled = kwargs.pop("enabled")
-        if "callback" in kwargs:
-            self.callback = kwargs.pop("callback")
-        _dearpygui.configure_item(self, **kwargs)
+        with cache.batch():
+            if "enabled" in kwargs:
+                self.enabled = kwargs.pop("enabled")
+            if "callback" in kwargs:
+                self.callback = kwargs.pop("callback")
+            cache.configure_item(self, **kwargs)
 
     def configuration(self, /) -> dict[str, typing.Any]:
         config = _dearpygui.get_item_configuration(self)
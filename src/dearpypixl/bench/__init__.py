@@ -0,0 +1,3 @@
+"""Benchmarks for DearPyPixl internals. Each module is runnable via
+`python -m dearpypixl.bench.<module>`.
+"""
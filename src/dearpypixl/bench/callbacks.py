@@ -0,0 +1,127 @@
+"""Compares callback delegate creation and dispatch against their
+uncached counterparts.
+
+    - "create": `metautil.create_callback_delegate` (one compiled template
+    per arity) vs. compiling a new function for each callback
+    - "arity": `metautil.get_positional_arity` (cached) vs. inspecting the
+    callable on every call, as done when dispatching callbacks via
+    `_delegate_callback`
+    - "run_callbacks": the patched `run_callbacks` vs. DearPyGui's
+    `inspect.signature`-based implementation
+    - "coalesce": the callback dispatcher draining a queue where each
+    sender has 8 pending jobs, with and without coalescing
+
+Usage: `python -m dearpypixl.bench.callbacks [--callbacks N] [--repeat N]`
+"""
+import time
+import inspect
+import argparse
+
+from dearpygui import dearpygui
+from dearpypixl.core import metautil
+from dearpypixl.core import dispatch
+from dearpypixl.lib import viewport
+
+
+def _create_delegate_compiled(func, /):
+    match metautil._get_positional_arity(func):
+        case 0: body = "_callback()"
+        case 1: body = "_callback(sender)"
+        case 2: body = "_callback(sender, app_data)"
+        case _: body = "_callback(sender, app_data, user_data)"
+    return metautil.create_function(
+        "callback_delegate",
+        ("sender", "app_data", "user_data", "/"),
+        body,
+        metautil.__name__,
+        locals={"_callback": func},
+    )
+
+
+def _run_callbacks_inspect(jobs, /):
+    for job in jobs:
+        if job[0] is None:
+            continue
+        sig = inspect.signature(job[0])
+        job[0](*job[1:len(sig.parameters) + 1])
+
+
+class _Handler:
+    def __init__(self, /) -> None:
+        self.calls = 0
+
+    def __call__(self, sender, app_data, /) -> None:
+        self.calls += 1
+
+    def on_event(self, sender, /) -> None:
+        self.calls += 1
+
+
+def _make_callbacks(count: int, /) -> list:
+    # distinct callables, as when wiring a panel with closures, bound
+    # methods and callable objects
+    callbacks = []
+    for i in range(count):
+        match i % 6:
+            case 0: callbacks.append(lambda: None)
+            case 1: callbacks.append(lambda sender: None)
+            case 2: callbacks.append(lambda sender, app_data=None: None)
+            case 3: callbacks.append(lambda sender, app_data, user_data: None)
+            case 4: callbacks.append(_Handler())
+            case _: callbacks.append(_Handler().on_event)
+    return callbacks
+
+
+def _time(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - t0
+
+
+def main(argv: list[str] | None = None, /) -> None:
+    parser = argparse.ArgumentParser(prog="python -m dearpypixl.bench.callbacks", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--callbacks", type=int, default=10_000, help="number of callbacks (default: 10000)")
+    parser.add_argument("--repeat", type=int, default=10, help="number of dispatch rounds (default: 10)")
+    args = parser.parse_args(argv)
+
+    callbacks = _make_callbacks(args.callbacks)
+    jobs = [(cb, i, None, None) for i, cb in enumerate(callbacks)]
+    calls = len(callbacks) * args.repeat
+
+    def create(factory, /):
+        for cb in callbacks:
+            factory(cb)
+
+    def arity(func, /):
+        for _ in range(args.repeat):
+            for cb in callbacks:
+                func(cb)
+
+    def drain(func, jobs, /):
+        for _ in range(args.repeat):
+            func(jobs)
+
+    # slider drag: every sender queues several jobs per frame
+    burst = [(cb, i, j, None) for i, cb in enumerate(callbacks[:len(callbacks) // 8]) for j in range(8)]
+    plain = dispatch.CallbackDispatcher()
+    merged = dispatch.CallbackDispatcher(coalesce=True)
+
+    assert dearpygui.run_callbacks is viewport.run_callbacks, "`run_callbacks` is not patched"
+
+    print(f"{'benchmark':<16}{'baseline':>12}{'optimized':>12}{'speedup':>10}")
+    for name, n, baseline, optimized in (
+        ("create", len(callbacks), lambda: create(_create_delegate_compiled), lambda: create(metautil.create_callback_delegate)),
+        ("arity", calls, lambda: arity(metautil._get_positional_arity), lambda: arity(metautil.get_positional_arity)),
+        ("run_callbacks", calls, lambda: drain(_run_callbacks_inspect, jobs), lambda: drain(viewport.run_callbacks, jobs)),
+        ("coalesce", len(burst) * args.repeat, lambda: drain(plain, burst), lambda: drain(merged, burst)),
+    ):
+        t_base = _time(baseline)
+        t_opt  = _time(optimized)
+        print(
+            f"{name:<16}{t_base / n * 1e6:>10.2f}us"
+            f"{t_opt / n * 1e6:>10.2f}us{t_base / t_opt:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Measures the cost of writing lines to a `Console` and a
+`VirtualConsole`, and the number of DearPyGui items each holds afterwards.
+
+    - "console": every line creates a `mvStringValue` in the console's
+    `LogRegistry` and a `mvText` item that renders it
+    - "virtual": lines are stored in Python; the console's text items are
+    created once, on the first refresh
+
+"refresh" is the cost of `VirtualConsole.refresh()` while scrolling one
+line per call. No viewport is needed; the console's view is simulated.
+
+Usage: `python -m dearpypixl.bench.console [--lines N ...] [--refreshes N]`
+"""
+import time
+import argparse
+
+from dearpygui import dearpygui, _dearpygui
+
+from dearpypixl import console as _console
+from dearpypixl.console import Console, VirtualConsole
+
+
+def _write(func, lines: int, /) -> float:
+    t0 = time.perf_counter()
+    for i in range(lines):
+        func(f"line {i}")
+    return time.perf_counter() - t0
+
+
+def main(argv: list[str] | None = None, /) -> None:
+    parser = argparse.ArgumentParser(prog="python -m dearpypixl.bench.console", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--lines", type=int, nargs="*", default=[1_000, 10_000, 50_000], help="number of lines written (default: 1000 10000 50000)")
+    parser.add_argument("--refreshes", type=int, default=200, help="number of refreshes (default: 200)")
+    args = parser.parse_args(argv)
+
+    dearpygui.create_context()
+
+    print(f"{'console':<10}{'lines':>8}{'write':>12}{'items':>10}{'refresh':>12}")
+    for lines in args.lines:
+        with dearpygui.window() as window:
+            pass
+
+        n_items = len(_dearpygui.get_all_items())
+        item = Console.create(parent=window)
+        t = _write(item.write, lines) / lines
+        print(f"{'console':<10}{lines:>8}{t * 1e6:>10.1f}us{len(_dearpygui.get_all_items()) - n_items:>10}{'':>12}")
+        _dearpygui.delete_item(window)
+
+        with dearpygui.window() as window:
+            pass
+
+        n_items = len(_dearpygui.get_all_items())
+        item = VirtualConsole.create(parent=window, line_height=13)
+        t = _write(item.write, lines) / lines
+
+        scroll = [0.0]
+        get_item_state = _dearpygui.get_item_state
+
+        def get_state(target, /):
+            state = get_item_state(target)
+            if target == item:
+                state["rect_size"] = [400, 600]
+                state["scroll_pos"] = [0.0, scroll[0]]
+            return state
+
+        _console._dearpygui.get_item_state = get_state
+        try:
+            item.auto_scroll = False
+            item.refresh()
+            t0 = time.perf_counter()
+            for i in range(args.refreshes):
+                scroll[0] = (i % lines) * 17.0
+                item.refresh()
+            t_refresh = (time.perf_counter() - t0) / args.refreshes
+        finally:
+            _console._dearpygui.get_item_state = get_item_state
+
+        print(f"{'virtual':<10}{lines:>8}{t * 1e6:>10.1f}us{len(_dearpygui.get_all_items()) - n_items:>10}{t_refresh * 1e6:>10.1f}us")
+        _dearpygui.delete_item(window)
+
+    dearpygui.destroy_context()
+
+
+if __name__ == "__main__":
+    main()
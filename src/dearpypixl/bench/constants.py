@@ -0,0 +1,93 @@
+"""Measures the import time of `dearpypixl.lib.constants` and the cost of
+building its enum groups, in fresh interpreters.
+
+When the module was generated with `--lazy-constants`, generated enum
+groups are built on first access; the "deferred" column reports how
+many groups were not built at import, and "first access" how long it took
+to build all of them afterwards. "construction" is the time it takes to
+build an equivalent of every enum group found in the module, which is
+roughly what the lazy form saves at import.
+
+Usage: `python -m dearpypixl.bench.constants [--samples N]`
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+
+_SAMPLE_SCRIPT = """
+import sys, enum, json, time
+
+import dearpypixl
+
+t0 = time.perf_counter()
+import dearpypixl.lib.constants as constants
+t_import = time.perf_counter() - t0
+
+namespace = vars(constants)
+lazy = namespace.get("_LAZY_ENUMS", ())
+deferred = [name for name in lazy if name not in namespace]
+
+t0 = time.perf_counter()
+for name in deferred:
+    getattr(constants, name)
+t_access = time.perf_counter() - t0
+
+groups = {
+    value for value in vars(constants).values()
+    if isinstance(value, enum.EnumType) and value.__module__ == constants.__name__
+}
+t0 = time.perf_counter()
+for group in groups:
+    enum.IntEnum(group.__name__, [
+        (name, int(member)) for name, member in group.__members__.items()
+        if name.isidentifier()
+    ])
+t_construct = time.perf_counter() - t0
+
+json.dump({
+    "import": t_import,
+    "access": t_access,
+    "construct": t_construct,
+    "groups": len(groups),
+    "deferred": len(deferred),
+}, sys.stdout)
+"""
+
+
+def _sample() -> dict[str, float]:
+    env = os.environ | {"_DPX_NO_INIT": "1"}
+    result = subprocess.run(
+        [sys.executable, "-c", _SAMPLE_SCRIPT],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main(argv: list[str] | None = None, /) -> None:
+    parser = argparse.ArgumentParser(prog="python -m dearpypixl.bench.constants", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=20, help="number of interpreters to sample (default: 20)")
+    args = parser.parse_args(argv)
+
+    _sample()  # warm the bytecode cache
+    samples = [_sample() for _ in range(args.samples)]
+
+    print(f"enum groups: {samples[0]['groups']}  deferred: {samples[0]['deferred']}")
+    print(f"{'phase':<14}{'median':>12}{'min':>12}")
+    for name, key in (
+        ("import", "import"),
+        ("first access", "access"),
+        ("construction", "construct"),
+    ):
+        values = [s[key] for s in samples]
+        print(f"{name:<14}{statistics.median(values) * 1e3:>10.2f}ms{min(values) * 1e3:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Measures the cost of drawing a `Grid` every frame, when nothing
+changed, when the grid is resized, and when every item is rewritten.
+
+    - "full": every slot and item rect is recalculated and written, as
+    before grids tracked changes (via `Grid.invalidate()`)
+    - "idle": the grid's settings and its parent's rect are unchanged
+    - "resize": the parent's width changes by one pixel every draw
+    - "push": one item is re-pushed every draw
+    - "overlay": as "resize", with the grid's overlay shown
+
+Items are real DearPyGui buttons; no viewport is needed.
+
+Usage: `python -m dearpypixl.bench.grid [--cols N] [--rows N] [--draws N]`
+"""
+import time
+import argparse
+
+from dearpygui import dearpygui
+
+from dearpypixl.grid import Grid
+
+
+def main(argv: list[str] | None = None, /) -> None:
+    parser = argparse.ArgumentParser(prog="python -m dearpypixl.bench.grid", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--cols", type=int, default=10, help="number of columns (default: 10)")
+    parser.add_argument("--rows", type=int, default=20, help="number of rows (default: 20)")
+    parser.add_argument("--draws", type=int, default=500, help="number of draws per benchmark (default: 500)")
+    args = parser.parse_args(argv)
+
+    dearpygui.create_context()
+
+    rect = [800, 600, 0, 0, True]
+    grid = Grid(args.cols, args.rows, None, rect_getter=lambda parent: tuple(rect))
+    with dearpygui.window():
+        items = [dearpygui.add_button() for _ in range(args.cols * args.rows)]
+    for i, item in enumerate(items):
+        grid.push(item, i % args.cols, i // args.cols)
+    grid.draw()
+
+    def full():
+        grid.invalidate()
+        grid.draw()
+
+    def resize():
+        rect[0] += 1
+        grid.draw()
+
+    def push():
+        grid.push(items[0], 0, 0)
+        grid.draw()
+
+    print(f"{len(items)} items")
+    print(f"{'benchmark':<12}{'draw':>12}{'computed':>10}{'written':>10}")
+    for name, func in (("full", full), ("idle", grid.draw), ("resize", resize), ("push", push), ("overlay", resize)):
+        if name == "overlay":
+            grid.overlay = True
+        t0 = time.perf_counter()
+        for _ in range(args.draws):
+            func()
+        t = (time.perf_counter() - t0) / args.draws
+        print(f"{name:<12}{t * 1e6:>10.1f}us{grid.rects_computed:>10}{grid.rects_written:>10}")
+
+    dearpygui.destroy_context()
+
+
+if __name__ == "__main__":
+    main()
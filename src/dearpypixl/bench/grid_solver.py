@@ -0,0 +1,80 @@
+"""Compares the `Grid` solvers when every slot and item is recalculated,
+across grid sizes.
+
+    - "python": the default solver, which calculates each item in turn
+    - "array": the "array" solver without NumPy
+    - "numpy": the "array" solver with NumPy (if it is installed)
+
+Each grid has one item per cell. Items are not real DearPyGui items and
+their rects are not applied, so the numbers reflect the cost of the
+solvers alone. The solvers' results are checked to be identical.
+
+Usage: `python -m dearpypixl.bench.grid_solver [--sizes N ...] [--draws N]`
+"""
+import time
+import argparse
+
+from dearpygui import dearpygui
+
+from dearpypixl import grid as _grid
+from dearpypixl.grid import Grid, ItemData
+
+
+def _create_grid(size: int, solver: str, rects: dict, /) -> Grid:
+    grid = Grid(size, size, None, rect_getter=lambda parent: (size * 40, size * 30, 0, 0, True), solver=solver)
+    grid.padding = 2
+    grid.cols[0].size = 120
+    for i in range(size * size):
+        x, y = i % size, i // size
+        item_data = ItemData(
+            item=i + 1,
+            cellspan=(x, y, x if i % 5 else -1, y),
+            max_size=(0.0, 20.0 if i % 3 else 0.0),
+            padding=(float("nan"),) * 4,
+            pos_coef=Grid.ANCHORS["c"],
+            rect_setter=lambda item, *rect: rects.__setitem__(item, rect),
+        )
+        grid._item_data.add(item_data)
+    return grid
+
+
+def main(argv: list[str] | None = None, /) -> None:
+    parser = argparse.ArgumentParser(prog="python -m dearpypixl.bench.grid_solver", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="*", default=[8, 16, 32, 64], help="number of columns and rows of each grid (default: 8 16 32 64)")
+    parser.add_argument("--draws", type=int, default=20, help="number of draws per benchmark (default: 20)")
+    args = parser.parse_args(argv)
+
+    dearpygui.create_context()
+
+    numpy = _grid._get_numpy()
+    solvers = [("python", "python", None), ("array", "array", None)]
+    if numpy is not None:
+        solvers.append(("numpy", "array", numpy))
+
+    print(f"{'grid':<10}{'items':>8}" + "".join(f"{name:>12}" for name, *_ in solvers))
+    for size in args.sizes:
+        row = f"{f'{size}x{size}':<10}{size * size:>8}"
+        expected = None
+        for _, solver, numpy in solvers:
+            _grid._numpy = numpy
+            rects = {}
+            grid = _create_grid(size, solver, rects)
+
+            t0 = time.perf_counter()
+            for _ in range(args.draws):
+                grid.invalidate()
+                grid.draw()
+            t = (time.perf_counter() - t0) / args.draws
+
+            if expected is None:
+                expected = rects
+            elif rects != expected:
+                raise AssertionError(f"{solver!r} solver results differ ({size}x{size} grid)")
+            row += f"{t * 1e3:>10.2f}ms"
+        print(row)
+
+    dearpygui.destroy_context()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Measures the CPU use and frame pacing of the `Runtime` event loop
+with and without pacing, while rendering on demand, and while paused.
+
+Rendering is simulated (no viewport is needed), so the numbers reflect
+the cost of the event loop itself. "late" is how far past its deadline
+each frame was rendered (99th percentile). The "timed" run records
+`FrameTimings`. The "on demand" runs render on demand with an idle UI,
+and with a UI changed every 100ms.
+
+Usage: `python -m dearpypixl.bench.runtime [--seconds N] [--fps N ...]`
+"""
+import time
+import argparse
+import threading
+import statistics
+
+from dearpypixl.runtime import Runtime, Signal, FrameTimings
+
+
+class _PollingPause(Signal):
+    # `PAUSE` as implemented before pacing
+    def __call__(self, runtime: Runtime, /) -> None:
+        while True:
+            time.sleep(0)
+            try:
+                runtime._emit_signal()
+            except Signal as signal:
+                runtime.signal(signal)
+                return
+
+
+def _run(runtime: Runtime, seconds: float, /) -> tuple[float, list[int]]:
+    frames = []
+    deadline = time.perf_counter() + seconds
+
+    runtime.render = lambda: frames.append(time.perf_counter_ns())  # type: ignore
+    runtime._is_dearpygui_running = lambda: time.perf_counter() < deadline  # type: ignore
+    runtime._get_viewport_size = lambda: (0, 0)  # type: ignore
+
+    t_wall = time.perf_counter()
+    t_cpu  = time.process_time()
+    runtime.run()
+    t_wall = time.perf_counter() - t_wall
+    t_cpu  = time.process_time() - t_cpu
+
+    return t_cpu / t_wall * 100, frames
+
+
+def _lateness(frames: list[int], interval: int, /) -> float:
+    late = [max(0, b - a - interval) for a, b in zip(frames, frames[1:])]
+    if len(late) < 2:
+        return 0.0
+    return statistics.quantiles(late, n=100)[98] / 1e6
+
+
+def main(argv: list[str] | None = None, /) -> None:
+    parser = argparse.ArgumentParser(prog="python -m dearpypixl.bench.runtime", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seconds", type=float, default=3.0, help="duration of each run (default: 3)")
+    parser.add_argument("--fps", type=int, nargs="*", default=[30, 60], help="frame rate limits to run (default: 30 60)")
+    args = parser.parse_args(argv)
+
+    print(f"{'loop':<16}{'cpu':>8}{'fps':>8}{'late p99':>12}")
+    for fps in args.fps:
+        for pacing in (False, True):
+            runtime = Runtime(frame_rate_limit=fps, pacing=pacing)
+            cpu, frames = _run(runtime, args.seconds)
+            late = _lateness(frames, 1_000_000_000 // fps)
+            name = f"{fps} fps {'paced' if pacing else 'polled'}"
+            print(f"{name:<16}{cpu:>7.1f}%{len(frames) / args.seconds:>8.1f}{late:>10.3f}ms")
+
+    runtime = Runtime(frame_rate_limit=args.fps[-1], frame_timings=FrameTimings())
+    cpu, frames = _run(runtime, args.seconds)
+    late = _lateness(frames, 1_000_000_000 // args.fps[-1])
+    name = f"{args.fps[-1]} fps timed"
+    print(f"{name:<16}{cpu:>7.1f}%{len(frames) / args.seconds:>8.1f}{late:>10.3f}ms")
+
+    for name, interval in (("idle", None), ("changing", 0.1)):
+        runtime = Runtime(frame_rate_limit=args.fps[-1], on_demand=True)
+        if interval is not None:
+            def invalidate(stop=threading.Event()):
+                while not stop.wait(interval):
+                    runtime.invalidate()
+            threading.Thread(target=invalidate, daemon=True).start()
+        cpu, frames = _run(runtime, args.seconds)
+        name = f"{args.fps[-1]} fps {name}"
+        print(f"{name:<16}{cpu:>7.1f}%{len(frames) / args.seconds:>8.1f}")
+
+    for name, signal in (("paused polled", _PollingPause), ("paused", Runtime.PAUSE)):
+        runtime = Runtime(frame_rate_limit=args.fps[0])
+        runtime.signal(signal)
+        threading.Timer(args.seconds, runtime.signal, (Runtime.STOP,)).start()
+        cpu, _ = _run(runtime, args.seconds * 2)
+        print(f"{name:<16}{cpu:>7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Profiles the startup cost of DearPyPixl in fresh interpreters, and
+reports it as JSON.
+
+Each sample imports `dearpypixl` and the extra modules requested in a new
+subprocess (with `-X importtime`), then creates the first item interface.
+The following phases are timed:
+
+    - "import": importing `dearpypixl` and the extra modules
+    - "patch": time spent in `management.patch` during the import phase
+    - "initializer": creating the first item interface, which runs the
+    `management.initializer` path
+    - "create_context": time spent in `create_context()` by the initializer
+    - "setup_dearpygui": time spent in `setup_dearpygui()` by the initializer
+
+Module timings are the self and cumulative times reported by
+`-X importtime` for modules of `dearpypixl` and `dearpygui`. All times are
+in milliseconds; each timing reports the median, min, and max of all
+samples.
+
+Usage: `python -m dearpypixl.bench.startup [--samples N] [--modules M ...]
+[--no-initializer] [--output FILE]`
+"""
+import sys
+import json
+import argparse
+import platform
+import importlib.metadata
+import statistics
+import subprocess
+
+
+_DEFAULT_MODULES = (
+    "dearpypixl.theming",
+    "dearpypixl.grid",
+    "dearpypixl.runtime",
+    "dearpypixl.console",
+    "dearpypixl.menus",
+    "dearpypixl.basic",
+    "dearpypixl.interop",
+)
+
+
+_SAMPLE_SCRIPT = """
+import sys, json, time, importlib, importlib.util
+
+perf_counter = time.perf_counter
+timings = {"patch": 0.0, "create_context": 0.0, "setup_dearpygui": 0.0}
+counts = {"patch": 0}
+
+
+def timed(key, func, /):
+    def wrapper(*args, **kwargs):
+        t0 = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timings[key] += perf_counter() - t0
+    return wrapper
+
+
+class ManagementFinder:
+    @classmethod
+    def find_spec(cls, name, path=None, target=None):
+        if name != "dearpypixl.core.management":
+            return None
+        sys.meta_path.remove(cls)
+        spec = importlib.util.find_spec(name)
+        exec_module = spec.loader.exec_module
+
+        def exec_and_instrument(module):
+            exec_module(module)
+            patch = module.patch
+
+            def timed_patch(target, replacement=None, /, **kwargs):
+                counts["patch"] += 1
+                t0 = perf_counter()
+                try:
+                    if replacement is None:
+                        return timed("patch", patch(target, **kwargs))
+                    return patch(target, replacement, **kwargs)
+                finally:
+                    timings["patch"] += perf_counter() - t0
+
+            module.patch = timed_patch
+
+        spec.loader.exec_module = exec_and_instrument
+        return spec
+
+
+sys.meta_path.insert(0, ManagementFinder)
+
+t0 = perf_counter()
+import dearpypixl
+for name in MODULES:
+    importlib.import_module(name)
+timings["import"] = perf_counter() - t0
+
+if INITIALIZER:
+    from dearpygui import dearpygui
+    from dearpypixl.core import management
+    if management._DPX_NO_DEARPYGUI_AUTO_INIT:
+        dearpygui.create_context()
+
+    dearpygui.create_context = timed("create_context", dearpygui.create_context)
+    dearpygui.setup_dearpygui = timed("setup_dearpygui", dearpygui.setup_dearpygui)
+
+    t0 = perf_counter()
+    dearpypixl.AppItem()
+    timings["initializer"] = perf_counter() - t0
+else:
+    del timings["create_context"], timings["setup_dearpygui"]
+
+json.dump({"timings": timings, "counts": counts}, sys.stdout)
+"""
+
+
+def _parse_importtime(stderr: str, /) -> dict[str, tuple[float, float]]:
+    modules = {}
+    for ln in stderr.splitlines():
+        if not ln.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = ln.removeprefix("import time:").split("|")
+        name = name.strip()
+        if name.startswith(("dearpypixl", "dearpygui")):
+            try:
+                modules[name] = (int(self_us) / 1e3, int(cumulative_us) / 1e3)
+            except ValueError:  # header
+                pass
+    return modules
+
+
+def _sample(modules: tuple[str, ...], initializer: bool, /) -> tuple[dict, dict]:
+    script = f"MODULES = {modules!r}\nINITIALIZER = {initializer!r}\n{_SAMPLE_SCRIPT}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode:
+        sys.exit(f"sample failed (exit code {result.returncode}):\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout), _parse_importtime(result.stderr)
+
+
+def _summarize(values: list[float], /) -> dict[str, float]:
+    return {
+        "median": round(statistics.median(values), 3),
+        "min": round(min(values), 3),
+        "max": round(max(values), 3),
+    }
+
+
+def main(argv: list[str] | None = None, /) -> None:
+    parser = argparse.ArgumentParser(prog="python -m dearpypixl.bench.startup", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--samples", type=int, default=10, help="number of interpreters to sample (default: 10)")
+    parser.add_argument("--modules", nargs="*", default=_DEFAULT_MODULES, help="extra modules to import after `dearpypixl`")
+    parser.add_argument("--no-initializer", action="store_true", help="do not create the first item interface (e.g. without a display)")
+    parser.add_argument("--output", default=None, help="write the report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    modules     = tuple(args.modules)
+    initializer = not args.no_initializer
+
+    _sample(modules, initializer)  # warm the bytecode cache
+
+    phases = {}
+    module_times = {}
+    patch_count = 0
+    for _ in range(args.samples):
+        result, imports = _sample(modules, initializer)
+        for phase, seconds in result["timings"].items():
+            phases.setdefault(phase, []).append(seconds * 1e3)
+        patch_count = result["counts"]["patch"]
+        for name, times in imports.items():
+            module_times.setdefault(name, []).append(times)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "dearpygui": importlib.metadata.version("dearpygui"),
+        "samples": args.samples,
+        "modules_imported": list(modules),
+        "patch_count": patch_count,
+        "phases": {phase: _summarize(values) for phase, values in phases.items()},
+        "modules": {
+            name: {
+                "self": _summarize([t[0] for t in times]),
+                "cumulative": _summarize([t[1] for t in times]),
+            }
+            for name, times in sorted(module_times.items(), key=lambda kv: -statistics.median(t[1] for t in kv[1]))
+        },
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
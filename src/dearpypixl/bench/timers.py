@@ -0,0 +1,107 @@
+"""Measures the overhead of `Runtime` timers with many timers active,
+against polling a list of deadlines on every update.
+
+    - "schedule": scheduling a timer via `Runtime.call_later()`
+    - "cancel": cancelling a scheduled timer
+    - "fire": running a due timer (the callback does nothing)
+    - "periodic": running and rescheduling a `Runtime.call_every()` timer
+    - "tick": checking for due timers once when none are due
+
+Usage: `python -m dearpypixl.bench.timers [--timers N] [--ticks N]`
+"""
+import time
+import random
+import argparse
+import collections
+
+from dearpypixl.runtime import Runtime
+
+
+def _noop() -> None:
+    pass
+
+
+class _PolledTimers:
+    # deadlines checked by scanning every timer on every update
+    def __init__(self, /) -> None:
+        self.timers = collections.deque()
+
+    def call_at(self, when: int, callback, /) -> None:
+        self.timers.append((when, callback))
+
+    def poll(self, now: int, /) -> None:
+        timers = self.timers
+        for _ in range(len(timers)):
+            entry = timers.popleft()
+            if entry[0] <= now:
+                entry[1]()
+            else:
+                timers.append(entry)
+
+
+def _time(func, *args) -> float:
+    t0 = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - t0
+
+
+def main(argv: list[str] | None = None, /) -> None:
+    parser = argparse.ArgumentParser(prog="python -m dearpypixl.bench.timers", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--timers", type=int, default=10_000, help="number of active timers (default: 10000)")
+    parser.add_argument("--ticks", type=int, default=1_000, help="number of idle checks (default: 1000)")
+    args = parser.parse_args(argv)
+
+    n = args.timers
+    rng = random.Random(0)
+    now = time.perf_counter_ns()
+    hour = 3_600_000_000_000
+    deadlines = [now + hour + rng.randrange(hour) for _ in range(n)]
+
+    runtime = Runtime()
+    polled  = _PolledTimers()
+
+    def schedule(call_at, /):
+        for when in deadlines:
+            call_at(when, _noop)
+
+    def tick_heap():
+        timers = runtime._timers
+        for _ in range(args.ticks):
+            if timers and timers[0][0] <= now:
+                runtime._run_timers(timers, now)
+
+    def tick_polled():
+        for _ in range(args.ticks):
+            polled.poll(now)
+
+    t_schedule = _time(schedule, runtime.call_at)
+    t_schedule_poll = _time(schedule, polled.call_at)
+    t_tick_heap = _time(tick_heap)
+    t_tick_poll = _time(tick_polled)
+
+    handles = [entry[2] for entry in runtime._timers]
+    rng.shuffle(handles)
+    t_cancel = _time(lambda: [h.cancel() for h in handles[:n // 2]])
+
+    # `n` timers active, all due
+    runtime = Runtime()
+    schedule(runtime.call_at)
+    t_fire = _time(runtime._run_timers, runtime._timers, now + 2 * hour)
+    t_fire_poll = _time(polled.poll, now + 2 * hour)
+
+    runtime = Runtime()
+    for _ in range(n):
+        runtime.call_every(1.0, _noop)
+    t_periodic = _time(runtime._run_timers, runtime._timers, time.perf_counter_ns() + 1_000_000)
+
+    print(f"{n} active timers")
+    print(f"{'benchmark':<16}{'polled':>12}{'heap':>12}")
+    print(f"{'schedule':<16}{t_schedule_poll / n * 1e6:>10.3f}us{t_schedule / n * 1e6:>10.3f}us")
+    print(f"{'cancel':<16}{'':>12}{t_cancel / (n // 2) * 1e6:>10.3f}us")
+    print(f"{'fire':<16}{t_fire_poll / n * 1e6:>10.3f}us{t_fire / n * 1e6:>10.3f}us")
+    print(f"{'periodic':<16}{'':>12}{t_periodic / n * 1e6:>10.3f}us")
+    print(f"{'tick':<16}{t_tick_poll / args.ticks * 1e6:>10.3f}us{t_tick_heap / args.ticks * 1e6:>10.3f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Compares hierarchy queries answered by the item tree mirror
+(`dearpypixl.core.tree`) against walking the hierarchy via
+`get_item_info`.
+
+Usage: `python -m dearpypixl.bench.tree [--items N] [--samples N]`
+"""
+import os
+import sys
+import time
+import random
+import argparse
+
+os.environ.setdefault("DPX_ITEM_TREE", "1")
+
+from dearpygui import _dearpygui
+from dearpypixl.core import tree
+
+
+def _build(item_count: int, /, fanout: int = 8, depth: int = 8) -> list[int]:
+    items = []
+    stack = []
+    while len(items) < item_count:
+        if not stack:
+            stack.append((_dearpygui.add_window(), 0))
+            items.append(stack[-1][0])
+            continue
+
+        parent, level = stack[-1]
+        children = tree.get_item_info(parent)["children"][1]
+        if len(children) >= fanout:
+            stack.pop()
+        elif level < depth and len(children) % 2 == 0:
+            stack.append((_dearpygui.add_group(parent=parent), level + 1))
+            items.append(stack[-1][0])
+        else:
+            items.append(_dearpygui.add_button(parent=parent))
+    return items
+
+
+def _walk_parents(item, /, *, __func=_dearpygui.get_item_info):
+    parents = []
+    while (parent := __func(item)["parent"]) is not None:
+        parents.append(parent)
+        item = parent
+    return parents
+
+
+def _walk_index(item, /, *, __func=_dearpygui.get_item_info):
+    info = __func(item)
+    return __func(info["parent"])["children"][info["target"]].index(item)
+
+
+def _tree_parents(item, /, *, __func=tree.get_item_info):
+    parents = []
+    while (parent := __func(item)["parent"]) is not None:
+        parents.append(parent)
+        item = parent
+    return parents
+
+
+def _tree_index(item, /, *, __func=tree.get_item_position):
+    return __func(item)[2]
+
+
+def _time(func, items, /) -> float:
+    t0 = time.perf_counter()
+    for item in items:
+        func(item)
+    return time.perf_counter() - t0
+
+
+def main(argv: list[str] | None = None, /) -> None:
+    parser = argparse.ArgumentParser(prog="python -m dearpypixl.bench.tree", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, default=50_000, help="number of items to create (default: 50000)")
+    parser.add_argument("--samples", type=int, default=10_000, help="number of items to query (default: 10000)")
+    args = parser.parse_args(argv)
+
+    if not tree.ENABLED:
+        sys.exit("item tree is disabled (`DPX_ITEM_TREE` is unset or `DPX_NO_PATCH` is set)")
+
+    _dearpygui.create_context()
+    try:
+        t0 = time.perf_counter()
+        items = _build(args.items)
+        print(f"built {len(items)} items in {time.perf_counter() - t0:.3f}s")
+
+        samples = random.choices([i for i in items if tree.get_item_info(i)["parent"] is not None], k=args.samples)
+        assert all(_walk_parents(i) == _tree_parents(i) for i in samples)
+        assert all(_walk_index(i) == _tree_index(i) for i in samples)
+        errors = tree.check_consistency()
+        assert not errors, errors
+
+        print(f"{'query':<10}{'get_item_info':>16}{'tree':>12}{'speedup':>10}")
+        for name, walker, mirror in (
+            ("parents", _walk_parents, _tree_parents),
+            ("index", _walk_index, _tree_index),
+        ):
+            t_walk = _time(walker, samples)
+            t_tree = _time(mirror, samples)
+            print(
+                f"{name:<10}{t_walk / len(samples) * 1e6:>14.2f}us"
+                f"{t_tree / len(samples) * 1e6:>10.2f}us{t_walk / t_tree:>9.1f}x"
+            )
+    finally:
+        _dearpygui.destroy_context()
+
+
+if __name__ == "__main__":
+    main()
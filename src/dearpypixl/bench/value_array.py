@@ -0,0 +1,87 @@
+"""Measures common `ValueArray` operations on large arrays, with and
+without a value mirror and as a ring buffer.
+
+    - "registry": each operation reads child slot 1 from DearPyGui first,
+    as `ValueArray` did before it tracked its own children
+    - "children": the default; child slot 1 is tracked by the interface
+    - "mirror": as "children", with `mirror=True`
+    - "maxlen": as "children", with `maxlen` equal to the array's size;
+    appends create a new value item and delete the oldest one
+    - "ring": as "maxlen", with `ring=True`; appends overwrite the
+    oldest value item
+
+"index" looks up the last value in the array. No viewport is needed.
+
+Usage: `python -m dearpypixl.bench.value_array [--sizes N ...] [--ops N]`
+"""
+import time
+import argparse
+
+from dearpygui import dearpygui, _dearpygui
+
+from dearpypixl.interop import add_int_value_array
+
+
+def _registry_ops(array, /) -> dict:
+    def children():
+        return _dearpygui.get_item_info(array)["children"][1]
+
+    def append():
+        item = _dearpygui.add_int_value(parent=array)
+        _dearpygui.set_value(item, 0)
+        children()
+
+    return {
+        "append": append,
+        "len": lambda: len(children()),
+        "getitem": lambda: _dearpygui.get_value(children()[-1]),
+        "index": lambda: _dearpygui.get_values(children()).index(-1),
+    }
+
+
+def _array_ops(array, /) -> dict:
+    return {
+        "append": lambda: array.append(0),
+        "len": lambda: len(array),
+        "getitem": lambda: array[-1],
+        "index": lambda: array.index(-1),
+    }
+
+
+def main(argv: list[str] | None = None, /) -> None:
+    parser = argparse.ArgumentParser(prog="python -m dearpypixl.bench.value_array", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1_000, 10_000, 100_000], help="number of values in each array (default: 1000 10000 100000)")
+    parser.add_argument("--ops", type=int, default=100, help="number of calls per operation (default: 100)")
+    args = parser.parse_args(argv)
+
+    dearpygui.create_context()
+
+    names = ("append", "len", "getitem", "index")
+    print(f"{'array':<10}{'values':>8}" + "".join(f"{name:>12}" for name in names))
+    for size in args.sizes:
+        for name, mirror, ring in (
+            ("registry", False, False), ("children", False, False), ("mirror", True, False),
+            ("maxlen", False, False), ("ring", False, True),
+        ):
+            array = add_int_value_array([*range(size - 1), -1], mirror=mirror, ring=ring)
+            if name in ("maxlen", "ring"):
+                array.maxlen = size
+            ops = (_registry_ops if name == "registry" else _array_ops)(array)
+
+            row = f"{name:<10}{size:>8}"
+            for op in names:
+                func = ops[op]
+                t0 = time.perf_counter()
+                for _ in range(args.ops):
+                    func()
+                t = (time.perf_counter() - t0) / args.ops
+                row += f"{t * 1e6:>10.1f}us"
+            print(row)
+
+            _dearpygui.delete_item(array)
+
+    dearpygui.destroy_context()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Measures loading strings into an empty `StringValueArray`, one item at
+a time and in bulk.
+
+    - "per-item": each value item is created, updated, and announced on
+    its own, as `ValueArray.extend()` did before bulk operations
+    - "extend": `ValueArray.extend()`
+    - "slice": slice assignment (`array[:] = strings`)
+    - "events": as "extend", with a callback registered to the per-item
+    "on create" and "on update" events
+
+No viewport is needed.
+
+Usage: `python -m dearpypixl.bench.value_array_extend [--sizes N ...] [--runs N]`
+"""
+import time
+import argparse
+
+from dearpygui import dearpygui, _dearpygui
+
+from dearpypixl.interop import StringValueArray
+
+
+def _extend_per_item(array: StringValueArray, strings: list[str], /) -> None:
+    created_callback = array.on_value_create
+    updated_callback = array.on_value_update
+    with array.lock:
+        for s in strings:
+            item = array.create_value_item()
+            array._children.append(item)
+            created_callback(array, item)
+            array.update_value_item(item, s)
+            updated_callback(array, item, s)
+
+
+def _slice(array: StringValueArray, strings: list[str], /) -> None:
+    array[:] = strings
+
+
+def _extend_with_events(array: StringValueArray, strings: list[str], /) -> None:
+    array.on_value_create.append(lambda array, item: None)
+    array.on_value_update.append(lambda array, item, value: None)
+    array.extend(strings)
+
+
+def main(argv: list[str] | None = None, /) -> None:
+    parser = argparse.ArgumentParser(prog="python -m dearpypixl.bench.value_array_extend", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1_000, 10_000, 100_000], help="number of strings loaded (default: 1000 10000 100000)")
+    parser.add_argument("--runs", type=int, default=3, help="number of runs per benchmark; the fastest is reported (default: 3)")
+    args = parser.parse_args(argv)
+
+    dearpygui.create_context()
+
+    benchmarks = (
+        ("per-item", _extend_per_item),
+        ("extend", StringValueArray.extend),
+        ("slice", _slice),
+        ("events", _extend_with_events),
+    )
+    print(f"{'strings':<10}" + "".join(f"{name:>12}" for name, _ in benchmarks))
+    for size in args.sizes:
+        strings = [f"line {i}" for i in range(size)]
+        row = f"{size:<10}"
+        for _, func in benchmarks:
+            best = float("inf")
+            for _ in range(args.runs):
+                array = StringValueArray.create()
+                t0 = time.perf_counter()
+                func(array, strings)
+                best = min(best, time.perf_counter() - t0)
+                if array.value != strings:
+                    raise AssertionError(f"{func.__name__!r} loaded the wrong values")
+                _dearpygui.delete_item(array)
+            row += f"{best * 1e3:>10.1f}ms"
+        print(row)
+
+    dearpygui.destroy_context()
+
+
+if __name__ == "__main__":
+    main()
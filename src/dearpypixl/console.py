@@ -9,13 +9,16 @@ import collections
 
 from dearpypixl.core.protocols import Item, ItemCommand, ItemCallback
 from dearpypixl.core import appitem
+from dearpypixl.core import cache
 from dearpypixl.core import metautil
 from dearpypixl.core import management
+from dearpypixl.core import redraw
 from dearpypixl import color
 from dearpypixl import style
 import dearpypixl.lib.items as dearpypixl_items
 import dearpypixl.lib.functions as dearpypixl_funcs
 import dearpypixl.lib.constants as dearpypixl_consts
+from dearpygui import _dearpygui
 
 
 __all__ = ("PyRepl", "add_pyrepl")
@@ -378,6 +381,228 @@ class Console[U = typing.Any, P: appitem.ContainerItem = typing.Any](appitem.Com
         dearpypixl_funcs.delete_item(text_item, children_only=False, slot=-1)
 
 
+class VirtualConsole[U = typing.Any, P: appitem.ContainerItem = typing.Any](appitem.CompositeItem, dearpypixl_items.mvChildWindow[U, bool, P, typing.Any]):
+    """Renders lines of text like a :py:class:`Console`, but stores them
+    in a Python ring buffer instead of a `LogRegistry`.
+
+    Only enough text items to fill the visible region exist. Every frame
+    the console is visible, they are positioned at and rebound to the lines
+    under the current scroll position (see :py:meth:`refresh()`). Beyond the
+    lines themselves, memory use does not grow with the length of the
+    history; with *max_len* set, the oldest lines are discarded to make
+    room for new ones.
+
+    Each write is one or more lines; strings are split on newlines, and a
+    trailing newline is ignored. Lines are not wrapped, and must be rendered
+    with the same height (*line_height*, measured from the first text item
+    if `None`).
+    """
+
+    auto_scroll: bool
+    line_height: int | None
+    line_spacing: int
+
+    _lock: threading.Lock
+    # ring buffer of lines; `_head` is the index of the oldest line once
+    # `_max_len` lines are stored
+    _lines: list[str]
+    _head: int
+    _version: int
+    _scroll_to_end: bool
+    _spacer: int
+    _pool: list[int]
+    _rendered: tuple | None
+
+    @classmethod
+    def create(
+        cls,
+        default_value: typing.Sequence[str] | str = '',
+        max_len: int | None = None,
+        /, *,
+        auto_scroll: bool = True,
+        line_height: int | None = None,
+        line_spacing: int = 4,
+        tag: int | str = 0,
+        user_data: U | None = None,
+        **kwargs
+    ) -> typing.Self:
+        self = super().create(user_data={"user_data": user_data, }, tag=tag, **kwargs)
+        self.auto_scroll = auto_scroll
+        self.line_height = line_height
+        self.line_spacing = line_spacing
+
+        self._lock = threading.Lock()
+        self._lines = []
+        self._head = 0
+        self._version = 0
+        self._scroll_to_end = False
+        self._pool = []
+        self._rendered = None
+        self.max_len = max_len
+
+        # The spacer sets the height of the scrollable region; lines are
+        # drawn over it. Child windows don't support visibility handlers,
+        # but the group around the spacer is visible whenever the console
+        # is.
+        with dearpypixl_items.item_handler_registry() as handlers:
+            dearpypixl_items.add_item_visible_handler(callback=self.refresh)
+
+        with dearpypixl_items.group(parent=self) as group:
+            self._spacer = int(dearpypixl_items.add_spacer(height=0))
+
+        group.handlers = handlers
+        self.components = (handlers,)
+
+        if default_value:
+            if isinstance(default_value, str):
+                self.write(default_value)
+            else:
+                self.writelines(default_value)
+
+        return self
+
+    _max_len = None
+
+    @property
+    def max_len(self) -> int | None:
+        return self._max_len
+    @max_len.setter
+    def max_len(self, value: int | None):
+        if value is not None and value < 0:
+            raise ValueError("`max_len` cannot be less than zero.")
+        with self._lock:
+            lines = self._ordered()
+            if value is not None:
+                lines = lines[max(len(lines) - value, 0):] if value else []
+            self._lines = lines
+            self._head = 0
+            self._max_len = value
+            self._version += 1
+        redraw.mark()
+    @max_len.deleter
+    def max_len(self, /) -> None:
+        self.max_len = None
+
+    @property
+    def lines(self, /) -> list[str]:
+        """[***get***] the stored lines, oldest first."""
+        with self._lock:
+            return self._ordered()
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __str__(self) -> str:
+        return '\n'.join(self.lines)
+
+    def write(self, s: str, /) -> None:
+        lines = s.split('\n')
+        if len(lines) > 1 and not lines[-1]:
+            lines.pop()
+        self._push(lines)
+
+    def writelines(self, s: typing.Iterable[str], /) -> None:
+        lines = []
+        for text in s:
+            text = text.split('\n')
+            if len(text) > 1 and not text[-1]:
+                text.pop()
+            lines.extend(text)
+        self._push(lines)
+
+    def flush(self) -> None:
+        pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lines = []
+            self._head = 0
+            self._version += 1
+        redraw.mark()
+
+    def _ordered(self, /) -> list[str]:
+        lines = self._lines
+        head = self._head
+        return lines[head:] + lines[:head]
+
+    def _push(self, lines: list[str], /) -> None:
+        with self._lock:
+            buffer  = self._lines
+            max_len = self._max_len
+
+            if max_len is None:
+                buffer.extend(lines)
+            elif len(lines) >= max_len:
+                self._lines = lines[len(lines) - max_len:] if max_len else []
+                self._head = 0
+            else:
+                free = max_len - len(buffer)
+                buffer.extend(lines[:free])
+                head = self._head
+                for line in lines[free:]:
+                    buffer[head] = line
+                    head = (head + 1) % max_len
+                self._head = head
+
+            self._version += 1
+            if self.auto_scroll:
+                self._scroll_to_end = True
+
+        redraw.mark()
+
+    def refresh(self, /) -> None:
+        """Position the console's text items over the lines in view and
+        update their text. Called every frame the console is visible, but
+        only updates items when the scroll position, the size of the
+        console, or its lines have changed.
+        """
+        get_state = _dearpygui.get_item_state
+        state  = get_state(self)
+        view_h = state["rect_size"][1]
+        scroll = state["scroll_pos"][1]
+        x, y   = get_state(self._spacer)["pos"]
+
+        pool   = self._pool
+        line_h = self.line_height or (pool and get_state(pool[0])["rect_size"][1]) or 13
+        pitch  = line_h + self.line_spacing
+
+        with self._lock:
+            n_lines   = len(self._lines)
+            content_h = n_lines * pitch
+            to_end    = self._scroll_to_end
+            self._scroll_to_end = False
+            if to_end:
+                scroll = max(content_h + y * 2 - view_h, 0)
+
+            first = min(max(int((scroll - y) // pitch), 0), n_lines)
+            rows  = int(view_h // pitch) + 2
+            key   = (first, rows, self._version, x, y, pitch)
+            if key == self._rendered:
+                return
+            self._rendered = key
+
+            lines  = self._lines
+            head   = self._head
+            n_view = min(rows, n_lines - first)
+            view   = [lines[(head + i) % n_lines] for i in range(first, first + n_view)]
+
+        set_value = _dearpygui.set_value
+        with cache.batch():
+            while len(pool) < rows:
+                pool.append(int(dearpypixl_items.add_text('', parent=self, pos=(x, y), show=False)))
+
+            for i, item in enumerate(pool):
+                if i < n_view:
+                    set_value(item, view[i])
+                    cache.configure_item(item, pos=(x, int(y + (first + i) * pitch)), show=True)
+                else:
+                    cache.configure_item(item, show=False)
+            cache.configure_item(self._spacer, height=int(content_h))
+
+        if to_end:
+            self.y_scroll_pos = -1.0
+
+
 
 
 # [ PyRepl ]
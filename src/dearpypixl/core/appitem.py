@@ -2,8 +2,11 @@ import typing
 
 from dearpygui import _dearpygui
 
+from . import cache
 from . import interface
 from . import management
+from . import redraw
+from . import tree
 from .errors import DearPyGuiError
 
 
@@ -95,7 +98,7 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
         __int=int,
         __alloc=_dearpygui.generate_uuid,
         __set_item_alias=_dearpygui.add_alias,
-        __get_item_uuid=_dearpygui.get_alias_id,
+        __get_item_uuid=cache.get_alias_id,
     ):
         if __isinstance(tag, __int):
             return __int_new(cls, tag or __alloc())
@@ -111,7 +114,7 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
     def __repr__(self, /):
         uuid = self.real
         try:
-            alias = _dearpygui.get_item_alias(uuid)
+            alias = cache.get_item_alias(uuid)
         except SystemError:
             alias = ''
         try:
@@ -135,7 +138,7 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
 
     __hash__ = __int__
 
-    def __eq__(self, other, /, *, __func=_dearpygui.get_item_alias):
+    def __eq__(self, other, /, *, __func=cache.get_item_alias):
         return (
             (self.real == other) or
             (alias == other if (alias:=__func(self.real)) else False)
@@ -146,6 +149,7 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
         raise NotImplementedError
 
     def destroy(self, /) -> None:
+        cache.invalidate(self)
         try:
             _dearpygui.delete_item(self, children_only=False, slot=-1)
         except SystemError:
@@ -153,6 +157,7 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
         return
 
     def delete(self, /, *, children_only: bool = False, slot: int = -1):
+        cache.invalidate(self)
         try:
             if not children_only:
                 return _dearpygui.delete_item(self, children_only=False, slot=-1)
@@ -184,14 +189,14 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
     @property
     def alias(self):
         try:
-            return _dearpygui.get_item_alias(self)
+            return cache.get_item_alias(self)
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
     @alias.setter
     def alias(self, value, /):
         try:
             if value is None:
-                alias = _dearpygui.get_item_alias(self)
+                alias = cache.get_item_alias(self)
                 if alias is not None:
                     _dearpygui.remove_alias(alias)
             else:
@@ -201,7 +206,7 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
     @alias.deleter
     def alias(self):
         try:
-            _dearpygui.remove_alias(_dearpygui.get_item_alias(self))
+            _dearpygui.remove_alias(cache.get_item_alias(self))
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
 
@@ -212,60 +217,61 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
     @value.setter
-    def value(self, value, /, *, __func=_dearpygui.set_value):
+    def value(self, value, /, *, __func=_dearpygui.set_value, __mark_dirty=redraw.mark):
         try:
             __func(self, value)
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
+        __mark_dirty()
 
     # configuration
 
     @property
-    def label(self, /, *, __func=_dearpygui.get_item_configuration):
+    def label(self, /, *, __func=cache.get_item_configuration):
         try:
             return __func(self)["label"]
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
     @label.setter
-    def label(self, value, /, __func=_dearpygui.configure_item):
+    def label(self, value, /, __func=cache.configure_item):
         try:
             __func(self, label=value)
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
     @label.deleter
-    def label(self, /, __func=_dearpygui.configure_item):
+    def label(self, /, __func=cache.configure_item):
         try:
             __func(self, label=None)
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def use_internal_label(self, /, *, __func=_dearpygui.get_item_configuration):
+    def use_internal_label(self, /, *, __func=cache.get_item_configuration):
         try:
             return __func(self)["use_internal_label"]
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
     @use_internal_label.setter
-    def use_internal_label(self, value, /, __func=_dearpygui.configure_item):
+    def use_internal_label(self, value, /, __func=cache.configure_item):
         try:
             __func(self, use_internal_label=value)
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def user_data(self, /, *, __func=_dearpygui.get_item_configuration):
+    def user_data(self, /, *, __func=cache.get_item_configuration):
         try:
             return __func(self)["user_data"]
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
     @user_data.setter
-    def user_data(self, value, /, __func=_dearpygui.configure_item):
+    def user_data(self, value, /, __func=cache.configure_item):
         try:
             __func(self, user_data=value)
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
     @user_data.deleter
-    def user_data(self, /, __func=_dearpygui.configure_item):
+    def user_data(self, /, __func=cache.configure_item):
         try:
             __func(self, user_data=None)
         except SystemError as e:
@@ -273,7 +279,7 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
 
     def configure(self, **kwargs):
         try:
-            _dearpygui.configure_item(self, **kwargs)
+            cache.configure_item(self, **kwargs)
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
 
@@ -283,12 +289,15 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
 
+    def batch(self, /):
+        return cache.batch()
+
     # information
 
     @staticmethod
     def _create_bound_info_property(type_key: int | str, field_key: str, setter, /) -> property:
 
-        def fget(self, /, __type_key=type_key, __field_key=field_key, __func=_dearpygui.get_item_info, __int_new=int.__new__, __registry=_ITEM_REGISTRY):
+        def fget(self, /, __type_key=type_key, __field_key=field_key, __func=cache.get_item_info, __int_new=int.__new__, __registry=_ITEM_REGISTRY):
             try:
                 item = __func(self)[__field_key]
             except KeyError:
@@ -299,14 +308,16 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
                 return None
             return __int_new(__registry[__type_key], item)
 
-        def fset(self, value, /, __func=setter):
+        def fset(self, value, /, __func=setter, __invalidate=cache.invalidate):
             try:
+                __invalidate(self)
                 __func(self, value or 0)
             except SystemError as e:
                 raise DearPyGuiError.from_exception(e)
 
-        def fdel(self, /, __func=setter):
+        def fdel(self, /, __func=setter, __invalidate=cache.invalidate):
             try:
+                __invalidate(self)
                 __func(self, 0)
             except SystemError as e:
                 raise DearPyGuiError.from_exception(e)
@@ -322,7 +333,7 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
     del _create_bound_info_property
 
     @property
-    def parent(self, /, *, __func=_dearpygui.get_item_info, __int_new=int.__new__, __registry=_ITEM_REGISTRY):
+    def parent(self, /, *, __func=tree.get_item_info, __int_new=int.__new__, __registry=_ITEM_REGISTRY):
         try:
             item = __func(self)["parent"]
 
@@ -341,7 +352,7 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
         return __int_new(item_type, item)
 
     @property
-    def parents(self, /, *, __func=_dearpygui.get_item_info, __int_new=int.__new__, __registry=_ITEM_REGISTRY):
+    def parents(self, /, *, __func=tree.get_item_info, __int_new=int.__new__, __registry=_ITEM_REGISTRY):
         parents = []
 
         item_uuid = self
@@ -370,7 +381,7 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
         return parents
 
     @property
-    def root_parent(self, /, *, __func=_dearpygui.get_item_info, __int_new=int.__new__, __registry=_ITEM_REGISTRY):
+    def root_parent(self, /, *, __func=tree.get_item_info, __int_new=int.__new__, __registry=_ITEM_REGISTRY):
         item_uuid = self
         type_name = ''
 
@@ -406,7 +417,7 @@ class AppItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](in
     # state
 
     @property
-    def pos(self, /, *, __func=_dearpygui.get_item_state):
+    def pos(self, /, *, __func=cache.get_item_state):
         try:
             return __func(self)["pos"]
         except SystemError as e:
@@ -446,12 +457,15 @@ class ChildItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.Any](
     __hash__ = AppItem.__hash__
 
     def move(self, *, parent=0, before=0, __func=_dearpygui.move_item):
+        cache.invalidate(self)
         __func(self, parent=parent, before=before)
 
     def move_up(self, /, *, __func=_dearpygui.move_item_up):
+        cache.invalidate(self)
         __func(self)
 
     def move_down(self, /, *, __func=_dearpygui.move_item_down):
+        cache.invalidate(self)
         __func(self)
 
     def unstage(self, /): pass
@@ -492,38 +506,26 @@ class ContainerItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.A
         else:
             __func(children, children_only=False, slot=-1)
 
-    def index(self, item, /, slot = None):
-        if isinstance(item, str):
-            tag = _dearpygui.get_alias_id(item)
-        else:
-            tag = item
-
-        child_slots = _dearpygui.get_item_info(self)["children"]
-
+    def index(self, item, /, slot = None, *, __func=tree.get_item_position):
         if slot is not None:
             if -5 < slot < 4:
                 slot %= 4
             else:
                 raise IndexError("slot index out of range")
 
-            try:
-                return child_slots[slot].index(tag)
-            except ValueError:
-                raise ValueError(f"item {item!r} not in child slot {slot!r}") from None
-
-        slot0, slot1, slot2, slot3 = child_slots.values()
-        if tag in slot1:
-            return slot1.index(tag)
-        if tag in slot0:
-            return slot0.index(tag)
-        if tag in slot2:
-            return slot2.index(tag)
-        if tag in slot3:
-            return slot3.index(tag)
-
-        raise ValueError(f"item {item!r} is not a child of {self!r}")
-
-    def insert(self, index, item, /, slot=None, *, __get_info=_dearpygui.get_item_info, __move_item=_dearpygui.move_item) -> None:
+        try:
+            parent, target, index = __func(item)
+        except (SystemError, ValueError):
+            parent = target = index = None
+
+        if parent == self.real:
+            if slot is None or slot == target:
+                return index
+        elif slot is None:
+            raise ValueError(f"item {item!r} is not a child of {self!r}")
+        raise ValueError(f"item {item!r} not in child slot {slot!r}")
+
+    def insert(self, index, item, /, slot=None, *, __get_info=tree.get_item_info, __get_children=tree.get_item_children, __move_item=_dearpygui.move_item) -> None:
         if slot is not None:
             if -5 < slot < 4:
                 slot_index = slot % 4
@@ -532,7 +534,8 @@ class ContainerItem[U = typing.Any, V = typing.Any, P = typing.Any, C = typing.A
         else:
             slot_index = __get_info(item)["target"]
 
-        child_slot = __get_info(self)["children"][slot_index]
+        child_slot = __get_children(self, slot_index)
+        cache.invalidate(item)
         __move_item(item, parent=self, before=child_slot[index])
 
     def reorder(self, /, slot=None, new_order=None, *, __func=_dearpygui.reorder_items):
@@ -613,7 +616,7 @@ class CompositeItem:
         # uses the item type's name
         uuid = self.real
         try:
-            alias = _dearpygui.get_item_alias(uuid)
+            alias = cache.get_item_alias(uuid)
         except SystemError:
             alias = ''
         try:
@@ -669,6 +672,7 @@ class SupportsValueArray[T]:
             _dearpygui.set_value(self, value)
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
+        redraw.mark()
 
     def __len__(self, /) -> int:
         value = self.get_value()
@@ -752,16 +756,16 @@ class _ElementItem[U = typing.Any, P = typing.Any](SupportsValueArray, ChildItem
     __hash__ = AppItem.__hash__
 
     @property
-    def category(self, /) -> int:
+    def category(self, /, *, __func=cache.get_item_configuration) -> int:
         try:
-            return _dearpygui.get_item_configuration(self)["category"]
+            return __func(self)["category"]
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def target(self, /) -> int:
+    def target(self, /, *, __func=cache.get_item_configuration) -> int:
         try:
-            return _dearpygui.get_item_configuration(self)["target"]
+            return __func(self)["target"]
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
 
@@ -867,32 +871,32 @@ class _HandlerItem[U = typing.Any, P = typing.Any](ChildItem):
     __hash__ = AppItem.__hash__
 
     @property
-    def callback(self, /, *, __func=_dearpygui.get_item_configuration):
+    def callback(self, /, *, __func=cache.get_item_configuration):
         try:
             return __func(self)["callback"]
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
     @callback.setter
-    def callback(self, value, /, *, __func=_dearpygui.configure_item) -> None:
+    def callback(self, value, /, *, __func=cache.configure_item) -> None:
         try:
             __func(self, callback=value)
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
     @callback.deleter
-    def callback(self, /, *, __func=_dearpygui.configure_item):
+    def callback(self, /, *, __func=cache.configure_item):
         try:
             __func(self, callback=None)
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def show(self, /, *, __func=_dearpygui.get_item_configuration) -> bool:
+    def show(self, /, *, __func=cache.get_item_configuration) -> bool:
         try:
             return __func(self)["show"]
         except SystemError as e:
             raise DearPyGuiError.from_exception(e)
     @show.setter
-    def show(self, value, /, *, __func=_dearpygui.configure_item) -> None:
+    def show(self, value, /, *, __func=cache.configure_item) -> None:
         try:
             __func(self, show=value)
         except SystemError as e:
@@ -6,6 +6,7 @@ from dearpypixl.core.protocols import Item
 from dearpypixl.core.protocols import ItemCallback
 from dearpypixl.core.protocols import Array
 from dearpypixl.core.interface import Interface
+from dearpypixl.core.cache import batch
 from dearpypixl.lib.items import mvStage
 from dearpypixl.lib.items import mvTheme
 from dearpypixl.lib.items import mvThemeColor
@@ -240,6 +241,20 @@ class AppItem[U = Any, V = Any, P: ContainerItem[Any, Any, Any, Any] | None = An
 
         :raises `SystemError`: DearPyGui-related error.
         """
+    def batch(self, /) -> batch:
+        """Return a context manager that defers updates made via
+        :py:meth:`configure()` and property setters in the current
+        thread. On exit, the updates are merged and applied with one
+        `dearpygui.configure_item()` call per item while DearPyGui's
+        mutex is held.
+
+        Updates to *any* item are deferred, not only the associated
+        item's. Reads made within the context do not reflect deferred
+        updates. Same as `dearpypixl.batch()`.
+
+        :raises `DearPyGuiError`: An update failed for an existing item
+            on exit.
+        """
     def information(self, /) -> _ItemInfoDict:
         """Return various information of the associated item.
 
@@ -0,0 +1,358 @@
+"""Internal module containing caches for DearPyGui item queries
+and writes.
+
+When the `DPX_ITEM_READ_CACHE` environment variable is set, the
+`get_item_configuration`, `get_item_state` and `get_item_info` functions
+exposed here cache their results per item for the duration of a frame.
+Otherwise, they are the same functions found in `_dearpygui` and add no
+overhead. Interface types bind these (instead of the `_dearpygui` versions)
+as defaults for properties that read a single key from the returned dict.
+
+Writes made through DearPyPixl interfaces (`AppItem.configure()`, property
+setters, etc) invalidate the cached results of the item written to.
+`dearpygui.configure_item()` is also patched to do the same. Writes made by
+calling `_dearpygui` directly are visible starting on the next frame.
+
+Writes made through interfaces can also be buffered and merged per item
+within a :py:func:`batch()` context.
+
+Unless the `DPX_NO_ALIAS_CACHE` environment variable is set, alias/UUID
+lookups made via :py:func:`get_alias_id` and :py:func:`get_item_alias` are
+cached in both directions. `add_alias`, `remove_alias`, `set_item_alias`
+and context creation/destruction are patched in `_dearpygui` to clear the
+cache. `delete_item` is patched to drop the cached aliases of deleted items.
+"""
+import typing
+import threading
+
+from dearpygui import dearpygui, _dearpygui
+
+from . import management
+from . import redraw
+from .errors import DearPyGuiError
+
+
+__all__ = ()
+
+
+
+
+_DPX_ITEM_READ_CACHE = management.register_environ(
+    "DPX_ITEM_READ_CACHE",
+    "When set, the results of `get_item_configuration`, `get_item_state`, and "
+    "`get_item_info` requested by DearPyPixl interfaces are cached per-item "
+    "until the frame count advances or the item is updated via DearPyPixl.",
+    bool,
+    False,
+)
+
+
+_DPX_NO_ALIAS_CACHE = management.register_environ(
+    "DPX_NO_ALIAS_CACHE",
+    "When set, DearPyPixl interfaces do not cache alias/UUID lookups.",
+    bool,
+    False,
+)
+
+
+if not (_DPX_NO_ALIAS_CACHE or management._DPX_NO_PATCH):
+    # Both are keyed and valued by UUIDs as `int`. Every cached alias is
+    # also in `_item_aliases`, which `_delete_item` evicts by UUID.
+    _alias_ids: dict[str, int] = {}
+    _item_aliases: dict[int, str | None] = {}
+
+    def get_alias_id(alias: str, /, *, __cache=_alias_ids, __func=_dearpygui.get_alias_id) -> int:
+        """Return the UUID of the item that *alias* is assigned to, or
+        `0` if unassigned."""
+        try:
+            return __cache[alias]
+        except KeyError:
+            pass
+        uuid = __func(alias)
+        if uuid:
+            __cache[alias] = uuid
+            _item_aliases[uuid] = alias
+        return uuid
+
+    def get_item_alias(item, /, *, __cache=_item_aliases, __func=_dearpygui.get_item_alias, __exists=_dearpygui.does_item_exist, __int=int, __str=str) -> str | None:
+        """Return the alias assigned to *item*, or `None` if it has no
+        alias or does not exist."""
+        try:
+            return __cache[item]
+        except KeyError:
+            pass
+        if isinstance(item, __str):
+            uuid = get_alias_id(item)
+            return item if uuid else __func(item)
+        alias = __func(item)
+        # aliases of pending items resolve once they're created
+        if alias is not None or __exists(item):
+            uuid = __int(item)
+            __cache[uuid] = alias
+            if alias:
+                _alias_ids[alias] = uuid
+        return alias
+
+    def clear_alias_cache() -> None:
+        """Clear all cached alias/UUID lookups."""
+        _alias_ids.clear()
+        _item_aliases.clear()
+
+    def _patch_alias_command(func, /) -> None:
+        def command(*args, __func=func, __clear=clear_alias_cache, **kwargs):
+            try:
+                return __func(*args, **kwargs)
+            finally:
+                __clear()
+
+        management.patch(func, command)
+
+    for _func in (
+        _dearpygui.add_alias,
+        _dearpygui.remove_alias,
+        _dearpygui.set_item_alias,
+        _dearpygui.create_context,
+        _dearpygui.destroy_context,
+    ):
+        _patch_alias_command(_func)
+    del _func
+
+    def _get_subtree(item, children_only: bool, slot: int, /, *, __get_info=_dearpygui.get_item_info) -> list[int]:
+        uuid = get_alias_id(item) if isinstance(item, str) else int(item)
+        if not children_only:
+            stack = [uuid]
+        elif slot < 0:
+            stack = [child for children in __get_info(uuid)["children"].values() for child in children]
+        else:
+            stack = [*__get_info(uuid)["children"][slot]]
+        subtree = []
+        while stack:
+            uuid = stack.pop()
+            subtree.append(uuid)
+            for children in __get_info(uuid)["children"].values():
+                stack.extend(children)
+        return subtree
+
+    def _delete_item(item, /, *, __func=_dearpygui.delete_item, __cache=_item_aliases, **kwargs):
+        # Deleting an item removes the aliases of the item and its descendants.
+        # Only the entries of the deleted subtree are dropped, so that
+        # delete-heavy code (e.g. `ValueArray` truncation) neither leaves the
+        # cache cold nor pays for its size.
+        if not __cache:
+            return __func(item, **kwargs)
+        try:
+            subtree = _get_subtree(item, kwargs.get("children_only", False), kwargs.get("slot", -1))
+        except Exception:  # the command raises
+            subtree = None
+        try:
+            return __func(item, **kwargs)
+        finally:
+            if subtree is None:
+                clear_alias_cache()
+            else:
+                for uuid in subtree:
+                    alias = __cache.pop(uuid, None)
+                    if alias:
+                        _alias_ids.pop(alias, None)
+
+    management.patch(_dearpygui.delete_item, _delete_item)
+
+else:
+    get_alias_id = _dearpygui.get_alias_id
+    get_item_alias = _dearpygui.get_item_alias
+
+    def clear_alias_cache() -> None:
+        """Clear all cached alias/UUID lookups."""
+        return
+
+
+class FrameCache:
+    """Wraps a DearPyGui item query function, caching its result for
+    each item queried. All results are discarded once the frame count
+    advances.
+
+    Results are shared between callers and must not be mutated.
+    """
+    __slots__ = ("func", "frame", "hits", "misses", "_results")
+
+    def __init__(self, func: typing.Callable[[typing.Any], dict], /) -> None:
+        self.func    = func
+        self.frame   = -1
+        self.hits    = 0
+        self.misses  = 0
+        self._results = {}
+
+    def __repr__(self, /) -> str:
+        return f"{type(self).__name__}({self.func.__name__}, frame={self.frame}, hits={self.hits}, misses={self.misses})"
+
+    def __call__(self, item, /, *, __get_frame_count=_dearpygui.get_frame_count, __get_alias_id=get_alias_id, __str=str):
+        results = self._results
+
+        frame = __get_frame_count()
+        if frame != self.frame:
+            results.clear()
+            self.frame = frame
+
+        key = __get_alias_id(item) if item.__class__ is __str else item
+        try:
+            result = results[key]
+        except KeyError:
+            result = results[key] = self.func(item)
+            self.misses += 1
+            return result
+
+        self.hits += 1
+        return result
+
+    def discard(self, item, /, *, __get_alias_id=get_alias_id, __str=str) -> None:
+        """Remove the cached result for *item*, if any."""
+        self._results.pop(__get_alias_id(item) if item.__class__ is __str else item, None)
+
+    def clear(self, /) -> None:
+        """Remove all cached results."""
+        self._results.clear()
+
+    def reset(self, /) -> None:
+        """Remove all cached results and zero the hit/miss counters."""
+        self._results.clear()
+        self.hits = self.misses = 0
+
+
+if _DPX_ITEM_READ_CACHE:
+    get_item_configuration = FrameCache(_dearpygui.get_item_configuration)
+    get_item_state = FrameCache(_dearpygui.get_item_state)
+    get_item_info = FrameCache(_dearpygui.get_item_info)
+
+    _CACHES = {
+        "configuration": get_item_configuration,
+        "state": get_item_state,
+        "info": get_item_info,
+    }
+
+    def invalidate(item: typing.Any = 0, /) -> None:
+        """Remove all cached results for *item*, or for all items
+        when *item* is null."""
+        if item:
+            get_item_configuration.discard(item)
+            get_item_state.discard(item)
+            get_item_info.discard(item)
+        else:
+            get_item_configuration.clear()
+            get_item_state.clear()
+            get_item_info.clear()
+
+    def _configure_item(item, /, *, __func=_dearpygui.configure_item, __discard_config=get_item_configuration.discard, __discard_state=get_item_state.discard, **kwargs) -> None:
+        __discard_config(item)
+        __discard_state(item)
+        __func(item, **kwargs)
+
+    @management.patch(dearpygui.configure_item)
+    def _patched_configure_item(item, **kwargs) -> None:
+        _configure_item(item, **kwargs)
+
+else:
+    get_item_configuration = _dearpygui.get_item_configuration
+    get_item_state = _dearpygui.get_item_state
+    get_item_info = _dearpygui.get_item_info
+
+    _CACHES = {}
+
+    def invalidate(item: typing.Any = 0, /) -> None:
+        """Remove all cached results for *item*, or for all items
+        when *item* is null."""
+        return
+
+    _configure_item = _dearpygui.configure_item
+
+
+class _BatchState(threading.local):
+    writes: dict[typing.Any, dict[str, typing.Any]] | None = None
+
+
+_batch_state = _BatchState()
+
+
+def configure_item(item, /, *, __func=_configure_item, __state=_batch_state, __mark_dirty=redraw.mark, **kwargs) -> None:
+    """Update the configuration of *item*. Within a :py:func:`batch()`
+    context, the update is deferred and merged with other updates to
+    *item* made in the same context.
+    """
+    writes = __state.writes
+    if writes is None:
+        __func(item, **kwargs)
+        __mark_dirty()
+    elif item in writes:
+        writes[item].update(kwargs)
+    else:
+        writes[item] = kwargs
+
+
+class batch:
+    """Context manager that buffers writes made via :py:func:`configure_item`
+    (used by `AppItem.configure()` and interface property setters) in the
+    current thread. On exit, buffered writes are flushed as a single
+    `configure_item()` call per item while holding DearPyGui's mutex.
+
+    Nested contexts are merged into the outermost one. Reads made within
+    the context do not reflect buffered writes. Writes to items that no
+    longer exist when flushed are dropped; these items are available via
+    the :py:attr:`dropped` attribute after exiting the context.
+
+    :raises `DearPyGuiError`: A buffered write failed for an existing
+        item. All other buffered writes are still flushed.
+    """
+    __slots__ = ("dropped", "_writes")
+
+    def __init__(self, /) -> None:
+        self.dropped = []
+        self._writes = None
+
+    def __enter__(self, /, *, __state=_batch_state) -> typing.Self:
+        if __state.writes is None:
+            self._writes = __state.writes = {}
+        return self
+
+    def __exit__(self, exc_type=None, exc_value=None, traceback=None, /, *, __state=_batch_state) -> None:
+        writes = self._writes
+        if writes is None:  # nested
+            return
+        self._writes = __state.writes = None
+        if writes:
+            self.flush(writes)
+
+    def flush(self, writes: dict[typing.Any, dict[str, typing.Any]], /, *, __func=_configure_item, __exists=_dearpygui.does_item_exist) -> None:
+        dropped = self.dropped
+        error   = None
+
+        _dearpygui.lock_mutex()
+        try:
+            for item, kwargs in writes.items():
+                try:
+                    __func(item, **kwargs)
+                except SystemError as e:
+                    if __exists(item):
+                        error = error or e
+                    else:
+                        dropped.append(item)
+        finally:
+            _dearpygui.unlock_mutex()
+            redraw.mark()
+
+        if error is not None:
+            raise DearPyGuiError.from_exception(error)
+
+
+def read_cache_info() -> dict[str, dict[str, int]]:
+    """Return the frame number and hit/miss counters of each item
+    query cache. The result is empty when caching is disabled.
+    """
+    return {
+        name:{"frame": cache.frame, "hits": cache.hits, "misses": cache.misses}
+        for name, cache in _CACHES.items()
+    }
+
+
+def reset_read_cache() -> None:
+    """Clear all item query caches and zero their counters."""
+    for cache in _CACHES.values():
+        cache.reset()
@@ -0,0 +1,229 @@
+"""Internal module containing the dispatcher that runs jobs from
+DearPyGui's callback queue under manual callback management.
+
+`dearpygui.run_callbacks()` is patched (in `lib/viewport.py`) to hand
+jobs to :py:data:`dispatcher`. Each callback is called with as many of
+the *sender*, *app_data* and *user_data* job arguments as it accepts,
+like DearPyGui's implementation. The number of arguments is looked up
+once per callback and cached for as long as the callback is alive; the
+cache holds no reference to the callback itself.
+
+When the `DPX_COALESCE_CALLBACKS` environment variable is set (or the
+dispatcher's :py:attr:`~CallbackDispatcher.coalesce` attribute is set),
+jobs queued for the same callback and sender within one drain are
+merged. Only the latest is run, in its own place in the queue. This is
+useful for high-frequency sources such as slider drags, where only the
+most recent *app_data* is of interest.
+
+Callbacks declared with `async def` are not awaited by the dispatcher.
+The coroutine they return is handed to the dispatcher's
+:py:attr:`~CallbackDispatcher.coroutine_handler` (set by `Runtime` when
+it drives an asyncio event loop). `RuntimeError` is raised when no
+handler is set.
+"""
+import time
+import typing
+import functools
+import inspect
+import weakref
+
+from . import cache
+from . import management
+from . import metautil
+
+
+__all__ = ()
+
+
+
+
+_DPX_COALESCE_CALLBACKS = management.register_environ(
+    "DPX_COALESCE_CALLBACKS",
+    "When set, jobs queued for the same callback and sender under manual "
+    "callback management are merged per `run_callbacks()` call, and only "
+    "the latest job is run.",
+    bool,
+    False,
+)
+
+
+type Job = typing.Sequence[typing.Any]  # (callback, sender, app_data, user_data)
+
+
+def _get_native_arity(callback: typing.Callable, /) -> int:
+    try:
+        parameters = inspect.signature(callback).parameters.values()
+    except (ValueError, TypeError):
+        # no signature available; pass every argument, like DearPyGui
+        return -1
+    arity = 0
+    for parameter in parameters:
+        if parameter.kind is parameter.VAR_POSITIONAL:
+            return -1
+        if parameter.kind is parameter.POSITIONAL_ONLY or parameter.kind is parameter.POSITIONAL_OR_KEYWORD:
+            arity += 1
+    return arity
+
+
+type _Caller = typing.Callable[[typing.Callable, typing.Any, typing.Any, typing.Any], typing.Any]
+
+
+def _call_0(callback, sender, app_data, user_data, /):
+    return callback()
+
+def _call_1(callback, sender, app_data, user_data, /):
+    return callback(sender)
+
+def _call_2(callback, sender, app_data, user_data, /):
+    return callback(sender, app_data)
+
+def _call_3(callback, sender, app_data, user_data, /):
+    return callback(sender, app_data, user_data)
+
+_CALLERS: tuple[_Caller, ...] = (_call_0, _call_1, _call_2, _call_3)
+
+
+def _get_arity(callback: typing.Callable, /) -> int:
+    try:
+        arity = metautil.get_positional_arity(callback)
+    except ValueError:  # native callables
+        arity = _get_native_arity(callback)
+    return 3 if arity < 0 or arity >= 3 else arity
+
+
+def _create_coroutine_caller(caller: _Caller, dispatcher: CallbackDispatcher, /) -> _Caller:
+    def coroutine_caller(callback, sender, app_data, user_data, /, *, __caller=caller, __dispatcher=dispatcher):
+        __dispatcher.run_coroutine(__caller(callback, sender, app_data, user_data))
+    return coroutine_caller
+
+
+class CallbackDispatcher:
+    """Runs jobs returned by `get_callback_queue()`. Calling the
+    dispatcher drains a queue.
+
+    The :py:attr:`jobs`, :py:attr:`coalesced` and :py:attr:`time`
+    attributes report the number of jobs run, the number of jobs
+    merged away, and the time (in seconds) taken by the most recent
+    drain. :py:attr:`drains` is the number of drains since creation
+    or the last :py:meth:`reset()`.
+
+    :py:attr:`coroutine_handler` receives the coroutines returned by
+    `async def` callbacks, e.g. `loop.create_task`.
+
+    :py:attr:`executors` maps sender UUIDs to functions that run their
+    jobs elsewhere (e.g. in a thread pool). These functions receive the
+    job's callback, *sender*, *app_data* and *user_data*.
+    """
+    __slots__ = ("coalesce", "coroutine_handler", "executors", "drains", "jobs", "coalesced", "time", "_callers", "_coroutine_callers")
+
+    def __init__(self, /, *, coalesce: bool = False) -> None:
+        self.coalesce  = coalesce
+        self.coroutine_handler: typing.Callable[[typing.Coroutine], typing.Any] | None = None
+        self.executors: dict[typing.Any, typing.Callable[[typing.Callable, typing.Any, typing.Any, typing.Any], typing.Any]] = {}
+        self.drains    = 0
+        self.jobs      = 0
+        self.coalesced = 0
+        self.time      = 0.0
+        # weakly keyed by callback (see `metautil.get_positional_arity`);
+        # values must not reference the callback or it is never collected
+        self._callers: dict[weakref.ref, _Caller] = {}
+        self._coroutine_callers = tuple(_create_coroutine_caller(caller, self) for caller in _CALLERS)
+
+    def __repr__(self, /) -> str:
+        return (
+            f"{type(self).__name__}(coalesce={self.coalesce}, drains={self.drains}, "
+            f"jobs={self.jobs}, coalesced={self.coalesced}, time={self.time:.6f})"
+        )
+
+    def __call__(self, jobs: typing.Sequence[Job] | None, /, *, __timer=time.perf_counter, __get_alias_id=cache.get_alias_id, __str=str) -> None:
+        t0 = __timer()
+        self.drains += 1
+        self.jobs = self.coalesced = 0
+        if not jobs:
+            self.time = __timer() - t0
+            return
+
+        if self.coalesce and len(jobs) > 1:
+            latest = {}
+            coalesced = 0
+            for job in reversed(jobs):
+                if job[0] is None:
+                    continue
+                key = (id(job[0]), job[1])
+                if key in latest:
+                    coalesced += 1
+                else:
+                    latest[key] = job
+            self.coalesced = coalesced
+            jobs = list(latest.values())
+            jobs.reverse()
+
+        callers = self._callers
+        get_caller = self._get_caller
+        executors = self.executors
+        count = 0
+        try:
+            for callback, sender, app_data, user_data in jobs:
+                if callback is None:
+                    continue
+                count += 1
+                if executors and (submit := executors.get(__get_alias_id(sender) if sender.__class__ is __str else sender)) is not None:
+                    submit(callback, sender, app_data, user_data)
+                    continue
+                try:
+                    caller = callers[weakref.ref(callback)]
+                except (KeyError, TypeError):
+                    caller = get_caller(callback)
+                caller(callback, sender, app_data, user_data)
+        finally:
+            self.jobs = count
+            self.time = __timer() - t0
+
+    def get_invoker(self, callback: typing.Callable, /) -> typing.Callable[[typing.Any, typing.Any, typing.Any], typing.Any]:
+        """Return a callable that accepts the *sender*, *app_data* and
+        *user_data* job arguments and calls *callback* with as many as
+        it accepts."""
+        return functools.partial(self._get_caller(callback), callback)
+
+    def _get_caller(self, callback: typing.Callable, /) -> _Caller:
+        callers = self._callers
+        try:
+            return callers[weakref.ref(callback)]
+        except KeyError:
+            ref = weakref.ref(callback, self._discard)
+        except TypeError:  # not hashable or weak-referenceable
+            ref = None
+
+        if inspect.iscoroutinefunction(callback):
+            caller = self._coroutine_callers[_get_arity(callback)]
+        else:
+            caller = _CALLERS[_get_arity(callback)]
+        if ref is not None:
+            callers[ref] = caller
+        return caller
+
+    def run_coroutine(self, coroutine: typing.Coroutine, /) -> typing.Any:
+        """Pass *coroutine* to :py:attr:`coroutine_handler`.
+
+        :raises `RuntimeError`: No handler is set. *coroutine* is closed.
+        """
+        handler = self.coroutine_handler
+        if handler is None:
+            coroutine.close()
+            raise RuntimeError(
+                f"cannot run {coroutine.__qualname__!r} of an `async def` callback, "
+                "no coroutine handler is set (attach an event loop to a running "
+                "`Runtime`)"
+            )
+        return handler(coroutine)
+
+    def _discard(self, ref: weakref.ref, /) -> None:
+        self._callers.pop(ref, None)
+
+    def reset(self, /) -> None:
+        """Zero the dispatcher's counters."""
+        self.drains = self.jobs = self.coalesced = 0
+        self.time = 0.0
+
+
+dispatcher = CallbackDispatcher(coalesce=_DPX_COALESCE_CALLBACKS)
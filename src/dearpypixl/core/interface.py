@@ -10,6 +10,25 @@ __all__ = ("Interface",)
 
 
 
+class _ItemRegistry(dict):
+    """Maps item type names (e.g. `"mvAppItemType::mvButton"`) and
+    item type identifiers to interface types. Types missing from the
+    registry are requested from *loader* (if set), which registers
+    and returns the type or raises `KeyError`.
+    """
+    __slots__ = ("loader",)
+
+    def __init__(self, /) -> None:
+        super().__init__()
+        self.loader: typing.Callable[[typing.Any], typing.Any] | None = None
+
+    def __missing__(self, key, /) -> typing.Any:
+        loader = self.loader
+        if loader is None:
+            raise KeyError(key)
+        return loader(key)
+
+
 # XXX: should be a protocol/abc, but it's not to make it easier
 # to write metaclasses
 class Interface:
@@ -45,7 +64,7 @@ class Interface:
 
     # registry is defined here so it's available to `Application` &
     # `Viewport` without fuss
-    __item_registry__: typing.ClassVar[dict[typing.Any, typing.Any]] = {}
+    __item_registry__: typing.ClassVar[dict[typing.Any, typing.Any]] = _ItemRegistry()
 
     def __repr__(self, /) -> str:
         return f"{self.__class__.__name__}(tag={self.tag!r})"
@@ -2,6 +2,7 @@
 or extending interface types."""
 import sys
 import types
+import weakref
 import threading
 import collections.abc
 
@@ -9,6 +10,8 @@ import typing
 if typing.TYPE_CHECKING:
     from dearpypixl.core.protocols import ItemCallback
 
+from . import cache
+
 
 __all__ = ()
 
@@ -166,26 +169,36 @@ def create_compitem_prop_delegate[T: property](child_path: str, source_prop: T,
     :param source_prop: The `property` object to unwrap.
     """
     if source_prop.fget:
-        def getter(self, /, *, __PATH=child_path, __FUNC=source_prop.fget):
-            return __FUNC(f"{self.tag}/{__PATH}")  # type: ignore
+        def getter(self, /, *, __PATH=child_path, __FUNC=source_prop.fget, __RESOLVE=cache.get_alias_id):
+            alias = f"{self.tag}/{__PATH}"
+            return __FUNC(__RESOLVE(alias) or alias)  # type: ignore
     else:
         getter = None
 
     if source_prop.fset is not None:
-        def setter(self, value, /, *, __PATH=child_path, __FUNC=source_prop.fset):
-            __FUNC(f"{self.tag}/{__PATH}", value)  # type: ignore
+        def setter(self, value, /, *, __PATH=child_path, __FUNC=source_prop.fset, __RESOLVE=cache.get_alias_id):
+            alias = f"{self.tag}/{__PATH}"
+            __FUNC(__RESOLVE(alias) or alias, value)  # type: ignore
     else:
         setter = None
 
     if source_prop.fdel:
-        def deleter(self, /, *, __PATH=child_path, __FUNC=source_prop.fdel):
-            return __FUNC(f"{self.tag}/{__PATH}")  # type: ignore
+        def deleter(self, /, *, __PATH=child_path, __FUNC=source_prop.fdel, __RESOLVE=cache.get_alias_id):
+            alias = f"{self.tag}/{__PATH}"
+            return __FUNC(__RESOLVE(alias) or alias)  # type: ignore
     else:
         deleter = None
 
     return type(source_prop)(getter, setter, deleter, source_prop.__doc__)
 
 
+# weakly keyed by callable (like `WeakKeyDictionary`, but without its
+# per-lookup method overhead)
+_ARITY_CACHE: dict[weakref.ref, int] = {}
+
+def _discard_arity(ref: weakref.ref, /, *, __cache=_ARITY_CACHE) -> None:
+    __cache.pop(ref, None)
+
 def get_positional_arity(func: typing.Callable, /) -> int:
     """Return the number of positional arguments accepted by a callable.
     `-1` is returned for callables that accept an arbitrary number of
@@ -196,7 +209,34 @@ def get_positional_arity(func: typing.Callable, /) -> int:
     indirectly on its `__call__` member. Does not work for native C
     functions, however, a special exception is made for `print()` which
     returns `-1`.
+
+    Results for callables other than functions are cached per callable
+    for as long as it is alive. Bound methods share the result of their
+    underlying function.
     """
+    # NOTE: globals are used instead of bound defaults here; keyword-only
+    # defaults are looked up by name on every call
+
+    bound = 0
+    if func.__class__ is types.MethodType:
+        func  = func.__func__  # type: ignore
+        bound = 1
+
+    if func.__class__ is types.FunctionType:
+        # reading the code object is cheaper than a cache lookup
+        code = func.__code__  # type: ignore
+        return -1 if code.co_flags & 0x04 else code.co_argcount - bound
+
+    try:
+        arity = _ARITY_CACHE[weakref.ref(func)]
+    except KeyError:
+        arity = _ARITY_CACHE[weakref.ref(func, _discard_arity)] = _get_positional_arity(func)
+    except TypeError:  # not hashable or weak-referenceable
+        arity = _get_positional_arity(func)
+
+    return arity if arity < 0 else arity - bound
+
+def _get_positional_arity(func: typing.Callable, /) -> int:
     code = getattr(func, "__code__", None)
     if code is None:
         try:
@@ -251,7 +291,33 @@ class _CallbackDelegate[T: ItemCallback](typing.Protocol):
     def __wrapped__(self, /) -> T: ...
     def __call__(self, sender: int | str, app_data: typing.Any, user_data: typing.Any, /) -> None: ...
 
-def create_callback_delegate[T: ItemCallback](func: T, /) -> _CallbackDelegate[T]:
+_DELEGATE_TEMPLATES: dict[int, types.CodeType] = {}
+
+def _get_delegate_template(arity: int, /) -> types.CodeType:
+    try:
+        return _DELEGATE_TEMPLATES[arity]
+    except KeyError:
+        pass
+
+    match arity:
+        case 0: body = "return _callback()"
+        case 1: body = "return _callback(sender)"
+        case 2: body = "return _callback(sender, app_data)"
+        case _: body = "return _callback(sender, app_data, user_data)"
+
+    # the delegate's defaults are set per-callback, so one template
+    # (closing over `_callback`) serves every callback of an arity
+    template = create_function(
+        "callback_delegate",
+        ("sender", "app_data", "user_data", "/"),
+        body,
+        __name__,
+        locals={"_callback": None},
+    )
+    code = _DELEGATE_TEMPLATES[arity] = template.__code__
+    return code
+
+def create_callback_delegate[T: ItemCallback](func: T, /, *, __new_function=types.FunctionType, __new_cell=types.CellType) -> _CallbackDelegate[T]:
     """Create a DearPyGui callback wrapper with a consistent
     signature. The wrapper accepts the three positional
     arguments sent to DearPyGui callbacks: *sender*, *app_data*,
@@ -265,42 +331,35 @@ def create_callback_delegate[T: ItemCallback](func: T, /) -> _CallbackDelegate[T
     The original, unwrapped callable can be accessed via the
     wrapper's `__wrapped__` attribute of the wrapper.
     """
-    lcls: dict = {"_callback": func}
-
-    match arity := get_positional_arity(func):
-        case 0: body = "_callback()"
-        case 1: body = "_callback(sender)"
-        case 2: body = "_callback(sender, app_data)"
-        case _:
-            body = "_callback(sender, app_data, user_data)"
-            arity = 3
+    arity = get_positional_arity(func)
+    if not 0 <= arity <= 2:
+        arity = 3
 
     if arity and (defaults := get_positional_defaults(func)):
         # Use the callable defaults as our defaults. When the callable's
         # arity (0-3) differs from the delegate's (always 3), ensure the
         # delegate's trailing arguments also have defaults.
-        count  = len(defaults)
+        count  = min(len(defaults), arity)
         istart = arity - count
-        istop  = istart + count
+        istop  = arity
 
         tmp = [0, None, None]
-        tmp[istart:istop] = defaults[:]
+        tmp[istart:istop] = defaults[len(defaults) - count:]
         defaults = tmp
         defaults[istop:] = (0, None, None)[istop:]
-
-        args = ["sender", "app_data", "user_data"]
-        for i in range(istart, 3):
-            var = f"_default{i}"
-
-            lcls[var] = defaults[i]
-            args[i]   = f"{args[i]}={var}"
-
-        args.append('/')
+        defaults = tuple(defaults[istart:])
     else:
-        args = ("sender", "app_data", "user_data", "/")
-
-    wrapper = create_function("callback_delegate", args, body, __name__, locals=lcls)
-    wrapper.__wrapped__ = func  # type: ignore
+        defaults = None
+
+    wrapper = __new_function(
+        _get_delegate_template(arity),
+        globals(),
+        "callback_delegate",
+        defaults,
+        (__new_cell(func),),
+    )
+    wrapper.__qualname__ = "callback_delegate"
+    wrapper.__wrapped__  = func  # type: ignore
 
     return wrapper  # type: ignore
 
@@ -0,0 +1,36 @@
+"""Internal module tracking whether the UI has changed since it was
+last rendered.
+
+DearPyPixl's write paths (`AppItem.configure()`, configuration and
+value property setters, `ValueArray` mutators, etc) call :py:func:`mark()`.
+A `Runtime` rendering on demand calls :py:func:`consume()` to decide
+whether a frame needs to be rendered. Writes made by calling DearPyGui
+directly are not tracked.
+"""
+__all__ = ()
+
+
+
+
+class _State:
+    __slots__ = ("dirty",)
+
+    def __init__(self, /) -> None:
+        self.dirty = True
+
+
+_state = _State()
+
+
+def mark(*args, __state=_state) -> None:
+    """Flag the UI as changed. Accepts and ignores any arguments so that
+    it can be used as a callback."""
+    __state.dirty = True
+
+
+def consume(*, __state=_state) -> bool:
+    """Return `True` if the UI was flagged as changed since the last
+    call, and clear the flag."""
+    dirty = __state.dirty
+    __state.dirty = False
+    return dirty
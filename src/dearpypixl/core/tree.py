@@ -0,0 +1,439 @@
+"""Internal module containing an optional Python-side mirror of
+DearPyGui's item hierarchy.
+
+When the `DPX_ITEM_TREE` environment variable is set, DearPyGui's item
+commands (`add_*`, `draw_*`) and the functions that restructure the
+hierarchy (`delete_item`, `move_item`, `move_item_up`, `move_item_down`,
+`reorder_items`, etc) are patched in `_dearpygui` to keep the mirror in
+sync. The :py:func:`get_item_info`, :py:func:`get_item_children` and
+:py:func:`get_item_position` functions exposed here then answer parent,
+child slot, index and type queries without calling into DearPyGui.
+Otherwise, they query DearPyGui directly.
+
+Items that were not created through a patched command (e.g. items
+created before this module was imported) are mirrored on first query.
+Should the mirror fail to track a change, the affected entries are
+dropped and lazily re-mirrored.
+
+Setting the variable to `2` also verifies the mirror against DearPyGui
+after every tracked change, raising `AssertionError` on mismatch. This
+is slow and intended for debugging only.
+"""
+import typing
+import threading
+
+from dearpygui import _dearpygui
+
+from . import cache
+from . import management
+
+
+__all__ = ()
+
+
+
+
+_DPX_ITEM_TREE = management.register_environ(
+    "DPX_ITEM_TREE",
+    "When set, DearPyPixl maintains a mirror of DearPyGui's item hierarchy so "
+    "parent, index and ancestry queries avoid `get_item_info`. Set to `2` to "
+    "verify the mirror after every change (slow).",
+    int,
+    0,
+)
+
+ENABLED = bool(_DPX_ITEM_TREE) and not management._DPX_NO_PATCH
+
+_VERIFY = ENABLED and _DPX_ITEM_TREE > 1
+
+
+class _Node:
+    """Mirrors the hierarchy-related portion of the dict returned from
+    `get_item_info()` for an item. Supports the `"parent"`, `"type"`,
+    `"target"` and `"children"` keys directly; other keys are forwarded
+    to DearPyGui.
+    """
+    __slots__ = ("uuid", "parent", "target", "type", "children", "_indexes")
+
+    def __init__(self, uuid: int, info: dict[str, typing.Any], /) -> None:
+        self.uuid     = uuid
+        self.parent   = _get_parent(info)
+        self.target   = info["target"]
+        self.type     = info["type"]
+        self.children = [*info["children"].values()]
+        self._indexes = [None, None, None, None]
+
+    def __repr__(self, /) -> str:
+        return f"{type(self).__name__}(uuid={self.uuid}, parent={self.parent}, target={self.target}, type={self.type!r})"
+
+    def __getitem__(self, key: str, /) -> typing.Any:
+        match key:
+            case "parent":
+                return self.parent
+            case "type":
+                return self.type
+            case "target":
+                return self.target
+            case "children":
+                slot0, slot1, slot2, slot3 = self.children
+                return {0: slot0.copy(), 1: slot1.copy(), 2: slot2.copy(), 3: slot3.copy()}
+        return _dearpygui.get_item_info(self.uuid)[key]
+
+    def index(self, slot: int, uuid: int, /) -> int:
+        indexes = self._indexes[slot]
+        if indexes is None:
+            indexes = self._indexes[slot] = {child:i for i, child in enumerate(self.children[slot])}
+        return indexes[uuid]
+
+
+def _get_parent(info: dict[str, typing.Any], /, *, __get_alias_id=cache.get_alias_id) -> int | None:
+    # DearPyGui reports the alias of parents created with one
+    parent = info["parent"]
+    if parent.__class__ is str:
+        return __get_alias_id(parent)
+    return parent
+
+
+_nodes: dict[int, _Node] = {}
+
+# Guards the mirror only. It is never held while calling into DearPyGui,
+# since callers may already hold DearPyGui's mutex (`lock_mutex()`).
+_lock = threading.RLock()
+
+
+def _to_uuid(item, /, *, __get_alias_id=cache.get_alias_id, __int=int, __str=str) -> int:
+    if item.__class__ is __int:
+        return item
+    if isinstance(item, __str):
+        return __get_alias_id(item)
+    return item.real
+
+
+def _get_node(item, /, *, __nodes=_nodes, __func=_dearpygui.get_item_info) -> _Node:
+    uuid = _to_uuid(item)
+    try:
+        return __nodes[uuid]
+    except KeyError:
+        pass
+    node = _Node(uuid, __func(uuid))
+    with _lock:
+        return __nodes.setdefault(uuid, node)
+
+
+def _discard_subtree(uuid: int, /, *, __nodes=_nodes) -> None:
+    stack = [uuid]
+    while stack:
+        node = __nodes.pop(stack.pop(), None)
+        if node is not None:
+            for slot in node.children:
+                stack.extend(slot)
+
+
+def _unlink(node: _Node, /, *, __nodes=_nodes) -> None:
+    parent = __nodes.get(node.parent)  # type: ignore
+    if parent is not None:
+        parent.children[node.target].remove(node.uuid)
+        parent._indexes[node.target] = None
+
+
+def _link(node: _Node, before: int = 0, /, *, __nodes=_nodes) -> None:
+    parent = __nodes.get(node.parent)  # type: ignore
+    if parent is None:
+        return
+
+    target   = node.target
+    siblings = parent.children[target]
+    if node.uuid in siblings:  # mirrored after the change
+        return
+    if before:
+        siblings.insert(siblings.index(before), node.uuid)
+        parent._indexes[target] = None
+    else:
+        indexes = parent._indexes[target]
+        if indexes is not None:
+            indexes[node.uuid] = len(siblings)
+        siblings.append(node.uuid)
+
+
+def _refresh(uuid: int | None, /, *, __nodes=_nodes, __func=_dearpygui.get_item_info) -> None:
+    node = __nodes.get(uuid)  # type: ignore
+    if node is not None:
+        children = [*__func(node.uuid)["children"].values()]
+        with _lock:
+            node.children = children
+            node._indexes = [None, None, None, None]
+
+
+def _verify(*items) -> None:
+    errors = check_consistency(*items)
+    if errors:
+        raise AssertionError("item tree out of sync:\n  " + "\n  ".join(errors))
+
+
+def check_consistency(*items) -> list[str]:
+    """Compare mirrored items against DearPyGui, returning a list of
+    mismatches found. Only *items* (and their parents) are checked
+    when provided, otherwise all mirrored items are checked.
+    """
+    errors = []
+    if items:
+        uuids = set()
+        for item in items:
+            node = _nodes.get(_to_uuid(item))
+            if node is not None:
+                uuids.add(node.uuid)
+                if node.parent is not None:
+                    uuids.add(node.parent)
+    else:
+        with _lock:
+            uuids = set(_nodes)
+
+    for uuid in uuids:
+        node = _nodes.get(uuid)
+        if node is None:
+            continue
+        try:
+            info = _dearpygui.get_item_info(uuid)
+        except Exception:
+            errors.append(f"{uuid}: mirrored but does not exist")
+            continue
+        info["parent"] = _get_parent(info)
+        with _lock:
+            for key in ("parent", "target", "type"):
+                if node[key] != info[key]:
+                    errors.append(f"{uuid}: {key!r} is {node[key]!r}, expected {info[key]!r}")
+            for slot, children in info["children"].items():
+                if node.children[slot] != children:
+                    errors.append(f"{uuid}: slot {slot} is {node.children[slot]!r}, expected {children!r}")
+    return errors
+
+
+def clear() -> None:
+    """Drop all mirrored items. They are re-mirrored on query."""
+    with _lock:
+        _nodes.clear()
+
+
+if ENABLED:
+    def get_item_info(item, /) -> typing.Any:
+        """Return a dict-like object containing the parent, child slot
+        (target), type and children of *item*.
+
+        :raises `SystemError`: DearPyGui-related error.
+        """
+        return _get_node(item)
+
+    def get_item_position(item, /) -> tuple[int | None, int, int]:
+        node   = _get_node(item)
+        parent = node.parent
+        if parent is None:
+            return (None, -1, -1)
+        parent_node = _get_node(parent)
+        with _lock:
+            try:
+                return (parent, node.target, parent_node.index(node.target, node.uuid))
+            except KeyError:  # out of sync -- re-mirror the parent
+                if _nodes.get(parent) is parent_node:
+                    del _nodes[parent]
+        parent_node = _get_node(parent)
+        with _lock:
+            return (parent, node.target, parent_node.index(node.target, node.uuid))
+
+    def get_item_children(item, slot: int, /) -> list[int]:
+        node = _get_node(item)
+        with _lock:
+            return node.children[slot].copy()
+
+    # [ patches ]
+
+    def _on_create(item, before=0, /, *, __nodes=_nodes, __func=_dearpygui.get_item_info) -> None:
+        if item.__class__ is str:  # created with an alias
+            item = cache.get_alias_id(item)
+        elif item.__class__ is not int:
+            return
+        try:
+            node   = _Node(item, __func(item))
+            before = _to_uuid(before) if before else 0
+            with _lock:
+                __nodes[item] = node
+                _link(node, before)
+        except Exception:
+            clear()
+            raise
+        if _VERIFY:
+            _verify(item)
+
+    def _patch_create_command(func, /) -> None:
+        def command(*args, __func=func, __on_create=_on_create, **kwargs):
+            item = __func(*args, **kwargs)
+            __on_create(item, kwargs.get("before", 0))
+            return item
+
+        management.patch(func, command)
+
+    for _name, _func in tuple(_dearpygui.__dict__.items()):
+        if _name.startswith(("add_", "draw_")) and _name != "add_alias" and callable(_func):
+            _patch_create_command(_func)
+    del _name, _func
+
+    @management.patch(_dearpygui.delete_item)
+    def _delete_item(item, /, *args, __func=_dearpygui.delete_item, **kwargs):
+        children_only = kwargs.get("children_only", args[0] if args else False)
+        slot = kwargs.get("slot", args[1] if len(args) > 1 else -1)
+
+        try:
+            node = _get_node(item)
+        except Exception:  # the command raises
+            node = None
+
+        result = __func(item, *args, **kwargs)
+
+        if node is not None:
+            with _lock:
+                try:
+                    if not children_only:
+                        _unlink(node)
+                        _discard_subtree(node.uuid)
+                    else:
+                        for i in (range(4) if slot < 0 else (slot,)):
+                            for child in node.children[i]:
+                                _discard_subtree(child)
+                            node.children[i].clear()
+                            node._indexes[i] = None
+                except Exception:
+                    _nodes.clear()
+                    raise
+
+        if _VERIFY and node is not None and node.uuid in _nodes:
+            _verify(node.uuid)
+        return result
+
+    @management.patch(_dearpygui.move_item)
+    def _move_item(item, /, *args, __func=_dearpygui.move_item, __get_info=_dearpygui.get_item_info, __exists=_dearpygui.does_item_exist, **kwargs):
+        before = kwargs.get("before", args[1] if len(args) > 1 else 0)
+
+        try:
+            node = _get_node(item)
+        except Exception:  # the command raises
+            node = None
+
+        try:
+            result = __func(item, *args, **kwargs)
+        except BaseException:
+            # DearPyGui may have detached or destroyed the item
+            if node is not None:
+                info = __get_info(node.uuid) if __exists(node.uuid) else None
+                with _lock:
+                    _unlink(node)
+                    if info is None:
+                        _discard_subtree(node.uuid)
+                    else:
+                        node.parent = _get_parent(info)
+                        node.target = info["target"]
+                if info is not None:
+                    _refresh(node.parent)
+            raise
+
+        if node is not None:
+            try:
+                info   = __get_info(node.uuid)
+                parent = _get_parent(info)
+                before = _to_uuid(before) if before else 0
+                with _lock:
+                    _unlink(node)
+                    node.parent = parent
+                    node.target = info["target"]
+                    _link(node, before)
+            except Exception:
+                clear()
+                raise
+
+        if _VERIFY and node is not None:
+            _verify(node.uuid)
+        return result
+
+    def _patch_move_sibling_command(func, offset, /) -> None:
+        def command(item, /, *args, __func=func, __offset=offset, **kwargs):
+            try:
+                node = _get_node(item)
+            except Exception:
+                node = None
+
+            result = __func(item, *args, **kwargs)
+
+            if node is not None:
+                with _lock:
+                    parent = _nodes.get(node.parent)  # type: ignore
+                    if parent is not None:
+                        siblings = parent.children[node.target]
+                        i = siblings.index(node.uuid)
+                        j = i + __offset
+                        if 0 <= j < len(siblings):
+                            siblings[i], siblings[j] = siblings[j], siblings[i]
+                            parent._indexes[node.target] = None
+
+            if _VERIFY and node is not None:
+                _verify(node.uuid)
+            return result
+
+        management.patch(func, command)
+
+    _patch_move_sibling_command(_dearpygui.move_item_up, -1)
+    _patch_move_sibling_command(_dearpygui.move_item_down, 1)
+
+    @management.patch(_dearpygui.reorder_items)
+    def _reorder_items(container, *args, __func=_dearpygui.reorder_items, **kwargs):
+        result = __func(container, *args, **kwargs)
+        _refresh(_to_uuid(container))
+        if _VERIFY:
+            _verify(container)
+        return result
+
+    def _patch_reset_command(func, /) -> None:
+        def command(*args, __func=func, **kwargs):
+            result = __func(*args, **kwargs)
+            clear()
+            return result
+
+        management.patch(func, command)
+
+    for _func in (
+        _dearpygui.unstage,
+        _dearpygui.set_item_children,
+        _dearpygui.create_context,
+        _dearpygui.destroy_context,
+    ):
+        _patch_reset_command(_func)
+    del _func
+
+else:
+    get_item_info = cache.get_item_info
+
+    def get_item_children(item, slot: int, /, *, __func=_dearpygui.get_item_info) -> list[int]:
+        return __func(item)["children"][slot]
+
+    def get_item_position(item, /, *, __func=_dearpygui.get_item_info, __get_alias_id=cache.get_alias_id) -> tuple[int | None, int, int]:
+        if isinstance(item, str):
+            item = __get_alias_id(item)
+
+        info = __func(item)
+
+        parent = _get_parent(info)
+        if parent is None:
+            return (None, -1, -1)
+
+        target = info["target"]
+        return (parent, target, __func(parent)["children"][target].index(item))
+
+
+get_item_children.__doc__ = """Return a list of child items in *item*'s child *slot*. Unlike
+`get_item_info()`, the result is never cached per frame.
+
+:raises `SystemError`: DearPyGui-related error.
+"""
+
+get_item_position.__doc__ = """Return the parent, child slot and index of *item* as a 3-tuple.
+Returns `(None, -1, -1)` for root items.
+
+:raises `SystemError`: DearPyGui-related error.
+"""
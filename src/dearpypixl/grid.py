@@ -1,15 +1,17 @@
 import typing
+import itertools
 import threading
 import dataclasses
 from array import array
 
 from dearpygui import dearpygui, _dearpygui
 
+from dearpypixl.core import cache
 from dearpypixl.core import management
 from dearpypixl.core import metautil
 
 
-__all__ = ("ItemData", "Slot", "Axis", "Grid")
+__all__ = ("ItemData", "Slot", "Axis", "Grid", "LayoutScheduler")
 
 
 
@@ -21,6 +23,41 @@ NaN = float("nan")
 _MISSING = object()
 
 
+class _Changes:
+    # Incremented whenever a setting that affects slot geometry changes
+    # (on any grid). Grids compare it against the value seen when their
+    # slot states were last calculated.
+    __slots__ = ("count",)
+
+    def __init__(self, /) -> None:
+        self.count = 0
+
+
+_changes = _Changes()
+
+
+_numpy: typing.Any = _MISSING
+
+def _get_numpy() -> typing.Any:
+    # NumPy is optional; it is only used by the "array" solver
+    global _numpy
+    if _numpy is _MISSING:
+        try:
+            import numpy as _numpy
+        except ImportError:
+            _numpy = None
+    return _numpy
+
+
+class _FloatArray(array):
+    # setting arrays are mutable, e.g. `grid.padding[0] = 4`
+    __slots__ = ()
+
+    def __setitem__(self, index, value, /, *, __changes=_changes) -> None:
+        super().__setitem__(index, value)
+        __changes.count += 1
+
+
 
 
 # [ HELPER FUNCTIONS ]
@@ -52,11 +89,11 @@ def _to_float_arr(value: typing.Sequence[float] | float | None, length: int, def
 
     """
     if value is None or value != value:
-        return array('f', (default,) * length)  # pyright: ignore
+        return _FloatArray('f', (default,) * length)  # pyright: ignore
     if isinstance(value, (float, int)):
-        return array('f', (value,) * length)  # pyright: ignore
+        return _FloatArray('f', (value,) * length)  # pyright: ignore
 
-    arr = array('f', (default,) * length)
+    arr = _FloatArray('f', (default,) * length)
     try:
         for i in range(length):
             v = value[i]
@@ -113,9 +150,11 @@ def _min_number_property(name: str, floor: int | float = 0.0, default = None) ->
             f"  self._{name} = {floor}",
             f"else:",
             f"  self._{name} = type_(value)",
+            f"_changes.count += 1",
         ),
         (
             f"self._{name} = {default}",
+            f"_changes.count += 1",
         ),
         module=__name__,
         globals=globals(),
@@ -139,7 +178,8 @@ class ItemData:
     pos_coef   : tuple[float, float]
     rect_setter: _RectSetter
 
-    _out_of_bounds: bool = dataclasses.field(default=False, init=False, repr=False)
+    # last values passed to `rect_setter`
+    _rect: tuple[int, int, int, int, bool] | None = dataclasses.field(default=None, init=False, repr=False)
 
     def __hash__(self) -> int:
         return hash(self.item)
@@ -200,13 +240,15 @@ class Slot(_GridComponent):
 
 @dataclasses.dataclass(init=False)
 class Axis(_GridComponent, typing.Iterable[Slot], typing.Sized):
-    __slots__ = ('_slots', '_lock')
+    __slots__ = ('_slots', '_lock', '_state_key', '_buffers')
 
     length: int = property(lambda self: self.__len__(), lambda self, value: self.resize(value))  # type: ignore
 
     def __init__(self, length: int = 0, *, _lock=None, **kwargs) -> None:
         self._slots = list[Slot]()
         self._lock  = _lock or threading.Lock()
+        self._state_key = None  # managed by the parenting `Grid` during a draw event
+        self._buffers   = None  # ...by the "array" solver
         super().__init__(length=length, **kwargs)
 
     @property
@@ -259,6 +301,7 @@ class Axis(_GridComponent, typing.Iterable[Slot], typing.Sized):
         if n > 0:
             with self._lock:
                 self._slots.extend(Slot() for _ in range(n))
+                _changes.count += 1
                 return self
         return self.__isub__(abs(n))
 
@@ -280,6 +323,7 @@ class Axis(_GridComponent, typing.Iterable[Slot], typing.Sized):
         if n > 0:
             with self._lock:
                 del self._slots[-n:]
+                _changes.count += 1
                 return self
         return self.__iadd__(abs(n))
 
@@ -329,10 +373,12 @@ class Axis(_GridComponent, typing.Iterable[Slot], typing.Sized):
     def insert(self, index: typing.SupportsIndex, /):
         with self._lock:
             self._slots.insert(index, Slot())
+            _changes.count += 1
 
     def remove(self, index: typing.SupportsIndex = -1):
         with self._lock:
             self._slots.pop(index)
+            _changes.count += 1
 
     def __float__(self, /) -> float:
         return float(self.__len__())
@@ -405,12 +451,17 @@ class Grid(_GridComponent):
         rect_getter: _RectGetter | None = None,
         overlay: bool = False,
         show: bool = True,
+        solver: typing.Literal["python", "array"] = "python",
     ) -> None:
         self._lock        = threading.Lock()
         self._drawlayer   = 0
         self._item_data   = set[ItemData]()
         self._data_to_del = set[int | ItemData]()
+        self._pending     = set[ItemData]()  # pushed since the last draw
+        self._item_buffers = None  # "array" solver; reset when items are added/removed
         self._overlay     = Overlay(self)
+        self.rects_computed = 0
+        self.rects_written  = 0
         # the setters invoke `draw()`, so set the private vars here instead
         self._show         = show
         self._show_overlay = overlay
@@ -426,6 +477,7 @@ class Grid(_GridComponent):
         self.offsets     = offsets
         self.parent      = parent
         self.rect_getter = rect_getter
+        self.solver      = solver
 
     @property
     def cols(self, /) -> Axis:  # pyright: ignore[reportRedeclaration]
@@ -439,6 +491,7 @@ class Grid(_GridComponent):
         if isinstance(value, Axis):
             self._cols = value
             value._lock = self._lock
+            _changes.count += 1
         else:
             with self._lock:
                 self._cols.resize(value)
@@ -457,6 +510,7 @@ class Grid(_GridComponent):
         if isinstance(value, Axis):
             self._rows = value
             value._lock = self._lock
+            _changes.count += 1
         else:
             with self._lock:
                 self._rows.resize(value)
@@ -484,6 +538,7 @@ class Grid(_GridComponent):
         with self._lock:
             show = self._show = value
             self._overlay.show = show and self.overlay
+            self._invalidate()
 
             for item_data in self._item_data:
                 try:
@@ -515,6 +570,25 @@ class Grid(_GridComponent):
 
     overlay: bool = overlay  # type: ignore
 
+    SOLVERS = ("python", "array")
+
+    @property
+    def solver(self, /) -> typing.Literal["python", "array"]:  # pyright: ignore[reportRedeclaration]
+        try:
+            return self._solver
+        except AttributeError:
+            solver = self._solver = "python"
+            return solver
+    @solver.setter
+    def solver(self, value: typing.Literal["python", "array"], /) -> None:  # pyright: ignore[reportRedeclaration]
+        if value not in __class__.SOLVERS:
+            raise ValueError(f"expected 'python' or 'array' for `solver`, got {value!r}.")
+        with self._lock:
+            self._solver = value
+            self._invalidate()
+
+    solver: typing.Literal["python", "array"] = solver  # type: ignore
+
     def configure(self, **kwargs):
         missing = _MISSING
         super().configure(**{k:v for k,v in kwargs.items() if v is not missing})
@@ -532,6 +606,8 @@ class Grid(_GridComponent):
         with self._lock:
             self._data_to_del.discard(item)  # type: ignore
             self._item_data.discard(item)  # type: ignore
+            self._pending.discard(item)  # type: ignore
+            self._item_buffers = None
 
     def clear(self, /, *, __CONFIG_SETTER=_dearpygui.configure_item):
         with self._lock:
@@ -643,11 +719,14 @@ class Grid(_GridComponent):
             self._data_to_del.discard(item)
             self._item_data.discard(item)  # type: ignore
             self._item_data.add(item_data)
+            self._pending.discard(item)  # type: ignore
+            self._pending.add(item_data)
+            self._item_buffers = None
 
         return item
 
     @staticmethod
-    def _set_item_rect(item: Item, x_pos: int, y_pos: int, width: int, height: int, show: bool, /, *, __SETTER=_dearpygui.configure_item):
+    def _set_item_rect(item: Item, x_pos: int, y_pos: int, width: int, height: int, show: bool, /, *, __SETTER=cache.configure_item):
         __SETTER(item, width=width, height=height, pos=(x_pos, y_pos), show=show)
 
     def _get_parent_rect(self, /, *, __CONFIG_GETTER=_dearpygui.get_item_configuration, __STATE_GETTER=_dearpygui.get_item_state) -> tuple[int, int, int, int, bool]:
@@ -670,23 +749,58 @@ class Grid(_GridComponent):
         #   * updating the grid's settings
         #   * updating `self._item_data`
         #   * drawing the grid
-        self._item_data.difference_update(self._data_to_del)
-        self._data_to_del.clear()
+        if self._data_to_del:
+            self._item_data.difference_update(self._data_to_del)
+            self._pending.difference_update(self._data_to_del)
+            self._data_to_del.clear()
+            self._item_buffers = None
+
+    def _invalidate(self, /):
+        self._cols._state_key = self._rows._state_key = None
+        for item_data in self._item_data:
+            item_data._rect = None
+        self._pending.update(self._item_data)
+
+    def invalidate(self, /):
+        with self._lock:
+            self._invalidate()
 
     def draw(self, /):
         with self._lock:
             self._gc_item_data()
+            self.rects_computed = self.rects_written = 0
 
             _area_width, _area_height, area_x_pos, area_y_pos, area_visible = self._get_parent_rect()
 
             if self._show and area_visible:
+                if self._solver == "array":
+                    upd_slot_states = self._upd_slot_buffers
+                    upd_item_states = self._upd_item_buffers
+                else:
+                    upd_slot_states = self._upd_slot_states
+                    upd_item_states = self._upd_item_states
+
                 area_width = self.width or _area_width
-                self._upd_slot_states(self.cols, area_width, 0)
+                cols_changed = upd_slot_states(self.cols, area_width, 0)
 
                 area_height = self.height or _area_height
-                self._upd_slot_states(self.rows, area_height, 1)
+                rows_changed = upd_slot_states(self.rows, area_height, 1)
 
-                self._upd_item_states()
+                if cols_changed or rows_changed:
+                    items = self._item_data
+                else:
+                    # slot states are current; no need for the solver
+                    items = self._pending
+                    upd_item_states = self._upd_item_states
+
+                if items:
+                    # coalesce item updates into one mutex acquisition
+                    with cache.batch() as batch:
+                        upd_item_states(items)
+                    self._pending.clear()
+                    if batch.dropped:  # items deleted since last draw
+                        self._data_to_del.update(batch.dropped)
+                        self._gc_item_data()
 
                 area_x_max = area_x_pos + area_width
                 area_y_max = area_y_pos + area_height
@@ -698,7 +812,9 @@ class Grid(_GridComponent):
     __call__ = draw
     __code__ = (lambda: ...).__code__  # tell DPG we accept no arguments
 
-    def _upd_slot_states(self, axis: Axis, area_size: float, index_offset: typing.Literal[0, 1], /):
+    def _get_axis_settings(self, axis: Axis, area_size: float, index_offset: typing.Literal[0, 1], /) -> tuple[float, float, float, float, float]:
+        # Returns the area's leading offset, the axis' effective padding and
+        # spacing, and the size of one unit of slot weight.
         xy1_index = index_offset
         xy2_index = index_offset + 2
 
@@ -731,6 +847,18 @@ class Grid(_GridComponent):
 
         size_unit = (remaining_space / total_weight)
 
+        return area_c1_pad, axis_c1_pad, axis_c2_pad, axis_spacing, size_unit
+
+    def _upd_slot_states(self, axis: Axis, area_size: float, index_offset: typing.Literal[0, 1], /, *, __changes=_changes) -> bool:
+        # Returns `False` if the slot states are unchanged since they were
+        # last calculated (by this grid).
+        state_key = (id(self), index_offset, area_size, __changes.count, "python")
+        if axis._state_key == state_key:  # ty:ignore[unresolved-attribute]
+            return False
+        axis._state_key = state_key
+
+        area_c1_pad, axis_c1_pad, axis_c2_pad, axis_spacing, size_unit = self._get_axis_settings(axis, area_size, index_offset)
+
         alloc_size = 0.0
         for slot in axis._slots:
             state = slot._state
@@ -760,7 +888,54 @@ class Grid(_GridComponent):
 
             alloc_size += slot_size
 
-    def _upd_item_states(self, *, int=int, does_item_exist=dearpygui.does_item_exist, get_item_state=dearpygui.get_item_state):
+        return True
+
+    def _upd_slot_buffers(self, axis: Axis, area_size: float, index_offset: typing.Literal[0, 1], /, *, __changes=_changes, accumulate=itertools.accumulate) -> bool:
+        # Same as `_upd_slot_states`, but also stores the results in
+        # contiguous buffers for `_upd_item_buffers`. The operations (and
+        # their order) are identical, so are the results.
+        state_key = (id(self), index_offset, area_size, __changes.count, "array")
+        if axis._state_key == state_key:  # ty:ignore[unresolved-attribute]
+            return False
+        axis._state_key = state_key
+
+        area_c1_pad, axis_c1_pad, axis_c2_pad, axis_spacing, size_unit = self._get_axis_settings(axis, area_size, index_offset)
+
+        slots = axis._slots
+
+        spacings = [axis_spacing if (v := s._spacing) != v else v for s in slots]  # ty:ignore[unresolved-attribute]
+        c1_pads  = [axis_c1_pad if (v := s._padding[0]) != v else v for s in slots]  # ty:ignore[unresolved-attribute]
+        c2_pads  = [axis_c2_pad if (v := s._padding[1]) != v else v for s in slots]  # ty:ignore[unresolved-attribute]
+        sizes    = [s._size or (size_unit * s._weight) for s in slots]  # ty:ignore[unresolved-attribute]
+
+        # positions are the running total of the sizes of preceding slots
+        positions = array('d', [
+            alloc_size + area_c1_pad + (slot_spacing * 0.5)
+            for alloc_size, slot_spacing in zip(accumulate(sizes, initial=0.0), spacings)
+        ])
+        content_sizes = array('d', [
+            0.0 if (v := slot_size - slot_spacing) < 0.0 else v
+            for slot_size, slot_spacing in zip(sizes, spacings)
+        ])
+        axis._buffers = (
+            positions,
+            array('d', [pos + c1_pad for pos, c1_pad in zip(positions, c1_pads)]),  # content start
+            array('d', [pos + size for pos, size in zip(positions, content_sizes)]),  # slot end
+            array('d', c2_pads),
+        )
+
+        for slot, pos, size, slot_spacing, c1_pad, c2_pad in zip(slots, positions, content_sizes, spacings, c1_pads, c2_pads):
+            state = slot._state
+            state.pos = pos
+            state.size = size
+            state.spacing = slot_spacing
+            state.padding = (c1_pad, c2_pad)
+
+        return True
+
+    def _upd_item_states(self, items: typing.Iterable[ItemData], /, *, int=int, does_item_exist=dearpygui.does_item_exist, __HIDDEN=(0, 0, 0, 0, False)):
+        # Only items whose rect differs from the one last applied are
+        # updated.
         rows = self._rows._slots
         cols = self._cols._slots
 
@@ -769,35 +944,105 @@ class Grid(_GridComponent):
         n_cols = len(cols)
         n_rows = len(rows)
 
-        if n_cols == 0 or n_rows == 0:
-            for item_data in self._item_data:
-                try:
-                    item_data.rect_setter(item_data.item, 0, 0, 0, 0, False)
-                except SystemError:
-                    if not does_item_exist(item_data.item):
-                        dirty_refs.add(item_data.item)
-                        continue
-                    raise
+        n_computed = n_written = 0
+        for item_data in items:
+            n_computed += 1
+            x1, y1, x2, y2 = item_data.cellspan
 
-            self._gc_item_data()
-            return
+            if not (n_cols and n_rows) or x1 >= n_cols or x2 >= n_cols or y1 >= n_rows or y2 >= n_rows:
+                rect = __HIDDEN
+            else:
+                # convert negative indexes
+                if x1 < 0: x1 %= n_cols
+                if y1 < 0: y1 %= n_rows
+                if x2 < 0: x2 %= n_cols
+                if y2 < 0: y2 %= n_rows
+                # fix inverted cellspan
+                if y1 > y2: (y1, y2) = (y2, y1)
+                if x1 > x2: (x1, x2) = (x2, x1)
+
+                col1_state = cols[x1]._state
+                row1_state = rows[y1]._state
+                col2_state = cols[x2]._state
+                row2_state = rows[y2]._state
+
+                x1_pad, y1_pad, x2_pad, y2_pad = item_data.padding
+
+                # cell x-axis
+                if x1_pad != x1_pad:  # is NaN?
+                    x1_pad = col1_state.padding[0]
+                cell_x_pos = col1_state.pos + x1_pad
+
+                if x2_pad != x2_pad:  # is NaN?
+                    x2_pad = col2_state.padding[1]
+                cell_width = col2_state.pos + col2_state.size - cell_x_pos - x2_pad  # col2_end = col2_state.pos + col2_state.size
+
+                # cell y-axis
+                if y1_pad != y1_pad:  # is NaN?
+                    y1_pad = row1_state.padding[0]
+                cell_y_pos = row1_state.pos + y1_pad
+
+                if y2_pad != y2_pad:  # is NaN?
+                    y2_pad = row2_state.padding[1]
+                cell_height = row2_state.pos + row2_state.size - cell_y_pos - y2_pad
+
+                item_width, item_height = item_data.max_size
+                if not item_width or item_width > cell_width:
+                    item_width = cell_width
+
+                if not item_height or item_height > cell_height:
+                    item_height = cell_height
+
+                # hide item (no real estate, or too small)
+                if cell_width < 1 or cell_height < 1 or item_width < 1 or item_height < 1:
+                    rect = __HIDDEN
+                else:
+                    x_coef, y_coef = item_data.pos_coef
+                    rect = (
+                        int(cell_x_pos + (cell_width - item_width) * x_coef),
+                        int(cell_y_pos + (cell_height - item_height) * y_coef),
+                        int(item_width),
+                        int(item_height),
+                        True,
+                    )
 
-        for item_data in self._item_data:
-            x1, y1, x2, y2 = item_data.cellspan
+            if rect == item_data._rect:
+                continue
 
-            if item_data._out_of_bounds:
-                if x1 >= n_cols or x2 >= n_cols or y1 >= n_rows or y2 >= n_rows:
+            try:
+                item_data.rect_setter(item_data.item, *rect)
+            except SystemError:
+                if not does_item_exist(item_data.item):
+                    dirty_refs.add(item_data.item)
                     continue
-                item_data._out_of_bounds = False
-            elif x1 >= n_cols or x2 >= n_cols or y1 >= n_rows or y2 >= n_rows:
-                item_data._out_of_bounds = True
-                try:
-                    item_data.rect_setter(item_data.item, 0, 0, 0, 0, False)
-                except SystemError:
-                    if not does_item_exist(item_data.item):
-                        dirty_refs.add(item_data.item)
-                        continue
-                    raise
+                raise
+            item_data._rect = rect
+            n_written += 1
+
+        self.rects_computed = n_computed
+        self.rects_written  = n_written
+
+        self._gc_item_data()
+
+    def _get_item_buffers(self, n_cols: int, n_rows: int, /) -> tuple:
+        # Flattens the settings of all items into contiguous buffers. Cell
+        # indexes are resolved for the current number of slots, so this is
+        # only redone when items are added/removed or the grid is reshaped.
+        buffers = self._item_buffers
+        if buffers is not None and buffers[0] == (n_cols, n_rows):
+            return buffers
+
+        in_bounds = []
+        out_of_bounds = []
+        x1s = array('q'); y1s = array('q'); x2s = array('q'); y2s = array('q')
+        x1_pads = array('d'); y1_pads = array('d'); x2_pads = array('d'); y2_pads = array('d')
+        max_widths = array('d'); max_heights = array('d')
+        x_coefs = array('d'); y_coefs = array('d')
+
+        for item_data in self._item_data:
+            x1, y1, x2, y2 = item_data.cellspan
+            if not (n_cols and n_rows) or x1 >= n_cols or x2 >= n_cols or y1 >= n_rows or y2 >= n_rows:
+                out_of_bounds.append(item_data)
                 continue
 
             # convert negative indexes
@@ -809,81 +1054,130 @@ class Grid(_GridComponent):
             if y1 > y2: (y1, y2) = (y2, y1)
             if x1 > x2: (x1, x2) = (x2, x1)
 
-            col1_state = cols[x1]._state
-            row1_state = rows[y1]._state
-            col2_state = cols[x2]._state
-            row2_state = rows[y2]._state
+            in_bounds.append(item_data)
+            x1s.append(x1); y1s.append(y1); x2s.append(x2); y2s.append(y2)
 
             x1_pad, y1_pad, x2_pad, y2_pad = item_data.padding
+            x1_pads.append(x1_pad); y1_pads.append(y1_pad); x2_pads.append(x2_pad); y2_pads.append(y2_pad)
+
+            max_width, max_height = item_data.max_size
+            max_widths.append(max_width); max_heights.append(max_height)
+
+            x_coef, y_coef = item_data.pos_coef
+            x_coefs.append(x_coef); y_coefs.append(y_coef)
+
+        buffers = self._item_buffers = (
+            (n_cols, n_rows),
+            in_bounds,
+            out_of_bounds,
+            (x1s, y1s, x2s, y2s),
+            (x1_pads, y1_pads, x2_pads, y2_pads),
+            (max_widths, max_heights),
+            (x_coefs, y_coefs),
+        )
+        return buffers
+
+    def _upd_item_buffers(self, items: typing.Iterable[ItemData], /, *, __HIDDEN=(0, 0, 0, 0, False)):
+        # Same as `_upd_item_states` (and with identical results) but
+        # calculates the rects of all items at once, using NumPy when
+        # available. Always updates all items.
+        _, in_bounds, out_of_bounds, cellspans, paddings, max_sizes, pos_coefs = self._get_item_buffers(
+            len(self._cols._slots), len(self._rows._slots),
+        )
 
-            # cell x-axis
-            if x1_pad != x1_pad:  # is NaN?
-                x1_pad = col1_state.padding[0]
-            cell_x_pos = col1_state.pos + x1_pad
-
-            if x2_pad != x2_pad:  # is NaN?
-                x2_pad = col2_state.padding[1]
-            cell_width = col2_state.pos + col2_state.size - cell_x_pos - x2_pad  # col2_end = col2_state.pos + col2_state.size
-
-            if cell_width < 1:  # hide item (no real estate)
-                try:
-                    item_data.rect_setter(item_data.item, 0, 0, 0, 0, False)
-                except SystemError:
-                    if not does_item_exist(item_data.item):
-                        dirty_refs.add(item_data.item)
-                        continue
-                    raise
-                continue
-
-            # cell y-axis
-            if y1_pad != y1_pad:  # is NaN?
-                y1_pad = row1_state.padding[0]
-            cell_y_pos = row1_state.pos + y1_pad
+        np = _get_numpy()
+        if np is None:
+            rects = self._solve_item_buffers(cellspans, paddings, max_sizes, pos_coefs)
+        else:
+            rects = self._solve_item_buffers_numpy(np, cellspans, paddings, max_sizes, pos_coefs)
 
-            if y2_pad != y2_pad:  # is NaN?
-                y2_pad = row2_state.padding[1]
-            cell_height = row2_state.pos + row2_state.size - cell_y_pos - y2_pad
+        dirty_refs = self._data_to_del
+        does_item_exist = dearpygui.does_item_exist
 
-            if cell_height < 1:  # hide item (no real estate)
-                try:
-                    item_data.rect_setter(item_data.item, 0, 0, 0, 0, False)
-                except SystemError:
-                    if not does_item_exist(item_data.item):
-                        dirty_refs.add(item_data.item)
-                        continue
-                    raise
+        n_written = 0
+        for item_data, rect in itertools.chain(zip(in_bounds, rects), zip(out_of_bounds, itertools.repeat(__HIDDEN))):
+            if rect == item_data._rect:
                 continue
 
-            item_width, item_height = item_data.max_size
-            if not item_width or item_width > cell_width:
-                item_width = cell_width
-
-            if not item_height or item_height > cell_height:
-                item_height = cell_height
-
-            if item_width < 1 or item_height < 1:  # hide item (too small)
-                item_width = item_height = item_x_pos = item_y_pos = 0
-                item_show = False
-            else:
-                x_coef, y_coef = item_data.pos_coef
-                item_x_pos = int(cell_x_pos + (cell_width - item_width) * x_coef)
-                item_y_pos = int(cell_y_pos + (cell_height - item_height) * y_coef)
-                item_width = int(item_width)
-                item_height = int(item_height)
-                item_show = True
-
             try:
-                item_data.rect_setter(
-                    item_data.item, item_x_pos, item_y_pos, item_width, item_height, item_show,
-                )
+                item_data.rect_setter(item_data.item, *rect)
             except SystemError:
                 if not does_item_exist(item_data.item):
                     dirty_refs.add(item_data.item)
                     continue
                 raise
+            item_data._rect = rect
+            n_written += 1
+
+        self.rects_computed = len(in_bounds) + len(out_of_bounds)
+        self.rects_written  = n_written
 
         self._gc_item_data()
 
+    def _solve_item_buffers(self, cellspans, paddings, max_sizes, pos_coefs, /, *, int=int, __HIDDEN=(0, 0, 0, 0, False)) -> list:
+        x1s, y1s, x2s, y2s = cellspans
+        x1_pads, y1_pads, x2_pads, y2_pads = paddings
+        max_widths, max_heights = max_sizes
+        x_coefs, y_coefs = pos_coefs
+
+        col_pos, col_start, col_end, col_c2_pad = self._cols._buffers  # ty:ignore[unresolved-attribute]
+        row_pos, row_start, row_end, row_c2_pad = self._rows._buffers  # ty:ignore[unresolved-attribute]
+
+        # NaN item padding falls back to the slot's
+        cell_x_pos = [col_start[i] if pad != pad else col_pos[i] + pad for i, pad in zip(x1s, x1_pads)]
+        cell_width = [col_end[i] - x_pos - (col_c2_pad[i] if pad != pad else pad) for i, x_pos, pad in zip(x2s, cell_x_pos, x2_pads)]
+        cell_y_pos = [row_start[i] if pad != pad else row_pos[i] + pad for i, pad in zip(y1s, y1_pads)]
+        cell_height = [row_end[i] - y_pos - (row_c2_pad[i] if pad != pad else pad) for i, y_pos, pad in zip(y2s, cell_y_pos, y2_pads)]
+
+        item_width = [cell_size if not max_size or max_size > cell_size else max_size for cell_size, max_size in zip(cell_width, max_widths)]
+        item_height = [cell_size if not max_size or max_size > cell_size else max_size for cell_size, max_size in zip(cell_height, max_heights)]
+
+        return [
+            __HIDDEN if c_wt < 1 or c_ht < 1 or i_wt < 1 or i_ht < 1 else (
+                int(x_pos + (c_wt - i_wt) * x_coef),
+                int(y_pos + (c_ht - i_ht) * y_coef),
+                int(i_wt),
+                int(i_ht),
+                True,
+            )
+            for x_pos, y_pos, c_wt, c_ht, i_wt, i_ht, x_coef, y_coef in zip(
+                cell_x_pos, cell_y_pos, cell_width, cell_height, item_width, item_height, x_coefs, y_coefs,
+            )
+        ]
+
+    def _solve_item_buffers_numpy(self, np, cellspans, paddings, max_sizes, pos_coefs, /, *, __HIDDEN=(0, 0, 0, 0, False)) -> list:
+        # buffers are wrapped, not copied
+        x1s, y1s, x2s, y2s = (np.frombuffer(a, np.int64) for a in cellspans)
+        x1_pads, y1_pads, x2_pads, y2_pads = (np.frombuffer(a, np.float64) for a in paddings)
+        max_widths, max_heights = (np.frombuffer(a, np.float64) for a in max_sizes)
+        x_coefs, y_coefs = (np.frombuffer(a, np.float64) for a in pos_coefs)
+
+        col_pos, col_start, col_end, col_c2_pad = (np.frombuffer(a, np.float64) for a in self._cols._buffers)  # ty:ignore[unresolved-attribute]
+        row_pos, row_start, row_end, row_c2_pad = (np.frombuffer(a, np.float64) for a in self._rows._buffers)  # ty:ignore[unresolved-attribute]
+
+        isnan = np.isnan
+        where = np.where
+
+        cell_x_pos = where(isnan(x1_pads), col_start[x1s], col_pos[x1s] + x1_pads)
+        cell_width = col_end[x2s] - cell_x_pos - where(isnan(x2_pads), col_c2_pad[x2s], x2_pads)
+        cell_y_pos = where(isnan(y1_pads), row_start[y1s], row_pos[y1s] + y1_pads)
+        cell_height = row_end[y2s] - cell_y_pos - where(isnan(y2_pads), row_c2_pad[y2s], y2_pads)
+
+        item_width = where((max_widths == 0) | (max_widths > cell_width), cell_width, max_widths)
+        item_height = where((max_heights == 0) | (max_heights > cell_height), cell_height, max_heights)
+
+        hidden = (cell_width < 1) | (cell_height < 1) | (item_width < 1) | (item_height < 1)
+        with np.errstate(invalid="ignore"):  # hidden items may not be finite
+            x_pos = (cell_x_pos + (cell_width - item_width) * x_coefs).astype(np.int64)
+            y_pos = (cell_y_pos + (cell_height - item_height) * y_coefs).astype(np.int64)
+            width = item_width.astype(np.int64)
+            height = item_height.astype(np.int64)
+
+        return [
+            __HIDDEN if is_hidden else (x, y, w, h, True)
+            for x, y, w, h, is_hidden in zip(x_pos.tolist(), y_pos.tolist(), width.tolist(), height.tolist(), hidden.tolist())
+        ]
+
 
 class Overlay:
     @property
@@ -916,11 +1210,21 @@ class Overlay:
         self.border_color = border_color
         self.slots_color = slots_color
 
+        # Draw items are created once and updated in place. They're only
+        # added/removed when the number of slots changes, and recreated
+        # when the colors change.
+        self._colors       = None
+        self._drawn_key    = None
+        self._border_items = [0, 0, 0, 0, 0]  # x1/y1/x2/y2 offsets, outline
+        self._col_items    = list[tuple[int, int, int, int]]()  # x1/x2 spacing, x1/x2 line
+        self._row_items    = list[tuple[int, int, int, int]]()  # y1/y2 spacing, y1/y2 line
+        self._cell_items   = list[list[list[int]]]()  # [col][row] -> x1/y1/x2/y2 padding (0 until needed)
+
     __VIEWPORT_DRAWLIST = f"{__name__}.Overlay"
 
     _drawlayer = 0
 
-    def draw(self, /, *args, __CONFIG_SETTER=_dearpygui.configure_item) -> None:
+    def draw(self, /, *args, __CONFIG_SETTER=_dearpygui.configure_item, __changes=_changes) -> None:
         if args:
             x_min, y_min, x_max, y_max = args
         else:
@@ -943,73 +1247,143 @@ class Overlay:
                         raise
                     else:
                         self._drawlayer = 0
+            self._drawn_key = None
+            return
+
+        # the overlay's geometry is unchanged if the grid's is
+        grid = self.grid
+        drawn_key = (args, __changes.count, grid._cols._state_key, grid._rows._state_key)  # ty:ignore[unresolved-attribute]
+        if drawn_key == self._drawn_key:
             return
 
         try:
             if not (layer and dearpygui.does_item_exist(layer)):
                 layer = self._drawlayer = dearpygui.add_draw_layer(show=True, parent=__class__.__VIEWPORT_DRAWLIST)
-            else:
-                dearpygui.delete_item(layer, children_only=True)
+                self._reset_items()
         except SystemError:
             if not dearpygui.does_item_exist(__class__.__VIEWPORT_DRAWLIST):
                 dearpygui.add_viewport_drawlist(tag=__class__.__VIEWPORT_DRAWLIST)
             if not (layer and dearpygui.does_item_exist(layer)):
                 layer = self._drawlayer = dearpygui.add_draw_layer(show=True, parent=__class__.__VIEWPORT_DRAWLIST)
+                self._reset_items()
             else:
                 raise
 
-        self._draw_outline(x_min, y_min, x_max, y_max)
-        self._draw_slots(x_min, y_min, x_max, y_max)
+        colors = (
+            self._border_line_color,
+            self._border_pad_color,
+            self._slots_line_color,
+            self._slots_void_color,
+            self._slots_pad_color,
+        )
+        if colors != self._colors:
+            dearpygui.delete_item(layer, children_only=True)
+            self._reset_items()
+            self._colors = colors
+
+        self._resize_items(len(grid._cols._slots), len(grid._rows._slots))
+
+        # coalesce draw item updates into one mutex acquisition
+        with cache.batch() as batch:
+            cache.configure_item(layer, show=True)
+            self._draw_outline(x_min, y_min, x_max, y_max)
+            self._draw_slots(x_min, y_min, x_max, y_max)
+        if batch.dropped:  # draw items deleted elsewhere; recreate them next time
+            dearpygui.delete_item(layer, children_only=True)
+            self._reset_items()
+        else:
+            self._drawn_key = drawn_key
 
     __call__ = draw
     __code__ = (lambda: ...).__code__  # tell DPG we accept no arguments
 
     _EMPTY_COLOR = (0, 0, 0, 0)
 
-    def _draw_outline(self, x_min: int, y_min: int, x_max: int, y_max: int):
-        layer = self._drawlayer
+    def _reset_items(self, /):
+        # forget all draw items (they must already be deleted)
+        self._drawn_key = None
+        self._border_items = [0, 0, 0, 0, 0]
+        self._col_items.clear()
+        self._row_items.clear()
+        self._cell_items.clear()
 
+    def _create_slot_items(self, /) -> tuple[int, int, int, int]:
+        layer = self._drawlayer
         no_color = __class__._EMPTY_COLOR
-        line_color = self._border_line_color
+        space_color = self._slots_void_color
+        line_color = self._slots_line_color
+        return (
+            dearpygui.draw_rectangle((0, 0), (0, 0), color=no_color, fill=space_color, parent=layer),
+            dearpygui.draw_rectangle((0, 0), (0, 0), color=no_color, fill=space_color, parent=layer),
+            dearpygui.draw_line((0, 0), (0, 0), color=line_color, parent=layer),
+            dearpygui.draw_line((0, 0), (0, 0), color=line_color, parent=layer),
+        )
+
+    def _resize_items(self, n_cols: int, n_rows: int, /, *, __DELETE=_dearpygui.delete_item):
+        col_items = self._col_items
+        row_items = self._row_items
+        cell_items = self._cell_items
+
+        while len(col_items) > n_cols:
+            for item in col_items.pop():
+                __DELETE(item)
+            for items in cell_items.pop():
+                for item in items:
+                    if item:
+                        __DELETE(item)
+        while len(row_items) > n_rows:
+            for item in row_items.pop():
+                __DELETE(item)
+            for col_cells in cell_items:
+                for item in col_cells.pop():
+                    if item:
+                        __DELETE(item)
+
+        while len(row_items) < n_rows:
+            row_items.append(self._create_slot_items())
+            for col_cells in cell_items:
+                col_cells.append([0, 0, 0, 0])
+        while len(col_items) < n_cols:
+            col_items.append(self._create_slot_items())
+            cell_items.append([[0, 0, 0, 0] for _ in range(n_rows)])
+
+    def _set_pad_rect(self, items: list[int], index: int, pad: float, pmin: tuple, pmax: tuple, fill: tuple, /, *, __SETTER=cache.configure_item):
+        # padding rects are only created when needed
+        item = items[index]
+        if pad:
+            if item:
+                __SETTER(item, pmin=pmin, pmax=pmax, show=True)
+            else:
+                items[index] = dearpygui.draw_rectangle(
+                    pmin, pmax, color=__class__._EMPTY_COLOR, fill=fill, parent=self._drawlayer,
+                )
+        elif item:
+            __SETTER(item, show=False)
+
+    def _draw_outline(self, x_min: int, y_min: int, x_max: int, y_max: int, /, *, __SETTER=cache.configure_item):
+        items = self._border_items
         pad_color = self._border_pad_color
 
         x1_pad, y1_pad, x2_pad, y2_pad = self.grid.offsets
 
         # padding
-        if x1_pad:
-            dearpygui.draw_rectangle(
-                (x_min, y_max), (x_min + x1_pad, y_min + y1_pad),
-                color=no_color, fill=pad_color, parent=layer,
-            )
-        if y1_pad:
-            dearpygui.draw_rectangle(
-                (x_min, y_min), (x_max - x2_pad, y_min + y1_pad),
-                color=no_color, fill=pad_color, parent=layer,
-            )
-        if x2_pad:
-            dearpygui.draw_rectangle(
-                (x_max, y_min), (x_max - x2_pad, y_max - y2_pad),
-                color=no_color, fill=pad_color, parent=layer,
-            )
-        if y2_pad:
-            dearpygui.draw_rectangle(
-                (x_max, y_max), (x_min + x1_pad, y_max - y2_pad),
-                color=no_color, fill=pad_color, parent=layer,
-            )
+        self._set_pad_rect(items, 0, x1_pad, (x_min, y_max), (x_min + x1_pad, y_min + y1_pad), pad_color)
+        self._set_pad_rect(items, 1, y1_pad, (x_min, y_min), (x_max - x2_pad, y_min + y1_pad), pad_color)
+        self._set_pad_rect(items, 2, x2_pad, (x_max, y_min), (x_max - x2_pad, y_max - y2_pad), pad_color)
+        self._set_pad_rect(items, 3, y2_pad, (x_max, y_max), (x_min + x1_pad, y_max - y2_pad), pad_color)
 
         # outline
-        dearpygui.draw_rectangle(
-            (x_min, y_min), (x_max, y_max),
-            fill=no_color, color=line_color, parent=layer,
-        )
-
-    def _draw_slots(self, x_min: int, y_min: int, x_max: int, y_max: int, /):
-        layer = self._drawlayer
+        if items[4]:
+            __SETTER(items[4], pmin=(x_min, y_min), pmax=(x_max, y_max))
+        else:
+            items[4] = dearpygui.draw_rectangle(
+                (x_min, y_min), (x_max, y_max),
+                fill=__class__._EMPTY_COLOR, color=self._border_line_color, parent=self._drawlayer,
+            )
 
-        no_color = __class__._EMPTY_COLOR
-        line_color = self._slots_line_color
-        space_color = self._slots_void_color
+    def _draw_slots(self, x_min: int, y_min: int, x_max: int, y_max: int, /, *, __SETTER=cache.configure_item):
         pad_color = self._slots_pad_color
+        set_pad_rect = self._set_pad_rect
 
         cols = self.grid.cols
         rows = self.grid.rows
@@ -1022,76 +1396,210 @@ class Overlay:
         cont_x_max = x_max - x2_pad
         cont_y_max = y_max - y2_pad
 
-        for col in cols:
+        row_rects = []
+        for row, (y1_space_item, y2_space_item, y1_line_item, y2_line_item) in zip(rows, self._row_items):
+            row_state = row._state
+            cell_y_min  = y_min + row_state.pos
+            cell_y_max  = cell_y_min + row_state.size
+            row_rects.append((cell_y_min, cell_y_max, *row_state.padding))
+
+            __SETTER(y1_space_item, pmin=(cont_x_min, cell_y_min), pmax=(cont_x_max, cell_y_min - y_space))
+            __SETTER(y2_space_item, pmin=(cont_x_min, cell_y_max), pmax=(cont_x_max, cell_y_max + y_space))
+            # lines
+            __SETTER(y1_line_item, p1=(cont_x_min, cell_y_min), p2=(cont_x_max, cell_y_min))
+            __SETTER(y2_line_item, p1=(cont_x_min, cell_y_max), p2=(cont_x_max, cell_y_max))
+
+        for col, (x1_space_item, x2_space_item, x1_line_item, x2_line_item), col_cells in zip(cols, self._col_items, self._cell_items):
             col_state = col._state
             cell_x_min  = x_min + col_state.pos
             cell_x_max  = cell_x_min + col_state.size
             cell_x1_pad, cell_x2_pad = col_state.padding
 
-            for row in rows:
-                row_state = row._state
-                cell_y_min  = y_min + row_state.pos
-                cell_y_max  = cell_y_min + row_state.size
-                cell_y1_pad, cell_y2_pad = row_state.padding
-
-                if cell_x1_pad:
-                    dearpygui.draw_rectangle(
-                        (cell_x_min, cell_y_max), (cell_x_min + cell_x1_pad, cell_y_min + cell_y1_pad),
-                        color=no_color, fill=pad_color, parent=layer,
-                    )
-                if cell_y1_pad:
-                    dearpygui.draw_rectangle(
-                        (cell_x_min, cell_y_min), (cell_x_max - cell_x2_pad, cell_y_min + cell_y1_pad),
-                        color=no_color, fill=pad_color, parent=layer,
-                    )
-                if cell_x2_pad:
-                    dearpygui.draw_rectangle(
-                        (cell_x_max, cell_y_min), (cell_x_max - cell_x2_pad, cell_y_max - cell_y2_pad),
-                        color=no_color, fill=pad_color, parent=layer,
-                    )
-                if cell_y2_pad:
-                    dearpygui.draw_rectangle(
-                        (cell_x_max, cell_y_max), (cell_x_min + cell_x1_pad, cell_y_max - cell_y2_pad),
-                        color=no_color, fill=pad_color, parent=layer,
-                    )
-
-                dearpygui.draw_rectangle(
-                    (cont_x_min, cell_y_min), (cont_x_max, cell_y_min - y_space),
-                    color=no_color, fill=space_color, parent=layer,
+            for (cell_y_min, cell_y_max, cell_y1_pad, cell_y2_pad), items in zip(row_rects, col_cells):
+                set_pad_rect(
+                    items, 0, cell_x1_pad,
+                    (cell_x_min, cell_y_max), (cell_x_min + cell_x1_pad, cell_y_min + cell_y1_pad), pad_color,
                 )
-                dearpygui.draw_rectangle(
-                    (cont_x_min, cell_y_max), (cont_x_max, cell_y_max + y_space),
-                    color=no_color, fill=space_color, parent=layer,
+                set_pad_rect(
+                    items, 1, cell_y1_pad,
+                    (cell_x_min, cell_y_min), (cell_x_max - cell_x2_pad, cell_y_min + cell_y1_pad), pad_color,
                 )
-                # lines
-                dearpygui.draw_line(
-                    (cont_x_min, cell_y_min), (cont_x_max, cell_y_min),
-                    color=line_color, parent=layer,
+                set_pad_rect(
+                    items, 2, cell_x2_pad,
+                    (cell_x_max, cell_y_min), (cell_x_max - cell_x2_pad, cell_y_max - cell_y2_pad), pad_color,
                 )
-                dearpygui.draw_line(
-                    (cont_x_min, cell_y_max), (cont_x_max, cell_y_max),
-                    color=line_color, parent=layer,
+                set_pad_rect(
+                    items, 3, cell_y2_pad,
+                    (cell_x_max, cell_y_max), (cell_x_min + cell_x1_pad, cell_y_max - cell_y2_pad), pad_color,
                 )
 
             # outer spacing
-            dearpygui.draw_rectangle(
-                (cell_x_min, cont_y_min), (cell_x_min - x_space, cont_y_max),
-                color=no_color, fill=space_color, parent=layer,
-            )
-            dearpygui.draw_rectangle(
-                (cell_x_max, cont_y_min), (cell_x_max + x_space, cont_y_max),
-                color=no_color, fill=space_color, parent=layer,
-            )
+            __SETTER(x1_space_item, pmin=(cell_x_min, cont_y_min), pmax=(cell_x_min - x_space, cont_y_max))
+            __SETTER(x2_space_item, pmin=(cell_x_max, cont_y_min), pmax=(cell_x_max + x_space, cont_y_max))
             # lines
-            dearpygui.draw_line(
-                (cell_x_min, cont_y_min), (cell_x_min, cont_y_max),
-                color=line_color, parent=layer,
-            )
-            dearpygui.draw_line(
-                (cell_x_max, cont_y_min), (cell_x_max, cont_y_max),
-                color=line_color, parent=layer,
-            )
+            __SETTER(x1_line_item, p1=(cell_x_min, cont_y_min), p2=(cell_x_min, cont_y_max))
+            __SETTER(x2_line_item, p1=(cell_x_max, cont_y_min), p2=(cell_x_max, cont_y_max))
+
+
+
+
+def _get_item_depth(item: Item, /, *, __INFO_GETTER=_dearpygui.get_item_info) -> int:
+    # number of ancestors of `item` in the item tree
+    depth = 0
+    while item:
+        item = __INFO_GETTER(item)["parent"]
+        depth += 1
+    return depth
+
+
+class _LayoutEntry:
+    __slots__ = ("grid", "parent", "depth", "rect")
+
+    def __init__(self, grid: Grid, /) -> None:
+        self.grid   = grid
+        self.parent = _MISSING  # `grid.parent` when `depth` was last found
+        self.depth  = 0
+        self.rect   = None      # the parent's rect when `grid` was last drawn
+
+
+class LayoutScheduler:
+    def __init__(self, /) -> None:
+        self._lock      = threading.Lock()
+        self._entries   = dict[int, _LayoutEntry]()  # grids aren't hashable
+        self._order     = list[_LayoutEntry]()  # top-down
+        self._scheduled = set[int]()
+        self._requested = False
+        self._runtime   = None
+        self._handle    = None
+        self.grids_drawn = 0
+
+    def __len__(self, /) -> int:
+        return len(self._entries)
+
+    def __contains__(self, grid: typing.Any, /) -> bool:
+        return id(grid) in self._entries
+
+    def __iter__(self, /) -> typing.Iterator[Grid]:
+        return iter([entry.grid for entry in self._order])
 
+    def register(self, grid: Grid, /) -> Grid:
+        with self._lock:
+            if id(grid) not in self._entries:
+                entry = self._entries[id(grid)] = _LayoutEntry(grid)
+                self._order.append(entry)
+            self._scheduled.add(id(grid))
+            self._requested = True
+        self._arm()
+        return grid
+
+    def unregister(self, grid: Grid, /) -> None:
+        with self._lock:
+            entry = self._entries.pop(id(grid), None)
+            if entry is not None:
+                self._order.remove(entry)
+            self._scheduled.discard(id(grid))
+
+    def schedule(self, grid: Grid | None = None, /) -> None:
+        with self._lock:
+            if grid is None:
+                self._scheduled.update(self._entries)
+            elif id(grid) in self._entries:
+                self._scheduled.add(id(grid))
+            else:
+                raise ValueError(f"{grid!r} is not registered")
+            self._requested = True
+        self._arm()
+
+    def __call__(self, /, *args) -> None:
+        # item handler/viewport resize callback; the pass finds the grids
+        # whose parents were resized
+        self._requested = True
+        self._arm()
+
+    __code__ = (lambda: ...).__code__  # tell DPG we accept no arguments
+
+    def update(self, /, *, __DOES_ITEM_EXIST=_dearpygui.does_item_exist) -> None:
+        # One top-down pass. Only grids whose parent's rect changed since
+        # they were last drawn (or that were scheduled) are drawn.
+        with self._lock:
+            if not self._requested:
+                self.grids_drawn = 0
+                return
+            self._requested = False
+            scheduled = self._scheduled
+            self._scheduled = set()
+
+            order = self._order
+            resort = False
+            for entry in order:
+                parent = entry.grid.parent
+                if parent != entry.parent:
+                    entry.parent = parent
+                    try:
+                        entry.depth = _get_item_depth(parent) if parent else 0  # type: ignore
+                    except SystemError:
+                        if __DOES_ITEM_EXIST(parent):  # type: ignore
+                            raise
+                        entry.depth = 0
+                    resort = True
+            if resort:
+                # outer containers before the containers nested within them
+                order.sort(key=lambda entry: entry.depth)
+            order = order.copy()
+
+        n_drawn = 0
+        for entry in order:
+            grid = entry.grid
+            try:
+                rect = grid._get_parent_rect()
+            except SystemError:
+                parent = grid.parent
+                if parent and not __DOES_ITEM_EXIST(parent):
+                    self.unregister(grid)
+                    continue
+                raise
+            if rect == entry.rect and id(grid) not in scheduled:
+                continue
+            entry.rect = rect
+            grid.draw()
+            n_drawn += 1
+            if grid.rects_written:
+                # items sized by `grid` may be the parents of other grids;
+                # their new sizes are only known after the next frame
+                self._requested = True
+        self.grids_drawn = n_drawn
+
+    def attach(self, runtime: typing.Any, /) -> None:
+        self.detach()
+        self._runtime = runtime
+        if self._requested:
+            self._arm()
+
+    def detach(self, /) -> None:
+        with self._lock:
+            handle = self._handle
+            self._runtime = self._handle = None
+        if handle is not None:
+            handle.cancel()
+
+    def _arm(self, /) -> None:
+        # Passes are only scheduled on the runtime while requested, so an
+        # idle scheduler doesn't keep a runtime rendering on demand awake.
+        runtime = self._runtime
+        if runtime is None or self._handle is not None:
+            return
+        with self._lock:
+            if self._handle is not None or runtime is not self._runtime:
+                return
+            self._handle = runtime.call_on_frame(runtime.frame_count + 1, self._on_frame, runtime)
+        runtime.invalidate()
+
+    def _on_frame(self, runtime: typing.Any, /) -> None:
+        with self._lock:
+            self._handle = None
+        self.update()
+        if self._requested:
+            self._arm()
 
 
 
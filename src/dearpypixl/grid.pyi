@@ -3,9 +3,10 @@ import types
 
 if TYPE_CHECKING:
     from dearpypixl.core.protocols import Item
+    from dearpypixl.runtime import Runtime
 
 
-__all__ = ("ItemData", "Slot", "Axis", "Grid")
+__all__ = ("ItemData", "Slot", "Axis", "Grid", "LayoutScheduler")
 
 
 
@@ -356,7 +357,25 @@ class Grid(_GridComponent):
     ignored because the grid prioritized the child's value. Still without a
     value for the right padding, the grid falls back to using its own value of
     `4`.
+
+    Drawing is incremental. Slot geometry is only recalculated when the
+    grid's reference size or a setting of the grid, its axes or slots has
+    changed (including in-place changes like the above), and an item is only
+    updated when its calculated size, position or visibility differs from
+    the values last applied. Items pushed since the last draw are always
+    updated. Changes made to items directly in DearPyGui are not tracked;
+    call :py:meth:`invalidate()` to update every item on the next draw.
+
+    :vartype rects_computed: `int`
+    :var rects_computed: The number of item rects calculated during the last
+        draw.
+
+    :vartype rects_written: `int`
+    :var rects_written: The number of item rects applied (via the item's
+        `rect_setter`) during the last draw.
     """
+    rects_computed: int
+    rects_written: int
     ANCHORS: ClassVar[Collection[Literal[
         "c" "center",
         "n", "north",
@@ -368,7 +387,7 @@ class Grid(_GridComponent):
         "w",  "west",
         "nw", "northwest"
     ]]]
-    def __init__(self, /, cols: int = 1, rows: int = 1, parent: Item | None = 0, *, label: str = "", padding: Sequence[float] | float | None = None, spacing: Sequence[float] | float | None = None, width: int | None = None, height: int | None = None, offsets: Sequence[float] | float | None = None, rect_getter: _RectGetter | None = None, overlay: bool = False, show: bool = True) -> None: ...
+    def __init__(self, /, cols: int = 1, rows: int = 1, parent: Item | None = 0, *, label: str = "", padding: Sequence[float] | float | None = None, spacing: Sequence[float] | float | None = None, width: int | None = None, height: int | None = None, offsets: Sequence[float] | float | None = None, rect_getter: _RectGetter | None = None, overlay: bool = False, show: bool = True, solver: Literal["python", "array"] = "python") -> None: ...
     @property
     def cols(self, /) -> Axis:
         """The :py:class:`Axis` object representing the grid's columns (x-axis)."""
@@ -411,10 +430,27 @@ class Grid(_GridComponent):
     @property
     def overlay(self, /) -> bool:
         """[**get**, **set**] the visibility state of the grid's overlay. The overlay
-        is a visual representation of the grid's "outline".
+        is a visual representation of the grid's "outline". Its draw items are
+        created once and updated in place when the grid's geometry changes.
         """
     @overlay.setter
     def overlay(self, value: bool, /) -> None: ...
+    SOLVERS: ClassVar[tuple[Literal["python", "array"], ...]]
+    @property
+    def solver(self, /) -> Literal["python", "array"]:
+        """[**get**, **set**] the method used to calculate the geometry of slots
+        and items.
+
+        The "python" solver (the default) calculates each slot and item in turn.
+        The "array" solver keeps the geometry of slots and the settings of items
+        in contiguous buffers, and calculates the geometry of all items at once.
+        It uses NumPy when it is installed, and is faster for grids with many
+        items (e.g. thousands). Both produce identical results.
+
+        :raises `ValueError`: The value is not one of :py:attr:`SOLVERS`.
+        """
+    @solver.setter
+    def solver(self, value: Literal["python", "array"], /) -> None: ...
     @property
     def offsets(self, /) -> _MutArray[float, Literal[4]]:
         """[**get**, **set**, **del**] values used as the left, upper, right, and lower
@@ -474,7 +510,7 @@ class Grid(_GridComponent):
     @rect_getter.setter
     def rect_getter(self, value: _RectGetter | None, /) -> None: ...
     @overload
-    def configure(self, /, *, cols: int = ..., rows: int = ..., parent: Item | None = ..., label: str | None = ..., padding: Sequence[float] | float | None = ..., spacing: Sequence[float] | float | None = ..., width: float | None = ..., height: float | None = ..., offsets: Sequence[float] | float | None = ..., rect_getter: _RectGetter | None = ..., overlay: bool = ..., show: bool = ..., **kwargs) -> None: ...
+    def configure(self, /, *, cols: int = ..., rows: int = ..., parent: Item | None = ..., label: str | None = ..., padding: Sequence[float] | float | None = ..., spacing: Sequence[float] | float | None = ..., width: float | None = ..., height: float | None = ..., offsets: Sequence[float] | float | None = ..., rect_getter: _RectGetter | None = ..., overlay: bool = ..., show: bool = ..., solver: Literal["python", "array"] = ..., **kwargs) -> None: ...
     @overload
     def configure(self, **kwargs): ...
     def configuration(self, /): ...
@@ -673,7 +709,14 @@ class Grid(_GridComponent):
         Awaits internal lock release.
         """
     def draw(self, /) -> None:
-        """Draw the grid, updating the size and position of any item attached.
+        """Draw the grid, updating the size and position of any item attached
+        whose geometry has changed.
+
+        Awaits internal lock release.
+        """
+    def invalidate(self, /) -> None:
+        """Recalculate all slots and update every item attached when the grid
+        is next drawn.
 
         Awaits internal lock release.
         """
@@ -681,6 +724,91 @@ class Grid(_GridComponent):
     __code__: types.CodeType
 
 
+class LayoutScheduler:
+    """Draws registered :py:class:`Grid` objects in a single top-down pass,
+    instead of drawing each grid from its own handlers.
+
+    Grids are ordered by the depth of their :py:attr:`Grid.parent` in the item
+    tree, so a grid is drawn after the grids sizing the containers it is nested
+    in. A pass only draws the grids whose parent's rect changed since they were
+    last drawn, and grids scheduled via :py:meth:`schedule()`.
+
+    Passes are requested, not run, by events. Use the scheduler object itself as
+    the callback of item resize handlers and of the viewport's resize callback
+    (in place of the grids); however many events occur, they are handled by the
+    next pass. A pass is run by calling :py:meth:`update()` once per frame, or
+    automatically after the next frame rendered by a `Runtime` the scheduler is
+    attached to, but only while a pass is requested. When a grid
+    resizes items during a pass, another pass is requested so that grids nested
+    within them are updated once their new size is known (after the next frame).
+    ```python
+    from dearpypixl.grid import Grid, LayoutScheduler
+    from dearpypixl.runtime import Runtime
+    from dearpygui import dearpygui as dpg
+
+    layout = LayoutScheduler()
+
+    with dpg.window() as window:
+        with dpg.child_window() as child:
+            ...
+    outer = layout.register(Grid(2, 1, window))
+    inner = layout.register(Grid(3, 3, child))
+    outer.push(child, 0, 0)
+
+    with dpg.item_handler_registry() as handlers:
+        dpg.add_item_resize_handler(callback=layout)
+    dpg.bind_item_handler_registry(window, handlers)
+    dpg.set_viewport_resize_callback(layout)
+
+    runtime = Runtime()
+    layout.attach(runtime)
+    runtime.start()
+    ```
+
+    :vartype grids_drawn: `int`
+    :var grids_drawn: The number of grids drawn during the last pass.
+    """
+    grids_drawn: int
+    def __init__(self, /) -> None: ...
+    def __len__(self, /) -> int: ...
+    def __contains__(self, grid: Any, /) -> bool: ...
+    def __iter__(self, /) -> Iterator[Grid]:
+        """Iterate through the registered grids in the order they are drawn."""
+    def register[G: Grid](self, grid: G, /) -> G:
+        """Add *grid* to the scheduler and schedule it for the next pass.
+        Returns *grid*.
+        """
+    def unregister(self, grid: Grid, /) -> None:
+        """Remove *grid* from the scheduler. Does not raise an error if *grid*
+        is not registered. Grids whose parent item is deleted are removed
+        automatically.
+        """
+    def schedule(self, grid: Grid | None = None, /) -> None:
+        """Draw *grid* (or all grids when `None`) during the next pass, whether
+        or not its parent's rect changed, e.g. after updating the grid's
+        settings.
+
+        :raises `ValueError`: *grid* is not registered.
+        """
+    def __call__(self, /, *args) -> None:
+        """Request a pass. Accepts and ignores any arguments so that it can be
+        used as a DearPyGui callback.
+        """
+    __code__: types.CodeType
+    def update(self, /) -> None:
+        """Run a pass, if one was requested since the last."""
+    def attach(self, runtime: Runtime, /) -> None:
+        """Run :py:meth:`update()` after the next frame rendered by *runtime*
+        (via `Runtime.call_on_frame()`) whenever a pass is requested. The
+        runtime is invalidated when a pass is requested, so a runtime
+        rendering on demand renders the frame promptly; an idle scheduler
+        does not keep it rendering. Detaches the scheduler from any other
+        runtime first.
+        """
+    def detach(self, /) -> None:
+        """Stop running passes after frames rendered by a `Runtime`."""
+
+
 class Overlay:
     @overload
     def draw(self, /) -> None: ...
@@ -4,10 +4,14 @@ implement a specific Python protocol (`MutableSequence`,
 `WritableBuffer`, etc), allowing them to be used in both data-oriented
 and UI code.
 """
+import itertools
 import threading
+from array import array
+from collections.abc import Buffer
 
 from dearpypixl.core import appitem
 from dearpypixl.core import metautil
+from dearpypixl.core import redraw
 from dearpygui import _dearpygui
 
 import typing
@@ -20,6 +24,26 @@ if typing.TYPE_CHECKING:
 
 # [ ValueArray ]
 
+def _unpack_buffer(buffer: Buffer, /) -> list:
+    # Splits a buffer along its first dimension. One-dimensional buffers
+    # become a list of numbers. Otherwise, rows of the last dimension are
+    # one-dimensional views of the buffer, which value items read via the
+    # buffer protocol.
+    view = memoryview(buffer)
+    if view.ndim <= 1 or 0 in view.shape:
+        return view.tolist()
+    try:
+        flat = (view if view.c_contiguous else memoryview(view.tobytes())).cast("B").cast(view.format)
+    except (TypeError, ValueError):  # not a native format
+        return view.tolist()
+
+    *shape, width = view.shape
+    rows = [flat[i:i + width] for i in range(0, len(flat), width)]
+    for size in reversed(shape[1:]):
+        rows = [rows[i:i + size] for i in range(0, len(rows), size)]
+    return rows
+
+
 class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.AppItem[U, V, None, typing.Any]):
     """Creates/manages a `mvValueRegistry` and its children in child slot
     1. The interface behaves similarly to a mutable, homogeneous array that
@@ -51,17 +75,32 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
     methods, whose behaviors mirror those found on `collections.deque`.
 
     Users should not directly manage the registry's children in child slot
-    1 as it may cause undefined behavior.
+    1 as it may cause undefined behavior. The interface keeps its own list
+    of those children (and optionally their values, see :py:attr:`mirror`)
+    so reads don't need to query DearPyGui; :py:meth:`resync()` must be
+    called if they are managed elsewhere.
+
+    When :py:attr:`maxlen` is set, the array can be used as a ring buffer
+    (see :py:attr:`ring`). Appends to a full array then overwrite the
+    oldest value item instead of replacing it.
 
     References
     ----------
+    - :py:attr:`mirror`
+    - :py:attr:`ring`
+    - :py:meth:`resync()`
     - :py:meth:`create_value_item()`
+    - :py:meth:`create_value_items()`
     - :py:meth:`update_value_item()`
+    - :py:meth:`update_value_items()`
     - :py:meth:`delete_value_item()`
+    - :py:attr:`item_events`
     - :py:attr:`on_value_create`
     - :py:attr:`on_value_update`
     - :py:attr:`on_value_delete`
     - :py:attr:`on_value_reorder`
+    - :py:attr:`on_values_create`
+    - :py:attr:`on_values_update`
 
     :vartype on_value_create: `EventContainer[[Self, Item]]`
     :var on_value_create: A `list`-like object containing callbacks to
@@ -84,11 +123,26 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
     :var on_value_reorder: A `list`-like object containing callbacks to
         invoke immediately after reordering items in child slot 1. Callbacks
         will receive the registry and reordered child slot 1 as arguments.
+
+    :vartype on_values_create: `EventContainer[[Self, list[Item]]]`
+    :var on_values_create: A `list`-like object containing callbacks to
+        invoke once after value items are created in bulk (by
+        :py:meth:`extend()`, :py:meth:`extendleft()`, and slice assignment).
+        Callbacks will receive the registry and the new items, whose values
+        are already set, as arguments.
+
+    :vartype on_values_update: `EventContainer[[Self, list[Item], list[Any]]]`
+    :var on_values_update: A `list`-like object containing callbacks to
+        invoke once after existing value items are updated in bulk (by slice
+        assignment). Callbacks will receive the registry, the items updated,
+        and their new values as arguments.
     """
     on_value_create: metautil.EventContainer[[typing.Self, Item]]
     on_value_update: metautil.EventContainer[[typing.Self, Item, V]]
     on_value_delete: metautil.EventContainer[[typing.Self, Item]]
     on_value_reorder: metautil.EventContainer[[typing.Self, typing.Sequence[Item]]]
+    on_values_create: metautil.EventContainer[[typing.Self, list[Item]]]
+    on_values_update: metautil.EventContainer[[typing.Self, list[Item], list[V]]]
 
     _lock: threading.Lock | threading.RLock
 
@@ -96,16 +150,30 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
     def lock(self, /) -> threading.Lock | threading.RLock:
         return self._lock
 
-    _command: typing.Callable[..., Item] | None
+    _command: typing.Callable[..., Item] | None = None
 
     @property
     def command(self, /) -> typing.Callable[..., Item] | None:
         return self._command
 
+    # Child slot 1 as the interface last left it. Every mutator updates
+    # it alongside the registry so that reads don't need to copy the
+    # slot out of DearPyGui.
+    _children: list[int]
+    # The values of `_children` as they were written, or `None` when
+    # `mirror` is disabled.
+    _values: list[V] | None
+    # In ring mode, the index in `_children` of the first (oldest) item.
+    # Child slot 1 is only reordered to match when the array is changed
+    # by something other than an append (see `_unwrap()`).
+    _head = 0
+
     @property
     def items(self, /) -> list[int]:
         """[***get***] all items in child slot 1."""
-        return _dearpygui.get_item_info(self)["children"][1]
+        children = self._children
+        head = self._head
+        return children[head:] + children[:head]
 
     @property
     def value(self, /) -> list[V]: # pyrefly: ignore [bad-override]
@@ -119,15 +187,83 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
         accordingly to match the length of the value.
         """
         with self._lock:
-            value = _dearpygui.get_values(_dearpygui.get_item_info(self)["children"][1])
-        return value
+            head = self._head
+            if (values := self._values) is not None:
+                return values[head:] + values[:head]
+            value = _dearpygui.get_values(self._children)
+        return value[head:] + value[:head] if head else value
     @value.setter
-    def value(self, value: typing.Iterable[V], /) -> None:
-        if not value:
+    def value(self, value: typing.Iterable[V] | Buffer, /) -> None:
+        if isinstance(value, Buffer):
+            self.from_buffer(value)
+        elif not value:
             self.clear()
         else:
             self[:] = value
 
+    @property
+    def mirror(self, /) -> bool:
+        """[***get***, ***set***] whether or not the interface keeps a copy
+        of the values it writes.
+
+        When enabled, reads (indexing, iteration, `in`, :py:meth:`index()`,
+        etc.) are served from the copy instead of DearPyGui. Values changed
+        outside of the interface -- such as by an item using a value item as
+        its `source` -- are not seen until :py:meth:`resync()` is called.
+        Enabling the mirror reads all values at once.
+        """
+        return self._values is not None
+    @mirror.setter
+    def mirror(self, value: bool, /) -> None:
+        with self._lock:
+            if not value:
+                self._values = None
+            elif self._values is None:
+                self._values = _dearpygui.get_values(self._children)
+
+    _ring = False
+
+    @property
+    def ring(self, /) -> bool:
+        """[***get***, ***set***] whether or not appending to a full array
+        recycles the oldest value item.
+
+        Only applies when :py:attr:`maxlen` is set. Once the array is full,
+        :py:meth:`append()` and :py:meth:`extend()` update the value of the
+        oldest item in place (emitting an "on update" event) and make it the
+        newest, so the number of items in child slot 1 stays constant.
+
+        The order of child slot 1 in DearPyGui is not updated by these
+        appends. :py:attr:`items` and the array itself are always in logical
+        order; the registry is reordered to match when the array is changed
+        in any other way, or when the mode is disabled.
+        """
+        return self._ring
+    @ring.setter
+    def ring(self, value: bool, /) -> None:
+        with self._lock:
+            self._ring = bool(value)
+            if not value:
+                self._unwrap()
+
+    _item_events = True
+
+    @property
+    def item_events(self, /) -> bool:
+        """[***get***, ***set***] whether or not bulk operations also emit
+        "on create" and "on update" events for each item.
+
+        Bulk operations always emit :py:attr:`on_values_create` and
+        :py:attr:`on_values_update`. When enabled (the default), callbacks
+        registered to :py:attr:`on_value_create` and :py:attr:`on_value_update`
+        are invoked for every item as well. Disable this if only the bulk
+        events are used.
+        """
+        return self._item_events
+    @item_events.setter
+    def item_events(self, value: bool, /) -> None:
+        self._item_events = bool(value)
+
     _position = -1
 
     @property
@@ -146,25 +282,28 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
     @maxlen.setter
     def maxlen(self, value: int | None, /) -> None:
         if value is None:
-            self._maxlen = None
+            with self._lock:
+                self._maxlen = None
+                self._unwrap()
             return
         if value < 0:
             raise ValueError(f"`maxlen` must be a positive integer or `None` -- got {value!r}")
         with self._lock:
             self._maxlen = value
-            self._trunc(-1, _dearpygui.get_item_info(self)["children"][1])
+            self._unwrap()
+            self._trunc(-1)
     @maxlen.deleter
     def maxlen(self, /) -> None:
         del self._maxlen
 
     @typing.overload
     @classmethod
-    def create(cls, /, command: typing.Callable[..., Item] | None = ..., *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> typing.Self: ...  # pyrefly: ignore [bad-override, inconsistent-overload]
+    def create(cls, /, command: typing.Callable[..., Item] | None = ..., *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, mirror: bool = False, ring: bool = False, item_events: bool = True, **kwargs) -> typing.Self: ...  # pyrefly: ignore [bad-override, inconsistent-overload]
     @typing.overload
     @classmethod
-    def create(cls, iterable: typing.Iterable[V], /, command: typing.Callable[..., Item] | None = ..., *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> typing.Self: ...
+    def create(cls, iterable: typing.Iterable[V], /, command: typing.Callable[..., Item] | None = ..., *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, mirror: bool = False, ring: bool = False, item_events: bool = True, **kwargs) -> typing.Self: ...
     @classmethod
-    def create(cls, iterable = None, /, command = None, *, label=None, use_internal_label=True, user_data=None, tag=0, **kwargs) -> typing.Self:
+    def create(cls, iterable = None, /, command = None, *, label=None, use_internal_label=True, user_data=None, tag=0, mirror=False, ring=False, item_events=True, **kwargs) -> typing.Self:
         if command is None:
             # static `_command` or overridden `create_value_item()`
             if cls._command is not None or cls.create_value_item is not __class__.create_value_item:
@@ -183,16 +322,81 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
 
         self._lock = threading.RLock()
         self._command = command  # type: ignore
+        self._children = []
+        self._values = [] if mirror else None
+        self._ring = bool(ring)
+        self._item_events = bool(item_events)
         self.on_value_create = metautil.EventContainer(positional_only=True, parg_count=2)
         self.on_value_update = metautil.EventContainer(positional_only=True, parg_count=3)
         self.on_value_delete = metautil.EventContainer(positional_only=True, parg_count=2)
         self.on_value_reorder = metautil.EventContainer(positional_only=True, parg_count=2)
+        self.on_values_create = metautil.EventContainer(positional_only=True, parg_count=2)
+        self.on_values_update = metautil.EventContainer(positional_only=True, parg_count=3)
 
-        if iterable:
+        if isinstance(iterable, Buffer):
+            self.from_buffer(iterable)
+        elif iterable:
             self.extend(iterable)
 
         return self
 
+    def resync(self, /) -> None:
+        """Re-read child slot 1 (and the values of its items, if
+        :py:attr:`mirror` is enabled) from DearPyGui.
+
+        The interface tracks the items it creates, deletes, and reorders
+        itself. This only needs to be called after the registry's children
+        are managed directly, or when mirrored values are changed outside
+        of the interface.
+
+        In :py:attr:`ring` mode, the logical order is kept if child slot 1
+        still contains the same items in the same order, and is otherwise
+        reset to the order of child slot 1.
+
+        Does not emit events.
+        """
+        with self._lock:
+            children = _dearpygui.get_item_info(self)["children"][1]
+            if children != self._children:
+                self._head = 0
+            self._children = children
+            if self._values is not None:
+                self._values = _dearpygui.get_values(children)
+
+    def _unwrap(self, /) -> None:
+        # Reorders `_children`, `_values`, and child slot 1 so that the
+        # logical order of a ring is also the physical order.
+        if not (head := self._head):
+            return
+        self._head = 0
+
+        children = self._children
+        children[:] = children[head:] + children[:head]
+        if (values := self._values) is not None:
+            values[:] = values[head:] + values[:head]
+        _dearpygui.reorder_items(self, 1, children)
+
+    def _index(self, index: typing.SupportsIndex, /) -> int:
+        # Logical index -> index in `_children`, for rings.
+        length = len(self._children)
+        i = int(index)
+        if i < 0:
+            i += length
+        if not 0 <= i < length:
+            raise IndexError("index out of range")
+        return (i + self._head) % length
+
+    def _recycle(self, value: V, /) -> None:
+        # Overwrites the oldest item of a full ring, making it the newest.
+        head = self._head
+        item = self._children[head]
+        self._head = (head + 1) % len(self._children)
+        if (values := self._values) is not None:
+            values[head] = value
+        self._position = -1
+        self.update_value_item(item, value)
+        self.on_value_update(self, item, value)
+
     def create_value_item(self, /) -> Item:
         """Called internally to create a new value child item. Returns
         the item created.
@@ -204,6 +408,33 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
         """
         return self._command(parent=self)  # pyrefly: ignore [not-callable]
 
+    def create_value_items(self, values: typing.Sequence[V], /) -> list[Item]:
+        """Called internally to create a new value child item for each of
+        *values*, with its value set. Returns the items created.
+
+        The default implementation holds DearPyGui's mutex throughout. Unless
+        :py:meth:`create_value_item()` or :py:meth:`update_value_item()` is
+        overridden, each item is created via `self.command(parent=self,
+        default_value=value)`; otherwise, those methods are used instead.
+
+        Does not emit events.
+        """
+        cls = type(self)
+        _dearpygui.lock_mutex()
+        try:
+            if cls.create_value_item is __class__.create_value_item and cls.update_value_item is __class__.update_value_item:
+                command = self._command
+                return [command(parent=self, default_value=value) for value in values]  # pyrefly: ignore [not-callable]
+
+            items = []
+            for value in values:
+                item = self.create_value_item()
+                self.update_value_item(item, value)
+                items.append(item)
+            return items
+        finally:
+            _dearpygui.unlock_mutex()
+
     def update_value_item(self, item: Item, value: V, /) -> None:
         """Called internally to update the value of an existing `mvStringValue`
         parented by the registry.
@@ -212,6 +443,35 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
         """
         _dearpygui.set_value(item, value)
 
+    def update_value_items(self, items: typing.Sequence[Item], values: typing.Sequence[V], /) -> None:
+        """Called internally to update the values of existing value items
+        parented by the registry, pairing *items* and *values* by index.
+
+        The default implementation calls :py:meth:`update_value_item()` for
+        each item while holding DearPyGui's mutex.
+
+        Does not emit events.
+        """
+        update = self.update_value_item
+        _dearpygui.lock_mutex()
+        try:
+            for item, value in zip(items, values):
+                update(item, value)
+        finally:
+            _dearpygui.unlock_mutex()
+
+    def _emit_values_create(self, items: list[Item], values: typing.Sequence[V], /) -> None:
+        self.on_values_create(self, items)
+        if not self._item_events:
+            return
+
+        created_callback = self.on_value_create
+        updated_callback = self.on_value_update
+        if len(created_callback) or len(updated_callback):
+            for item, value in zip(items, values):
+                created_callback(self, item)
+                updated_callback(self, item, value)
+
     def delete_value_item(self, item: Item = 0, /) -> None:
         """Called internally to delete an existing `mvStringValue` parented
         by the registry, or all value items when *item* is null.
@@ -223,42 +483,59 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
         else:
             _dearpygui.delete_item(self, children_only=True, slot=1)
 
-    def _trunc(self, index: typing.Literal[0, -1], children, /):
+    def _trunc(self, index: typing.Literal[0, -1], /):
+        children = self._children
         if (maxlen := self._maxlen) is None or (offset := len(children) - maxlen) <= 0:
             return
 
+        self._unwrap()
         if index < 0:
-            iterator = range(index, index-offset, -1)
+            span = slice(len(children) - offset, None)
         else:
-            iterator = range(index, (index + offset))
+            span = slice(None, offset)
 
         del_item = self.delete_value_item
         callback = self.on_value_delete
 
-        for i in iterator:
-            item = children[i]
+        items = children[span]
+        if index < 0:
+            items.reverse()
+        for item in items:
             callback(self, item)
             del_item(item)
 
+        del children[span]
+        if (values := self._values) is not None:
+            del values[span]
+
     def __len__(self, /) -> int:
         """Return the number of children in child slot 1."""
-        return len(_dearpygui.get_item_info(self)["children"][1])
+        return len(self._children)
 
     def __iter__(self, /) -> typing.Iterator[V]:
         """Iterate through the values of items in child slot 1."""
+        if (values := self._values) is not None:
+            if head := self._head:
+                values = values[head:] + values[:head]
+            yield from values
+            return
+
         get_value = _dearpygui.get_value
-        for item in _dearpygui.get_item_info(self)["children"][1]:
+        for item in self.items:
             try:
                 yield get_value(item)
             except SystemError:  # item no longer exists?
                 continue
 
     def __reversed__(self, /) -> typing.Iterator[V]:
-        get_value = _dearpygui.get_value
+        if (values := self._values) is not None:
+            if head := self._head:
+                values = values[head:] + values[:head]
+            yield from reversed(values)
+            return
 
-        items = _dearpygui.get_item_info(self)["children"][1]
-        items.reverse()
-        for item in items:
+        get_value = _dearpygui.get_value
+        for item in reversed(self.items):
             try:
                 yield get_value(item)
             except SystemError:  # item no longer exists?
@@ -269,17 +546,10 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
         if isinstance(other, str):
             return False
 
-        get_value = _dearpygui.get_value
-        for item in _dearpygui.get_item_info(self)["children"][1]:
-            try:
-                value = get_value(item)
-            except SystemError:  # item no longer exists?
-                continue
-
-            if other == value:
-                return True
-
-        return False
+        with self._lock:
+            if (values := self._values) is None:
+                values = _dearpygui.get_values(self._children)
+            return other in values
 
     @typing.overload
     def __getitem__(self, index: typing.SupportsIndex, /) -> V: ...  # type: ignore
@@ -289,7 +559,19 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
         """Return the value(s) of item(s) in child slot 1 at the given index
         or slice."""
         with self._lock:
-            items = _dearpygui.get_item_info(self)["children"][1][index]
+            children = self._children
+            values   = self._values
+            if self._head:
+                if isinstance(index, slice):
+                    children = self.items
+                    if values is not None:
+                        values = self.value
+                else:
+                    index = self._index(index)
+
+            if values is not None:
+                return values[index]
+            items = children[index]
             value = (_dearpygui.get_values if type(items) is list else _dearpygui.get_value)(items)
         return value
 
@@ -303,32 +585,30 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
 
         Updates via slice assignment will create or delete items as needed when
         the length of *value* differs from the number of items/values found
-        given the slice.
+        given the slice. Items are created and updated in bulk (see
+        :py:meth:`create_value_items()` and :py:meth:`update_value_items()`),
+        emitting an "on values create" and "on values update" event.
         """
         with self._lock:
-            children = _dearpygui.get_item_info(self)["children"][1]
+            if isinstance(index, slice):
+                self._unwrap()
+            elif self._head:
+                index = self._index(index)
+
+            children = self._children
+            values   = self._values
 
             if isinstance(index, slice):
                 assert not isinstance(value, str)
                 items = children[index]
-                lines = value
+                lines = self._unpack(value) if isinstance(value, Buffer) else list(value)
 
                 n_items = len(items)
                 n_lines = len(lines)
-                reorder = False
-
-                if n_lines > n_items:
-                    reorder  = True
-                    iterator = range(n_lines - n_items)
+                if n_items != n_lines and index.step not in (None, 1):
+                    raise ValueError(f"attempt to assign sequence of size {n_lines} to extended slice of size {n_items}")
 
-                    callback = self.on_value_create
-                    for _ in iterator:
-                        item = self.create_value_item()
-                        items.append(item)
-                        self._position = -1
-                        callback(self, item)
-
-                elif n_items > n_lines:
+                if n_items > n_lines:
                     iterator = range(n_items - n_lines)
 
                     callback = self.on_value_delete
@@ -337,19 +617,42 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
                         callback(self, item)
                         self.delete_value_item(item)
 
-                callback = self.on_value_update
-                for item, line in zip(items, lines):
-                    self.update_value_item(item, line)
-                    callback(self, item, line)
+                updated = items
+                if updated:
+                    self.update_value_items(updated, lines)
 
-                if reorder:
-                    children[index] = items
+                created = None
+                if n_lines > n_items:
+                    # new items are appended to child slot 1, so a reorder
+                    # is only necessary if the slice doesn't end there
+                    reorder = index.indices(len(children))[1] < len(children)
+                    created = self.create_value_items(lines[n_items:])
+                    items = items + created
+                    self._position = -1
+
+                children[index] = items
+                if values is not None:
+                    values[index] = lines
+                if created and reorder:
                     _dearpygui.reorder_items(self, 1, children)  # pyrefly: ignore [bad-argument-type]
 
-                self._trunc(-1, children)
+                if updated:
+                    updated_lines = lines[:len(updated)]
+                    self.on_values_update(self, updated, updated_lines)
+                    if self._item_events and len(callback := self.on_value_update):
+                        for item, line in zip(updated, updated_lines):
+                            callback(self, item, line)
+                if created:
+                    self._emit_values_create(created, lines[n_items:])
+
+                self._trunc(-1)
 
             else:
                 self.update_value_item(children[index], value)
+                if values is not None:
+                    values[index] = value
+
+        redraw.mark()
 
     @typing.overload
     def __delitem__(self, index: typing.SupportsIndex, /) -> None: ...
@@ -360,7 +663,8 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
         callback = self.on_value_delete
 
         with self._lock:
-            items = _dearpygui.get_item_info(self)["children"][1][index]
+            self._unwrap()
+            items = self._children[index]
             if type(items) is list:
                 for item in items:
                     callback(self, item)
@@ -368,16 +672,85 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
             else:
                 self.delete_value_item(items)
 
+            del self._children[index]
+            if (values := self._values) is not None:
+                del values[index]
+
+        redraw.mark()
+
     def __copy__[T](self, memo=None, /) -> typing.Self:
         config = self.configuration()
         return self.create(
-            self.value,
-            label=config["label"], use_internal_label=config["use_internal_label"], user_data=config["user_data"]
+            self.value, self._command,
+            label=config["label"], use_internal_label=config["use_internal_label"], user_data=config["user_data"],
+            mirror=self._values is not None, ring=self._ring, item_events=self._item_events,
         )
 
     def copy(self, /) -> typing.Self:
         return self.__copy__()
 
+    def _unpack(self, buffer: Buffer, /) -> list:
+        # mirrored values must not be views of the caller's buffer
+        if self._values is not None:
+            return memoryview(buffer).tolist()
+        return _unpack_buffer(buffer)
+
+    def to_buffer(self, /) -> memoryview:
+        """Return the values of items in child slot 1 as a `memoryview` of
+        a contiguous buffer of doubles (format `'d'`).
+
+        Numeric values produce a one-dimensional view. Sequence values
+        (`mvFloatVectValue`, `mvSeriesValue`, etc.) produce a view with a
+        dimension per level of nesting, and must have equal lengths. The
+        view is backed by an `array('d')`; NumPy users can wrap it without
+        copying via `numpy.asarray()`.
+
+        :raises `ValueError`: Sequence values are not of equal length.
+        """
+        values = self.value
+        if not values or isinstance(values[0], (int, float)):
+            return memoryview(array("d", values))
+
+        shape = [len(values)]
+        value = values[0]
+        while value and not isinstance(value, (int, float)):
+            shape.append(len(value))
+            value = value[0]
+
+        for size in shape[1:]:
+            if any(len(v) != size for v in values):
+                raise ValueError("sequence values are not of equal length")
+            values = list(itertools.chain.from_iterable(values))
+
+        return memoryview(array("d", values)).cast("B").cast("d", shape)
+
+    def from_buffer(self, buffer: Buffer, /) -> None:
+        """Set the values of items in child slot 1 from an object that
+        supports the buffer protocol (`array.array`, `memoryview`, NumPy
+        arrays, etc.), creating or deleting items as needed.
+
+        Each element of the buffer's first dimension is the value of one
+        item; equivelent to `self[:] = buffer`. Elements of multi-dimensional
+        buffers are passed to DearPyGui as views of the buffer, so no Python
+        object is created per number unless :py:attr:`mirror` is enabled.
+        Numeric value items require a Python object per value regardless.
+
+        Emits the same events as slice assignment.
+        """
+        values = self._unpack(buffer)
+        if values:
+            self[:] = values
+        else:
+            self.clear()
+
+    def _reorder(self, children: list[int], values: list[V] | None, /) -> None:
+        self._head = 0
+        self._children = children
+        if values is not None:
+            self._values = values
+        _dearpygui.reorder_items(self, 1, children)
+        self.on_value_reorder(self, children.copy())
+
     def sort(self, /, *, key: typing.Callable[[V], typing.Any] | None = None, reverse: bool = False) -> None:
         """Sorts the items in child slot 1 based on their values.
 
@@ -392,15 +765,19 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
             return key(x[0])
 
         with self._lock:
-            items = _dearpygui.get_item_info(self)["children"][1]
-            if not items:
+            if not self._children:
                 return
 
-            values = _dearpygui.get_values(items)
+            items  = self.items
+            values = self.value
+
+            pairs = sorted(zip(values, items), key=_key, reverse=reverse)
+            self._reorder(
+                [i for s, i in pairs],
+                None if self._values is None else [s for s, i in pairs],
+            )
 
-            items = [i for s, i in sorted(zip(values, items), key=_key, reverse=reverse)]
-            _dearpygui.reorder_items(self, 1, items)
-            self.on_value_reorder(self, items)
+        redraw.mark()
 
     def reverse(self, /) -> None:
         """Reverse the order of items in child slot 1.
@@ -408,22 +785,22 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
         Emits an "on reorder" event.
         """
         with self._lock:
-            items = _dearpygui.get_item_info(self)["children"][1]
+            if self._children:
+                self._reorder(self.items[::-1], None if self._values is None else self.value[::-1])
 
-            if items:
-                items.reverse()
-                _dearpygui.reorder_items(self, 1, items)
-                self.on_value_reorder(self, items)
+        redraw.mark()
 
     def index(self, value: V, /, start: typing.SupportsIndex = 0, stop: typing.SupportsIndex | None = None) -> int:
         """Return the index where an item's value in child slot 1 matches *value*."""
-        # TODO: revise later (perf)
         with self._lock:
-            values = _dearpygui.get_values(_dearpygui.get_item_info(self)["children"][1])
+            if self._head:
+                values = self.value
+            elif (values := self._values) is None:
+                values = _dearpygui.get_values(self._children)
 
-        if stop is not None:
-            return values.index(value, start, stop)
-        return values.index(value, start)
+            if stop is not None:
+                return values.index(value, start, stop)
+            return values.index(value, start)
 
     def insert(self, index: typing.SupportsIndex, value: V, /) -> None:
         """Create and insert a new `mvStringValue` item *index* and set its value
@@ -434,19 +811,22 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
         index = int(index)
 
         with self._lock:
-            children = _dearpygui.get_item_info(self)["children"][1]
+            self._unwrap()
+            children = self._children
 
             # mirrors `deque.insert()` with `maxlen` set
             if (maxlen := self._maxlen) is not None and len(children) >= maxlen:
                 raise IndexError("insert would cause the sequence length to exceed `maxlen`")
 
-            if index < 0:
+            if index < 0 and children:
                 index %= len(children)
 
             # value items don't accept the `before` argument, so a
             # reorder is necessary
             item = self.create_value_item()
             children.insert(index, item)
+            if (values := self._values) is not None:
+                values.insert(index, value)
             _dearpygui.reorder_items(self, 1, children)  # pyrefly: ignore [bad-argument-type]
             self._position = index
             self.on_value_create(self, item)
@@ -454,21 +834,35 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
             self.update_value_item(item, value)
             self.on_value_update(self, item, value)
 
+        redraw.mark()
+
     def append(self, value: V, /) -> None:
         """Create a new `mvStringValue` item and set its value to *value*.
 
-        Emits an "on create" and "on update" event.
+        Emits an "on create" and "on update" event. In :py:attr:`ring` mode,
+        a full array instead updates the value of its oldest item, emitting
+        an "on update" event only.
         """
         with self._lock:
+            if self._ring and (maxlen := self._maxlen) and len(self._children) == maxlen:
+                self._recycle(value)
+                redraw.mark()
+                return
+
+            self._unwrap()
             item = self.create_value_item()
+            self._children.append(item)
+            if (values := self._values) is not None:
+                values.append(value)
             self._position = -1
             self.on_value_create(self, item)
 
             self.update_value_item(item, value)
             self.on_value_update(self, item, value)
 
-            if self._maxlen is not None:  # avoid DLL call if possible
-                self._trunc(0, _dearpygui.get_item_info(self)["children"][1])
+            self._trunc(0)
+
+        redraw.mark()
 
     def appendleft(self, value: V, /) -> None:
         """Create and insert a new `mvStringValue` item *index* and set its value
@@ -477,12 +871,15 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
         Emits an "on create" and "on update" event.
         """
         with self._lock:
-            children = _dearpygui.get_item_info(self)["children"][1]
+            self._unwrap()
+            children = self._children
 
             # value items don't accept the `before` argument, so a
             # reorder is necessary
             item = self.create_value_item()
             children.insert(0, item)
+            if (values := self._values) is not None:
+                values.insert(0, value)
             _dearpygui.reorder_items(self, 1, children)  # pyrefly: ignore [bad-argument-type]
             self._position = 0
             self.on_value_create(self, item)
@@ -490,51 +887,76 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
             self.update_value_item(item, value)
             self.on_value_update(self, item, value)
 
-            self._trunc(-1, children)
+            self._trunc(-1)
+
+        redraw.mark()
 
     def extend(self, values: typing.Iterable[V], /) -> None:
         """Create new value items equal to the number of strings in
         *value* and update the value of each.
 
-        Emits an "on create" and "on update" event for every item created.
+        Items are created in bulk (see :py:meth:`create_value_items()`),
+        emitting an "on values create" event. In :py:attr:`ring` mode, values
+        that don't fit in the array update the oldest items instead, emitting
+        an "on update" event for each.
         """
-        created_callback = self.on_value_create
-        updated_callback = self.on_value_update
+        if isinstance(values, Buffer):
+            values = self._unpack(values)
+        elif not isinstance(values, (list, tuple)):
+            values = list(values)
+
         with self._lock:
-            for s in values:
-                item = self.create_value_item()
+            children = self._children
+
+            if self._ring and (maxlen := self._maxlen):
+                self._trunc(0)
+                recycled = values[maxlen - len(children):]
+                values   = values[:len(values) - len(recycled)]
+            else:
+                recycled = ()
+
+            if values:
+                items = self.create_value_items(values)
+                children.extend(items)
+                if (mirrored := self._values) is not None:
+                    mirrored.extend(values)
                 self._position = -1
-                created_callback(self, item)
-                self.update_value_item(item, s)
-                updated_callback(self, item, s)
+                self._emit_values_create(items, values)
+
+            for s in recycled:
+                self._recycle(s)
 
-            if self._maxlen is not None:  # avoid DLL call if possible
-                self._trunc(0, _dearpygui.get_item_info(self)["children"][1])
+            self._trunc(0)
+
+        redraw.mark()
 
     def extendleft(self, values: typing.Iterable[V], /) -> None:
         """Create new value items equal to the number of strings in
         *value* and update the value of each.
 
-        Emits an "on create" and "on update" event for every item created.
+        Items are created in bulk (see :py:meth:`create_value_items()`),
+        emitting an "on values create" event.
         """
-        created_callback = self.on_value_create
-        updated_callback = self.on_value_update
         with self._lock:
-            children = _dearpygui.get_item_info(self)["children"][1]
+            self._unwrap()
+            children = self._children
 
             if not hasattr(values, '__getitem__'):
                 values = tuple(values)
+            if not values:
+                return
 
-            items = [self.create_value_item() for _ in values]
+            items = self.create_value_items(values)
             children[:0] = items
+            if (mirrored := self._values) is not None:
+                mirrored[:0] = values
 
             _dearpygui.reorder_items(self, 1, children)
 
-            for i, (item, value) in enumerate(zip(items, values)):
-                self._position = i
-                created_callback(self, item)
-                self.update_value_item(item, value)
-                updated_callback(self, item, value)
+            self._position = len(items) - 1
+            self._emit_values_create(items, values)
+
+        redraw.mark()
 
     __add__ = __iadd__ = extend  # type: ignore
 
@@ -545,37 +967,32 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
         negative value rotates to the left.
 
         Emits an "on reorder" event if the new order differs from the
-        previous order.
+        previous order. Only the logical order of a full :py:attr:`ring` is
+        changed.
         """
-        if not offset:
-            return
-
-        if offset < 0:
-            cw = False
-            offset *= cw
-        else:
-            cw = True
-
         with self._lock:
-            children = _dearpygui.get_item_info(self)["children"][1]
-            length   = len(children)
+            children = self._children
+            if not children:
+                return
 
-            offset %= length  # eliminate wrap-around
+            # a left rotation is a right rotation by the remainder
+            offset %= len(children)
             if not offset:
                 return
 
-            if cw:
-                idst = slice(None, 0)
-                isrc = slice(length-offset, length+1)
-            else:
-                idst = slice(-1, None)
-                isrc = slice(0, offset)
+            if self._ring and len(children) == self._maxlen:
+                self._head = (self._head - offset) % len(children)
+                self.on_value_reorder(self, self.items)
+                return
 
-            children[idst] = children[isrc]
-            del children[isrc]
+            self._unwrap()
+            values = self._values
+            self._reorder(
+                children[-offset:] + children[:-offset],
+                None if values is None else values[-offset:] + values[:-offset],
+            )
 
-            _dearpygui.reorder_items(self, 1, children)
-            self.on_value_reorder(self, children)
+        redraw.mark()
 
     def remove(self, value: V, /) -> None:
         """Destroy the first item in child slot 1 with a value equal to
@@ -583,19 +1000,22 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
 
         Emits an "on delete" event.
         """
-        get_value = _dearpygui.get_value
-        callback  = self.on_value_delete
-
         with self._lock:
-            children = _dearpygui.get_item_info(self)["children"][1]
+            self._unwrap()
+            try:
+                index = self.index(value)
+            except ValueError:
+                raise ValueError(f"{value!r} not in self") from None
 
-            for item in children:
-                if get_value(item) == value:
-                    callback(self, item)
-                    self.delete_value_item(item)
-                    break
+            item = self._children[index]
+            self.on_value_delete(self, item)
+            self.delete_value_item(item)
 
-        raise ValueError(f"{value!r} not in self")
+            del self._children[index]
+            if (values := self._values) is not None:
+                del values[index]
+
+        redraw.mark()
 
     def pop(self, index: typing.SupportsIndex = -1, /) -> V:
         """Return the value of the item in child slot 1 at *index*, deleting
@@ -604,12 +1024,18 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
         Emits an "on delete" event.
         """
         with self._lock:
-            item = _dearpygui.get_item_info(self)["children"][1][index]
+            self._unwrap()
+            item = self._children[index]
             self.on_value_delete(self, item)
 
-            value = _dearpygui.get_value(item)
+            if (values := self._values) is not None:
+                value = values.pop(index)
+            else:
+                value = _dearpygui.get_value(item)
             self.delete_value_item(item)
+            del self._children[index]
 
+        redraw.mark()
         return value
 
     def popleft(self, /) -> V:
@@ -633,19 +1059,25 @@ class ValueArray[V = typing.Any, U = typing.Any](appitem.CompositeItem, appitem.
         callback = self.on_value_delete
         with self._lock:
             if len(callback):
-                for item in _dearpygui.get_item_info(self)["children"][1]:
+                for item in self._children.copy():
                     callback(self, item)
             self.delete_value_item()
+            self._head = 0
+            self._children.clear()
+            if (values := self._values) is not None:
+                values.clear()
+
+        redraw.mark()
 
 def add_string_value_array[U](iterable: typing.Iterable[str], /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[str, U]:
     """Create and return a new :py:class:`ValueArray` item/interface."""
     return ValueArray.create(iterable, command=_dearpygui.add_string_value, label=label, use_internal_label=use_internal_label, tag=tag, user_data=user_data, **kwargs)
 
-def add_int_value_array[U](iterable: typing.Iterable[int], /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[int, U]:
+def add_int_value_array[U](iterable: typing.Iterable[int] | Buffer, /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[int, U]:
     """Create and return a new :py:class:`ValueArray` item/interface."""
     return ValueArray.create(iterable, command=_dearpygui.add_int_value, label=label, use_internal_label=use_internal_label, tag=tag, user_data=user_data, **kwargs)
 
-def add_int4_value_array[U](iterable: typing.Iterable[typing.Sequence[int]], /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[typing.Sequence[int], U]:
+def add_int4_value_array[U](iterable: typing.Iterable[typing.Sequence[int]] | Buffer, /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[typing.Sequence[int], U]:
     """Create and return a new :py:class:`ValueArray` item/interface."""
     return ValueArray.create(iterable, command=_dearpygui.add_int4_value, label=label, use_internal_label=use_internal_label, tag=tag, user_data=user_data, **kwargs)
 
@@ -657,27 +1089,27 @@ def add_color_value_array[U](iterable: typing.Iterable[Array[int | float, typing
     """Create and return a new :py:class:`ValueArray` item/interface."""
     return ValueArray.create(iterable, command=_dearpygui.add_color_value, label=label, use_internal_label=use_internal_label, tag=tag, user_data=user_data, **kwargs)
 
-def add_float_value_array[U](iterable: typing.Iterable[float], /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[float, U]:
+def add_float_value_array[U](iterable: typing.Iterable[float] | Buffer, /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[float, U]:
     """Create and return a new :py:class:`ValueArray` item/interface."""
     return ValueArray.create(iterable, command=_dearpygui.add_float_value, label=label, use_internal_label=use_internal_label, tag=tag, user_data=user_data, **kwargs)
 
-def add_float4_value_array[U](iterable: typing.Iterable[Array[float, typing.Literal[4]]], /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[Array[float, typing.Literal[4]], U]:
+def add_float4_value_array[U](iterable: typing.Iterable[Array[float, typing.Literal[4]]] | Buffer, /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[Array[float, typing.Literal[4]], U]:
     """Create and return a new :py:class:`ValueArray` item/interface."""
     return ValueArray.create(iterable, command=_dearpygui.add_float4_value, label=label, use_internal_label=use_internal_label, tag=tag, user_data=user_data, **kwargs)
 
-def add_floatvect_value_array[U](iterable: typing.Iterable[typing.Sequence[float]], /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[typing.Sequence[float], U]:
+def add_floatvect_value_array[U](iterable: typing.Iterable[typing.Sequence[float]] | Buffer, /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[typing.Sequence[float], U]:
     """Create and return a new :py:class:`ValueArray` item/interface."""
     return ValueArray.create(iterable, command=_dearpygui.add_float_vect_value, label=label, use_internal_label=use_internal_label, tag=tag, user_data=user_data, **kwargs)
 
-def add_double_value_array[U](iterable: typing.Iterable[float], /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[float, U]:
+def add_double_value_array[U](iterable: typing.Iterable[float] | Buffer, /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[float, U]:
     """Create and return a new :py:class:`ValueArray` item/interface."""
     return ValueArray.create(iterable, command=_dearpygui.add_double_value, label=label, use_internal_label=use_internal_label, tag=tag, user_data=user_data, **kwargs)
 
-def add_double4_value_array[U](iterable: typing.Iterable[Array[float, typing.Literal[4]]], /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[Array[float, typing.Literal[4]], U]:
+def add_double4_value_array[U](iterable: typing.Iterable[Array[float, typing.Literal[4]]] | Buffer, /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[Array[float, typing.Literal[4]], U]:
     """Create and return a new :py:class:`ValueArray` item/interface."""
     return ValueArray.create(iterable, command=_dearpygui.add_double4_value, label=label, use_internal_label=use_internal_label, tag=tag, user_data=user_data, **kwargs)
 
-def add_series_value_array[U](iterable: typing.Iterable[typing.Sequence[float]], /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[typing.Sequence[float], U]:
+def add_series_value_array[U](iterable: typing.Iterable[typing.Sequence[float]] | Buffer, /, *, label: str | None = None, use_internal_label: bool = True, user_data: U | None = None, tag: int | str = 0, **kwargs) -> ValueArray[typing.Sequence[float], U]:
     """Create and return a new :py:class:`ValueArray` item/interface."""
     return ValueArray.create(iterable, command=_dearpygui.add_series_value, label=label, use_internal_label=use_internal_label, tag=tag, user_data=user_data, **kwargs)
 
@@ -688,8 +1120,7 @@ class StringValueArray[U = typing.Any](ValueArray[str, U]):
     :py:meth:`writelines()` methods, allowing it to be used as a
     writable stream in many contexts.
     """
-    def create_value_item(self, /) -> Item:
-        return _dearpygui.add_string_value(parent=self)
+    _command = _dearpygui.add_string_value
 
     def write(self, s: str, /) -> int:
         """Evaluate `self.append(s)`, then return the length of the
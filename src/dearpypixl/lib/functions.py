@@ -1,5 +1,6 @@
 import dearpypixl.core.appitem as _appitem
 import dearpypixl.core.metautil as _metautil
+import dearpypixl.core.tree as _tree
 from dearpypixl.core.errors import DearPyGuiError
 
 from dearpygui import  _dearpygui
@@ -275,7 +276,7 @@ def get_interface_type(item: Item, /) -> type[_appitem.ChildItem | _appitem.Cont
 
 @_typing.overload
 def get_root_parent(item: int | str, /) -> tuple[str, int | str | None]: ...  # pyright: ignore[reportInconsistentOverload]  # ty:ignore[invalid-overload]
-def get_root_parent(item, /, *, __func=_dearpygui.get_item_info):
+def get_root_parent(item, /, *, __func=_tree.get_item_info):
     """Get the type name and identifier of *item*'s top-level
     parent. If *item* is a top-level container, return its type
     name and identifier instead.
@@ -312,7 +313,7 @@ def get_root_parent(item, /, *, __func=_dearpygui.get_item_info):
 
 @_typing.overload
 def iter_item_parents(item: int | str, /) -> _typing.Iterator[tuple[str, int | str]]: ...  # pyright: ignore[reportInconsistentOverload]  # ty:ignore[invalid-overload]
-def iter_item_parents(item: int | str, /, *, __func=_dearpygui.get_item_info) -> _typing.Iterator[tuple[str, int | str]]:
+def iter_item_parents(item: int | str, /, *, __func=_tree.get_item_info) -> _typing.Iterator[tuple[str, int | str]]:
     """Return an iterator that yields the direct parent of the most
     recent item it outputs, starting from *item*. The iterator is
     exhausted once it yields the top-level parent of *item*. If *item*
@@ -356,23 +357,14 @@ def get_item_index(item: int | str, /) -> int:
     :raises `SystemError`: DearPyGui-related error.
     """
     try:
-        if isinstance(item, str):
-            tag = _dearpygui.get_alias_id(item)
-        else:
-            tag = item
-
-        item_info = _dearpygui.get_item_info(tag)
-
-        parent = item_info["parent"]
-        if not parent:
-            raise ValueError(f"item {item!r} is not a child item")
-
-        slot_index = item_info["target"]
-        child_slot = _dearpygui.get_item_info(parent)["children"][slot_index]
+        parent, _, index = _tree.get_item_position(item)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
-    return child_slot.index(tag)
+    if not parent:
+        raise ValueError(f"item {item!r} is not a child item")
+
+    return index
 
 
 def insert_item(index: _typing.SupportsIndex, item: int | str, /, *, parent: int | str = 0) -> None:
@@ -397,14 +389,14 @@ def insert_item(index: _typing.SupportsIndex, item: int | str, /, *, parent: int
     :raises `SystemError`: DearPyGui-related error.
     """
     try:
-        item_info = _dearpygui.get_item_info(item)
+        item_info = _tree.get_item_info(item)
 
         old_parent = item_info["parent"]
         if not old_parent:
             raise ValueError(f"item {item!r} is not a child item")
 
         slot_index = item_info["target"]
-        child_slot = _dearpygui.get_item_info(parent or old_parent)["children"][slot_index]
+        child_slot = _tree.get_item_children(parent or old_parent, slot_index)
 
         _dearpygui.move_item(item, parent=parent, before=child_slot[index])
     except SystemError as e:
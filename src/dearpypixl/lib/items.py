@@ -9,6 +9,7 @@
 #############################################################
 from dearpypixl.core.appitem import *
 from dearpypixl.core.errors import DearPyGuiError
+from dearpypixl.core import cache as _cache
 
 from dearpygui import dearpygui, _dearpygui
 
@@ -20,7 +21,7 @@ from dearpygui import dearpygui, _dearpygui
 # state properties
 
 @property
-def _property__activated(self, /, *, __func=_dearpygui.get_item_state):
+def _property__activated(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["activated"]
     except KeyError:
@@ -29,7 +30,7 @@ def _property__activated(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__active(self, /, *, __func=_dearpygui.get_item_state):
+def _property__active(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["active"]
     except KeyError:
@@ -38,7 +39,7 @@ def _property__active(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__clicked(self, /, *, __func=_dearpygui.get_item_state):
+def _property__clicked(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["clicked"]
     except KeyError:
@@ -47,7 +48,7 @@ def _property__clicked(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__content_region_avail(self, /, *, __func=_dearpygui.get_item_state):
+def _property__content_region_avail(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["content_region_avail"]
     except KeyError:
@@ -56,7 +57,7 @@ def _property__content_region_avail(self, /, *, __func=_dearpygui.get_item_state
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__deactivated(self, /, *, __func=_dearpygui.get_item_state):
+def _property__deactivated(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["deactivated"]
     except KeyError:
@@ -65,7 +66,7 @@ def _property__deactivated(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__deactivated_after_edit(self, /, *, __func=_dearpygui.get_item_state):
+def _property__deactivated_after_edit(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["deactivated_after_edit"]
     except KeyError:
@@ -74,7 +75,7 @@ def _property__deactivated_after_edit(self, /, *, __func=_dearpygui.get_item_sta
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__edited(self, /, *, __func=_dearpygui.get_item_state):
+def _property__edited(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["edited"]
     except KeyError:
@@ -83,7 +84,7 @@ def _property__edited(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__focused(self, /, *, __func=_dearpygui.get_item_state):
+def _property__focused(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["focused"]
     except KeyError:
@@ -92,7 +93,7 @@ def _property__focused(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__hovered(self, /, *, __func=_dearpygui.get_item_state):
+def _property__hovered(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["hovered"]
     except KeyError:
@@ -101,7 +102,7 @@ def _property__hovered(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__is_scrolling(self, /, *, __func=_dearpygui.get_item_state):
+def _property__is_scrolling(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["is_scrolling"]
     except KeyError:
@@ -110,7 +111,7 @@ def _property__is_scrolling(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__left_clicked(self, /, *, __func=_dearpygui.get_item_state):
+def _property__left_clicked(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["left_clicked"]
     except KeyError:
@@ -119,7 +120,7 @@ def _property__left_clicked(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__middle_clicked(self, /, *, __func=_dearpygui.get_item_state):
+def _property__middle_clicked(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["middle_clicked"]
     except KeyError:
@@ -128,7 +129,7 @@ def _property__middle_clicked(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__pos(self, /, *, __func=_dearpygui.get_item_state):
+def _property__pos(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["pos"]
     except KeyError:
@@ -136,20 +137,20 @@ def _property__pos(self, /, *, __func=_dearpygui.get_item_state):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__pos.setter
-def _property__pos(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__pos(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, pos=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__pos.deleter
-def _property__pos(self, /, *, __func=_dearpygui.configure_item):
+def _property__pos(self, /, *, __func=_cache.configure_item):
     try:
         __func(self, pos=())
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__rect_max(self, /, *, __func=_dearpygui.get_item_state):
+def _property__rect_max(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["rect_max"]
     except KeyError:
@@ -158,7 +159,7 @@ def _property__rect_max(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__rect_min(self, /, *, __func=_dearpygui.get_item_state):
+def _property__rect_min(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["rect_min"]
     except KeyError:
@@ -167,7 +168,7 @@ def _property__rect_min(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__rect_size(self, /, *, __func=_dearpygui.get_item_state):
+def _property__rect_size(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["rect_size"]
     except KeyError:
@@ -176,7 +177,7 @@ def _property__rect_size(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__resized(self, /, *, __func=_dearpygui.get_item_state):
+def _property__resized(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["resized"]
     except KeyError:
@@ -185,7 +186,7 @@ def _property__resized(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__right_clicked(self, /, *, __func=_dearpygui.get_item_state):
+def _property__right_clicked(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["right_clicked"]
     except KeyError:
@@ -194,7 +195,7 @@ def _property__right_clicked(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__scroll_max(self, /, *, __func=_dearpygui.get_item_state):
+def _property__scroll_max(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["scroll_max"]
     except KeyError:
@@ -203,7 +204,7 @@ def _property__scroll_max(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__scroll_pos(self, /, *, __func=_dearpygui.get_item_state):
+def _property__scroll_pos(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["scroll_pos"]
     except KeyError:
@@ -212,7 +213,7 @@ def _property__scroll_pos(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__scrolled(self, /, *, __func=_dearpygui.get_item_state):
+def _property__scrolled(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["scrolled"]
     except KeyError:
@@ -221,7 +222,7 @@ def _property__scrolled(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__toggled_open(self, /, *, __func=_dearpygui.get_item_state):
+def _property__toggled_open(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["toggled_open"]
     except KeyError:
@@ -230,7 +231,7 @@ def _property__toggled_open(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__visible(self, /, *, __func=_dearpygui.get_item_state):
+def _property__visible(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["visible"]
     except KeyError:
@@ -239,14 +240,14 @@ def _property__visible(self, /, *, __func=_dearpygui.get_item_state):
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__rect_min2(self, /, *, __func=_dearpygui.get_item_state):
+def _property__rect_min2(self, /, *, __func=_cache.get_item_state):
     try:
         return __func(self)["pos"]
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__rect_max2(self, /, *, __func=_dearpygui.get_item_state):
+def _property__rect_max2(self, /, *, __func=_cache.get_item_state):
     try:
         state = __func(self)
     except SystemError as e:
@@ -302,7 +303,7 @@ def _property__y_scroll_pos(self, value, /, *, __func=dearpygui.set_y_scroll) ->
 # configuration properties
 
 @property
-def _property__accept_empty_input(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__accept_empty_input(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["accept_empty_input"]
     except KeyError:
@@ -310,14 +311,14 @@ def _property__accept_empty_input(self, /, *, __func=_dearpygui.get_item_configu
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__accept_empty_input.setter
-def _property__accept_empty_input(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__accept_empty_input(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, accept_empty_input=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__alpha_bar(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__alpha_bar(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["alpha_bar"]
     except KeyError:
@@ -325,14 +326,14 @@ def _property__alpha_bar(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__alpha_bar.setter
-def _property__alpha_bar(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__alpha_bar(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, alpha_bar=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__alpha_preview(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__alpha_preview(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["alpha_preview"]
     except KeyError:
@@ -340,14 +341,14 @@ def _property__alpha_preview(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__alpha_preview.setter
-def _property__alpha_preview(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__alpha_preview(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, alpha_preview=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__always_auto_resize(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__always_auto_resize(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["always_auto_resize"]
     except KeyError:
@@ -355,14 +356,14 @@ def _property__always_auto_resize(self, /, *, __func=_dearpygui.get_item_configu
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__always_auto_resize.setter
-def _property__always_auto_resize(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__always_auto_resize(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, always_auto_resize=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__always_overwrite(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__always_overwrite(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["always_overwrite"]
     except KeyError:
@@ -370,14 +371,14 @@ def _property__always_overwrite(self, /, *, __func=_dearpygui.get_item_configura
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__always_overwrite.setter
-def _property__always_overwrite(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__always_overwrite(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, always_overwrite=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__always_use_window_padding(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__always_use_window_padding(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["always_use_window_padding"]
     except KeyError:
@@ -385,14 +386,14 @@ def _property__always_use_window_padding(self, /, *, __func=_dearpygui.get_item_
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__always_use_window_padding.setter
-def _property__always_use_window_padding(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__always_use_window_padding(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, always_use_window_padding=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__angle(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__angle(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["angle"]
     except KeyError:
@@ -400,14 +401,14 @@ def _property__angle(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__angle.setter
-def _property__angle(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__angle(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, angle=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__angled_header(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__angled_header(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["angled_header"]
     except KeyError:
@@ -415,14 +416,14 @@ def _property__angled_header(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__angled_header.setter
-def _property__angled_header(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__angled_header(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, angled_header=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__arrow(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__arrow(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["arrow"]
     except KeyError:
@@ -430,14 +431,14 @@ def _property__arrow(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__arrow.setter
-def _property__arrow(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__arrow(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, arrow=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__attribute_type(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__attribute_type(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["attribute_type"]
     except KeyError:
@@ -445,14 +446,14 @@ def _property__attribute_type(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__attribute_type.setter
-def _property__attribute_type(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__attribute_type(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, attribute_type=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__auto_fit(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__auto_fit(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["auto_fit"]
     except KeyError:
@@ -460,14 +461,14 @@ def _property__auto_fit(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__auto_fit.setter
-def _property__auto_fit(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__auto_fit(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, auto_fit=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__auto_resize_x(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__auto_resize_x(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["auto_resize_x"]
     except KeyError:
@@ -475,14 +476,14 @@ def _property__auto_resize_x(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__auto_resize_x.setter
-def _property__auto_resize_x(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__auto_resize_x(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, auto_resize_x=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__auto_resize_y(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__auto_resize_y(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["auto_resize_y"]
     except KeyError:
@@ -490,14 +491,14 @@ def _property__auto_resize_y(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__auto_resize_y.setter
-def _property__auto_resize_y(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__auto_resize_y(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, auto_resize_y=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__auto_rounding(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__auto_rounding(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["auto_rounding"]
     except KeyError:
@@ -505,14 +506,14 @@ def _property__auto_rounding(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__auto_rounding.setter
-def _property__auto_rounding(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__auto_rounding(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, auto_rounding=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__auto_select_all(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__auto_select_all(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["auto_select_all"]
     except KeyError:
@@ -520,14 +521,14 @@ def _property__auto_select_all(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__auto_select_all.setter
-def _property__auto_select_all(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__auto_select_all(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, auto_select_all=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__autosize(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__autosize(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["autosize"]
     except KeyError:
@@ -535,14 +536,14 @@ def _property__autosize(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__autosize.setter
-def _property__autosize(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__autosize(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, autosize=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__autosize_x(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__autosize_x(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["autosize_x"]
     except KeyError:
@@ -550,14 +551,14 @@ def _property__autosize_x(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__autosize_x.setter
-def _property__autosize_x(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__autosize_x(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, autosize_x=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__autosize_y(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__autosize_y(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["autosize_y"]
     except KeyError:
@@ -565,14 +566,14 @@ def _property__autosize_y(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__autosize_y.setter
-def _property__autosize_y(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__autosize_y(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, autosize_y=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__background_color(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__background_color(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["background_color"]
     except KeyError:
@@ -580,14 +581,14 @@ def _property__background_color(self, /, *, __func=_dearpygui.get_item_configura
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__background_color.setter
-def _property__background_color(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__background_color(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, background_color=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__bar_scale(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__bar_scale(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["bar_scale"]
     except KeyError:
@@ -595,14 +596,14 @@ def _property__bar_scale(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__bar_scale.setter
-def _property__bar_scale(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__bar_scale(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, bar_scale=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__bear_color(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__bear_color(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["bear_color"]
     except KeyError:
@@ -610,14 +611,14 @@ def _property__bear_color(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__bear_color.setter
-def _property__bear_color(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__bear_color(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, bear_color=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__bins(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__bins(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["bins"]
     except KeyError:
@@ -625,14 +626,14 @@ def _property__bins(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__bins.setter
-def _property__bins(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__bins(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, bins=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__border(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__border(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["border"]
     except KeyError:
@@ -640,14 +641,14 @@ def _property__border(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__border.setter
-def _property__border(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__border(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, border=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__border_color(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__border_color(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["border_color"]
     except KeyError:
@@ -655,14 +656,14 @@ def _property__border_color(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__border_color.setter
-def _property__border_color(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__border_color(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, border_color=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__borders_innerH(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__borders_innerH(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["borders_innerH"]
     except KeyError:
@@ -670,14 +671,14 @@ def _property__borders_innerH(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__borders_innerH.setter
-def _property__borders_innerH(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__borders_innerH(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, borders_innerH=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__borders_innerV(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__borders_innerV(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["borders_innerV"]
     except KeyError:
@@ -685,14 +686,14 @@ def _property__borders_innerV(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__borders_innerV.setter
-def _property__borders_innerV(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__borders_innerV(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, borders_innerV=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__borders_outerH(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__borders_outerH(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["borders_outerH"]
     except KeyError:
@@ -700,14 +701,14 @@ def _property__borders_outerH(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__borders_outerH.setter
-def _property__borders_outerH(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__borders_outerH(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, borders_outerH=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__borders_outerV(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__borders_outerV(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["borders_outerV"]
     except KeyError:
@@ -715,14 +716,14 @@ def _property__borders_outerV(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__borders_outerV.setter
-def _property__borders_outerV(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__borders_outerV(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, borders_outerV=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__bounds_max(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__bounds_max(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["bounds_max"]
     except KeyError:
@@ -730,14 +731,14 @@ def _property__bounds_max(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__bounds_max.setter
-def _property__bounds_max(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__bounds_max(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, bounds_max=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__bounds_min(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__bounds_min(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["bounds_min"]
     except KeyError:
@@ -745,14 +746,14 @@ def _property__bounds_min(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__bounds_min.setter
-def _property__bounds_min(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__bounds_min(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, bounds_min=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__box_select_button(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__box_select_button(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["box_select_button"]
     except KeyError:
@@ -760,14 +761,14 @@ def _property__box_select_button(self, /, *, __func=_dearpygui.get_item_configur
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__box_select_button.setter
-def _property__box_select_button(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__box_select_button(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, box_select_button=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__box_select_cancel_button(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__box_select_cancel_button(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["box_select_cancel_button"]
     except KeyError:
@@ -775,14 +776,14 @@ def _property__box_select_cancel_button(self, /, *, __func=_dearpygui.get_item_c
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__box_select_cancel_button.setter
-def _property__box_select_cancel_button(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__box_select_cancel_button(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, box_select_cancel_button=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__box_select_mod(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__box_select_mod(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["box_select_mod"]
     except KeyError:
@@ -790,14 +791,14 @@ def _property__box_select_mod(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__box_select_mod.setter
-def _property__box_select_mod(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__box_select_mod(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, box_select_mod=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__bull_color(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__bull_color(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["bull_color"]
     except KeyError:
@@ -805,14 +806,14 @@ def _property__bull_color(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__bull_color.setter
-def _property__bull_color(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__bull_color(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, bull_color=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__bullet(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__bullet(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["bullet"]
     except KeyError:
@@ -820,14 +821,14 @@ def _property__bullet(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__bullet.setter
-def _property__bullet(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__bullet(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, bullet=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__callback(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__callback(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["callback"]
     except KeyError:
@@ -835,20 +836,20 @@ def _property__callback(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__callback.setter
-def _property__callback(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__callback(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, callback=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__callback.deleter
-def _property__callback(self, /, *, __func=_dearpygui.configure_item):
+def _property__callback(self, /, *, __func=_cache.configure_item):
     try:
         __func(self, callback=None)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__cancel_callback(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__cancel_callback(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["cancel_callback"]
     except KeyError:
@@ -856,20 +857,20 @@ def _property__cancel_callback(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__cancel_callback.setter
-def _property__cancel_callback(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__cancel_callback(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, cancel_callback=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__cancel_callback.deleter
-def _property__cancel_callback(self, /, *, __func=_dearpygui.configure_item):
+def _property__cancel_callback(self, /, *, __func=_cache.configure_item):
     try:
         __func(self, cancel_callback=None)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__catch_nav_left(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__catch_nav_left(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["catch_nav_left"]
     except KeyError:
@@ -877,14 +878,14 @@ def _property__catch_nav_left(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__catch_nav_left.setter
-def _property__catch_nav_left(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__catch_nav_left(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, catch_nav_left=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__category(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__category(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["category"]
     except KeyError:
@@ -892,14 +893,14 @@ def _property__category(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__category.setter
-def _property__category(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__category(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, category=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__check(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__check(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["check"]
     except KeyError:
@@ -907,14 +908,14 @@ def _property__check(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__check.setter
-def _property__check(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__check(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, check=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__circle_count(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__circle_count(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["circle_count"]
     except KeyError:
@@ -922,14 +923,14 @@ def _property__circle_count(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__circle_count.setter
-def _property__circle_count(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__circle_count(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, circle_count=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__clamped(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__clamped(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["clamped"]
     except KeyError:
@@ -937,14 +938,14 @@ def _property__clamped(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__clamped.setter
-def _property__clamped(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__clamped(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, clamped=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__clipper(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__clipper(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["clipper"]
     except KeyError:
@@ -952,14 +953,14 @@ def _property__clipper(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__clipper.setter
-def _property__clipper(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__clipper(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, clipper=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__closable(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__closable(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["closable"]
     except KeyError:
@@ -967,14 +968,14 @@ def _property__closable(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__closable.setter
-def _property__closable(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__closable(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, closable=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__closed(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__closed(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["closed"]
     except KeyError:
@@ -982,14 +983,14 @@ def _property__closed(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__closed.setter
-def _property__closed(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__closed(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, closed=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__col_major(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__col_major(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["col_major"]
     except KeyError:
@@ -997,14 +998,14 @@ def _property__col_major(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__col_major.setter
-def _property__col_major(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__col_major(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, col_major=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__collapsed(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__collapsed(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["collapsed"]
     except KeyError:
@@ -1012,14 +1013,14 @@ def _property__collapsed(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__collapsed.setter
-def _property__collapsed(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__collapsed(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, collapsed=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__color(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__color(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["color"]
     except KeyError:
@@ -1027,14 +1028,14 @@ def _property__color(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__color.setter
-def _property__color(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__color(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, color=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__column_major(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__column_major(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["column_major"]
     except KeyError:
@@ -1042,14 +1043,14 @@ def _property__column_major(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__column_major.setter
-def _property__column_major(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__column_major(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, column_major=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__column_ratios(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__column_ratios(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["column_ratios"]
     except KeyError:
@@ -1057,14 +1058,14 @@ def _property__column_ratios(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__column_ratios.setter
-def _property__column_ratios(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__column_ratios(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, column_ratios=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__context_menu_button(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__context_menu_button(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["context_menu_button"]
     except KeyError:
@@ -1072,14 +1073,14 @@ def _property__context_menu_button(self, /, *, __func=_dearpygui.get_item_config
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__context_menu_button.setter
-def _property__context_menu_button(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__context_menu_button(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, context_menu_button=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__context_menu_in_body(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__context_menu_in_body(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["context_menu_in_body"]
     except KeyError:
@@ -1087,14 +1088,14 @@ def _property__context_menu_in_body(self, /, *, __func=_dearpygui.get_item_confi
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__context_menu_in_body.setter
-def _property__context_menu_in_body(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__context_menu_in_body(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, context_menu_in_body=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__contribute_to_bounds(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__contribute_to_bounds(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["contribute_to_bounds"]
     except KeyError:
@@ -1102,14 +1103,14 @@ def _property__contribute_to_bounds(self, /, *, __func=_dearpygui.get_item_confi
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__contribute_to_bounds.setter
-def _property__contribute_to_bounds(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__contribute_to_bounds(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, contribute_to_bounds=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__copy_contents_shortcut(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__copy_contents_shortcut(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["copy_contents_shortcut"]
     except KeyError:
@@ -1117,14 +1118,14 @@ def _property__copy_contents_shortcut(self, /, *, __func=_dearpygui.get_item_con
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__copy_contents_shortcut.setter
-def _property__copy_contents_shortcut(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__copy_contents_shortcut(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, copy_contents_shortcut=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__corner_colors(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__corner_colors(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["corner_colors"]
     except KeyError:
@@ -1132,14 +1133,14 @@ def _property__corner_colors(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__corner_colors.setter
-def _property__corner_colors(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__corner_colors(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, corner_colors=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__crosshairs(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__crosshairs(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["crosshairs"]
     except KeyError:
@@ -1147,14 +1148,14 @@ def _property__crosshairs(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__crosshairs.setter
-def _property__crosshairs(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__crosshairs(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, crosshairs=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__ctrl_enter_for_new_line(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__ctrl_enter_for_new_line(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["ctrl_enter_for_new_line"]
     except KeyError:
@@ -1162,14 +1163,14 @@ def _property__ctrl_enter_for_new_line(self, /, *, __func=_dearpygui.get_item_co
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__ctrl_enter_for_new_line.setter
-def _property__ctrl_enter_for_new_line(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__ctrl_enter_for_new_line(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, ctrl_enter_for_new_line=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__cull_mode(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__cull_mode(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["cull_mode"]
     except KeyError:
@@ -1177,14 +1178,14 @@ def _property__cull_mode(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__cull_mode.setter
-def _property__cull_mode(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__cull_mode(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, cull_mode=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__cumulative(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__cumulative(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["cumulative"]
     except KeyError:
@@ -1192,14 +1193,14 @@ def _property__cumulative(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__cumulative.setter
-def _property__cumulative(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__cumulative(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, cumulative=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__custom_text(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__custom_text(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["custom_text"]
     except KeyError:
@@ -1207,20 +1208,20 @@ def _property__custom_text(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__custom_text.setter
-def _property__custom_text(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__custom_text(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, custom_text=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__custom_text.deleter
-def _property__custom_text(self, /, *, __func=_dearpygui.configure_item):
+def _property__custom_text(self, /, *, __func=_cache.configure_item):
     try:
         __func(self, custom_text='')
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__decimal(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__decimal(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["decimal"]
     except KeyError:
@@ -1228,14 +1229,14 @@ def _property__decimal(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__decimal.setter
-def _property__decimal(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__decimal(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, decimal=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__delay(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__delay(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["delay"]
     except KeyError:
@@ -1243,14 +1244,14 @@ def _property__delay(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__delay.setter
-def _property__delay(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__delay(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, delay=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__delayed(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__delayed(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["delayed"]
     except KeyError:
@@ -1258,14 +1259,14 @@ def _property__delayed(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__delayed.setter
-def _property__delayed(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__delayed(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, delayed=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__delink_callback(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__delink_callback(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["delink_callback"]
     except KeyError:
@@ -1273,20 +1274,20 @@ def _property__delink_callback(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__delink_callback.setter
-def _property__delink_callback(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__delink_callback(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, delink_callback=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__delink_callback.deleter
-def _property__delink_callback(self, /, *, __func=_dearpygui.configure_item):
+def _property__delink_callback(self, /, *, __func=_cache.configure_item):
     try:
         __func(self, delink_callback=None)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__density(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__density(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["density"]
     except KeyError:
@@ -1294,14 +1295,14 @@ def _property__density(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__density.setter
-def _property__density(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__density(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, density=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__depth_clipping(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__depth_clipping(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["depth_clipping"]
     except KeyError:
@@ -1309,14 +1310,14 @@ def _property__depth_clipping(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__depth_clipping.setter
-def _property__depth_clipping(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__depth_clipping(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, depth_clipping=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__direction(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__direction(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["direction"]
     except KeyError:
@@ -1324,14 +1325,14 @@ def _property__direction(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__direction.setter
-def _property__direction(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__direction(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, direction=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__directory_selector(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__directory_selector(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["directory_selector"]
     except KeyError:
@@ -1339,14 +1340,14 @@ def _property__directory_selector(self, /, *, __func=_dearpygui.get_item_configu
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__directory_selector.setter
-def _property__directory_selector(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__directory_selector(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, directory_selector=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__disable_popup_close(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__disable_popup_close(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["disable_popup_close"]
     except KeyError:
@@ -1354,14 +1355,14 @@ def _property__disable_popup_close(self, /, *, __func=_dearpygui.get_item_config
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__disable_popup_close.setter
-def _property__disable_popup_close(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__disable_popup_close(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, disable_popup_close=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__display_hex(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__display_hex(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["display_hex"]
     except KeyError:
@@ -1369,14 +1370,14 @@ def _property__display_hex(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__display_hex.setter
-def _property__display_hex(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__display_hex(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, display_hex=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__display_hsv(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__display_hsv(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["display_hsv"]
     except KeyError:
@@ -1384,14 +1385,14 @@ def _property__display_hsv(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__display_hsv.setter
-def _property__display_hsv(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__display_hsv(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, display_hsv=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__display_mode(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__display_mode(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["display_mode"]
     except KeyError:
@@ -1399,14 +1400,14 @@ def _property__display_mode(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__display_mode.setter
-def _property__display_mode(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__display_mode(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, display_mode=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__display_rgb(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__display_rgb(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["display_rgb"]
     except KeyError:
@@ -1414,14 +1415,14 @@ def _property__display_rgb(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__display_rgb.setter
-def _property__display_rgb(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__display_rgb(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, display_rgb=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__display_type(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__display_type(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["display_type"]
     except KeyError:
@@ -1429,14 +1430,14 @@ def _property__display_type(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__display_type.setter
-def _property__display_type(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__display_type(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, display_type=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__drag_callback(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__drag_callback(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["drag_callback"]
     except KeyError:
@@ -1444,20 +1445,20 @@ def _property__drag_callback(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__drag_callback.setter
-def _property__drag_callback(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__drag_callback(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, drag_callback=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__drag_callback.deleter
-def _property__drag_callback(self, /, *, __func=_dearpygui.configure_item):
+def _property__drag_callback(self, /, *, __func=_cache.configure_item):
     try:
         __func(self, drag_callback=None)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__drag_data(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__drag_data(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["drag_data"]
     except KeyError:
@@ -1465,14 +1466,14 @@ def _property__drag_data(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__drag_data.setter
-def _property__drag_data(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__drag_data(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, drag_data=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__draggable(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__draggable(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["draggable"]
     except KeyError:
@@ -1480,14 +1481,14 @@ def _property__draggable(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__draggable.setter
-def _property__draggable(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__draggable(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, draggable=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__draw_selected_overline(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__draw_selected_overline(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["draw_selected_overline"]
     except KeyError:
@@ -1495,14 +1496,14 @@ def _property__draw_selected_overline(self, /, *, __func=_dearpygui.get_item_con
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__draw_selected_overline.setter
-def _property__draw_selected_overline(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__draw_selected_overline(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, draw_selected_overline=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__drop_callback(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__drop_callback(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["drop_callback"]
     except KeyError:
@@ -1510,20 +1511,20 @@ def _property__drop_callback(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__drop_callback.setter
-def _property__drop_callback(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__drop_callback(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, drop_callback=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__drop_callback.deleter
-def _property__drop_callback(self, /, *, __func=_dearpygui.configure_item):
+def _property__drop_callback(self, /, *, __func=_cache.configure_item):
     try:
         __func(self, drop_callback=None)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__drop_data(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__drop_data(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["drop_data"]
     except KeyError:
@@ -1531,14 +1532,14 @@ def _property__drop_data(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__drop_data.setter
-def _property__drop_data(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__drop_data(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, drop_data=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__elide_left(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__elide_left(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["elide_left"]
     except KeyError:
@@ -1546,14 +1547,14 @@ def _property__elide_left(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__elide_left.setter
-def _property__elide_left(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__elide_left(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, elide_left=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__enabled(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__enabled(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["enabled"]
     except KeyError:
@@ -1561,14 +1562,14 @@ def _property__enabled(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__enabled.setter
-def _property__enabled(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__enabled(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, enabled=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__enabled_state(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__enabled_state(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["enabled_state"]
     except KeyError:
@@ -1576,14 +1577,14 @@ def _property__enabled_state(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__enabled_state.setter
-def _property__enabled_state(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__enabled_state(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, enabled_state=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__equal_aspects(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__equal_aspects(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["equal_aspects"]
     except KeyError:
@@ -1591,14 +1592,14 @@ def _property__equal_aspects(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__equal_aspects.setter
-def _property__equal_aspects(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__equal_aspects(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, equal_aspects=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__escape_clears_all(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__escape_clears_all(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["escape_clears_all"]
     except KeyError:
@@ -1606,14 +1607,14 @@ def _property__escape_clears_all(self, /, *, __func=_dearpygui.get_item_configur
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__escape_clears_all.setter
-def _property__escape_clears_all(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__escape_clears_all(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, escape_clears_all=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__event_type(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__event_type(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["event_type"]
     except KeyError:
@@ -1621,14 +1622,14 @@ def _property__event_type(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__event_type.setter
-def _property__event_type(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__event_type(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, event_type=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__file_count(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__file_count(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["file_count"]
     except KeyError:
@@ -1636,14 +1637,14 @@ def _property__file_count(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__file_count.setter
-def _property__file_count(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__file_count(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, file_count=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__fill(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__fill(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["fill"]
     except KeyError:
@@ -1651,14 +1652,14 @@ def _property__fill(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__fill.setter
-def _property__fill(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__fill(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, fill=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__filter_key(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__filter_key(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["filter_key"]
     except KeyError:
@@ -1666,20 +1667,20 @@ def _property__filter_key(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__filter_key.setter
-def _property__filter_key(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__filter_key(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, filter_key=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__filter_key.deleter
-def _property__filter_key(self, /, *, __func=_dearpygui.configure_item):
+def _property__filter_key(self, /, *, __func=_cache.configure_item):
     try:
         __func(self, filter_key='')
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__fit_button(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__fit_button(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["fit_button"]
     except KeyError:
@@ -1687,14 +1688,14 @@ def _property__fit_button(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__fit_button.setter
-def _property__fit_button(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__fit_button(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, fit_button=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__fit_width(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__fit_width(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["fit_width"]
     except KeyError:
@@ -1702,14 +1703,14 @@ def _property__fit_width(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__fit_width.setter
-def _property__fit_width(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__fit_width(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, fit_width=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__flattened_navigation(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__flattened_navigation(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["flattened_navigation"]
     except KeyError:
@@ -1717,14 +1718,14 @@ def _property__flattened_navigation(self, /, *, __func=_dearpygui.get_item_confi
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__flattened_navigation.setter
-def _property__flattened_navigation(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__flattened_navigation(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, flattened_navigation=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__foreground_grid(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__foreground_grid(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["foreground_grid"]
     except KeyError:
@@ -1732,14 +1733,14 @@ def _property__foreground_grid(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__foreground_grid.setter
-def _property__foreground_grid(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__foreground_grid(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, foreground_grid=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__format(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__format(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["format"]
     except KeyError:
@@ -1747,14 +1748,14 @@ def _property__format(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__format.setter
-def _property__format(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__format(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, format=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__frame_style(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__frame_style(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["frame_style"]
     except KeyError:
@@ -1762,14 +1763,14 @@ def _property__frame_style(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__frame_style.setter
-def _property__frame_style(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__frame_style(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, frame_style=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__freeze_columns(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__freeze_columns(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["freeze_columns"]
     except KeyError:
@@ -1777,14 +1778,14 @@ def _property__freeze_columns(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__freeze_columns.setter
-def _property__freeze_columns(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__freeze_columns(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, freeze_columns=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__freeze_rows(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__freeze_rows(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["freeze_rows"]
     except KeyError:
@@ -1792,14 +1793,14 @@ def _property__freeze_rows(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__freeze_rows.setter
-def _property__freeze_rows(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__freeze_rows(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, freeze_rows=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__front(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__front(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["front"]
     except KeyError:
@@ -1807,14 +1808,14 @@ def _property__front(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__front.setter
-def _property__front(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__front(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, front=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__group_width(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__group_width(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["group_width"]
     except KeyError:
@@ -1822,14 +1823,14 @@ def _property__group_width(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__group_width.setter
-def _property__group_width(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__group_width(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, group_width=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__header_row(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__header_row(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["header_row"]
     except KeyError:
@@ -1837,14 +1838,14 @@ def _property__header_row(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__header_row.setter
-def _property__header_row(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__header_row(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, header_row=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__height(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__height(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["height"]
     except KeyError:
@@ -1852,14 +1853,14 @@ def _property__height(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__height.setter
-def _property__height(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__height(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, height=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__height_mode(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__height_mode(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["height_mode"]
     except KeyError:
@@ -1867,14 +1868,14 @@ def _property__height_mode(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__height_mode.setter
-def _property__height_mode(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__height_mode(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, height_mode=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__hexadecimal(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__hexadecimal(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["hexadecimal"]
     except KeyError:
@@ -1882,14 +1883,14 @@ def _property__hexadecimal(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__hexadecimal.setter
-def _property__hexadecimal(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__hexadecimal(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, hexadecimal=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__hide_on_activity(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__hide_on_activity(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["hide_on_activity"]
     except KeyError:
@@ -1897,14 +1898,14 @@ def _property__hide_on_activity(self, /, *, __func=_dearpygui.get_item_configura
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__hide_on_activity.setter
-def _property__hide_on_activity(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__hide_on_activity(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, hide_on_activity=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__hideable(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__hideable(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["hideable"]
     except KeyError:
@@ -1912,14 +1913,14 @@ def _property__hideable(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__hideable.setter
-def _property__hideable(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__hideable(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, hideable=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__hint(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__hint(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["hint"]
     except KeyError:
@@ -1927,20 +1928,20 @@ def _property__hint(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__hint.setter
-def _property__hint(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__hint(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, hint=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__hint.deleter
-def _property__hint(self, /, *, __func=_dearpygui.configure_item):
+def _property__hint(self, /, *, __func=_cache.configure_item):
     try:
         __func(self, hint='')
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__histogram(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__histogram(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["histogram"]
     except KeyError:
@@ -1948,14 +1949,14 @@ def _property__histogram(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__histogram.setter
-def _property__histogram(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__histogram(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, histogram=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__horizontal(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__horizontal(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["horizontal"]
     except KeyError:
@@ -1963,14 +1964,14 @@ def _property__horizontal(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__horizontal.setter
-def _property__horizontal(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__horizontal(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, horizontal=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__horizontal_mod(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__horizontal_mod(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["horizontal_mod"]
     except KeyError:
@@ -1978,14 +1979,14 @@ def _property__horizontal_mod(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__horizontal_mod.setter
-def _property__horizontal_mod(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__horizontal_mod(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, horizontal_mod=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__horizontal_scrollbar(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__horizontal_scrollbar(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["horizontal_scrollbar"]
     except KeyError:
@@ -1993,14 +1994,14 @@ def _property__horizontal_scrollbar(self, /, *, __func=_dearpygui.get_item_confi
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__horizontal_scrollbar.setter
-def _property__horizontal_scrollbar(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__horizontal_scrollbar(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, horizontal_scrollbar=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__horizontal_spacing(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__horizontal_spacing(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["horizontal_spacing"]
     except KeyError:
@@ -2008,14 +2009,14 @@ def _property__horizontal_spacing(self, /, *, __func=_dearpygui.get_item_configu
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__horizontal_spacing.setter
-def _property__horizontal_spacing(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__horizontal_spacing(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, horizontal_spacing=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__hour24(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__hour24(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["hour24"]
     except KeyError:
@@ -2023,14 +2024,14 @@ def _property__hour24(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__hour24.setter
-def _property__hour24(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__hour24(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, hour24=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__ignore_hidden(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__ignore_hidden(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["ignore_hidden"]
     except KeyError:
@@ -2038,14 +2039,14 @@ def _property__ignore_hidden(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__ignore_hidden.setter
-def _property__ignore_hidden(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__ignore_hidden(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, ignore_hidden=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__indent(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__indent(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["indent"]
     except KeyError:
@@ -2053,14 +2054,14 @@ def _property__indent(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__indent.setter
-def _property__indent(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__indent(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, indent=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__indent_disable(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__indent_disable(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["indent_disable"]
     except KeyError:
@@ -2068,14 +2069,14 @@ def _property__indent_disable(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__indent_disable.setter
-def _property__indent_disable(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__indent_disable(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, indent_disable=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__indent_enable(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__indent_enable(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["indent_enable"]
     except KeyError:
@@ -2083,14 +2084,14 @@ def _property__indent_enable(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__indent_enable.setter
-def _property__indent_enable(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__indent_enable(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, indent_enable=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__inner_width(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__inner_width(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["inner_width"]
     except KeyError:
@@ -2098,14 +2099,14 @@ def _property__inner_width(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__inner_width.setter
-def _property__inner_width(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__inner_width(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, inner_width=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__input_mode(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__input_mode(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["input_mode"]
     except KeyError:
@@ -2113,14 +2114,14 @@ def _property__input_mode(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__input_mode.setter
-def _property__input_mode(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__input_mode(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, input_mode=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__invert(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__invert(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["invert"]
     except KeyError:
@@ -2128,14 +2129,14 @@ def _property__invert(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__invert.setter
-def _property__invert(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__invert(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, invert=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__items(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__items(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["items"]
     except KeyError:
@@ -2143,14 +2144,14 @@ def _property__items(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__items.setter
-def _property__items(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__items(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, items=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__leading(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__leading(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["leading"]
     except KeyError:
@@ -2158,14 +2159,14 @@ def _property__leading(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__leading.setter
-def _property__leading(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__leading(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, leading=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__leaf(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__leaf(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["leaf"]
     except KeyError:
@@ -2173,14 +2174,14 @@ def _property__leaf(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__leaf.setter
-def _property__leaf(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__leaf(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, leaf=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__level(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__level(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["level"]
     except KeyError:
@@ -2188,14 +2189,14 @@ def _property__level(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__level.setter
-def _property__level(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__level(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, level=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__lines(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__lines(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["lines"]
     except KeyError:
@@ -2203,14 +2204,14 @@ def _property__lines(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__lines.setter
-def _property__lines(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__lines(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, lines=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__link_all_x(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__link_all_x(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["link_all_x"]
     except KeyError:
@@ -2218,14 +2219,14 @@ def _property__link_all_x(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__link_all_x.setter
-def _property__link_all_x(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__link_all_x(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, link_all_x=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__link_all_y(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__link_all_y(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["link_all_y"]
     except KeyError:
@@ -2233,14 +2234,14 @@ def _property__link_all_y(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__link_all_y.setter
-def _property__link_all_y(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__link_all_y(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, link_all_y=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__link_columns(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__link_columns(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["link_columns"]
     except KeyError:
@@ -2248,14 +2249,14 @@ def _property__link_columns(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__link_columns.setter
-def _property__link_columns(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__link_columns(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, link_columns=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__link_rows(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__link_rows(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["link_rows"]
     except KeyError:
@@ -2263,14 +2264,14 @@ def _property__link_rows(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__link_rows.setter
-def _property__link_rows(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__link_rows(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, link_rows=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__location(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__location(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["location"]
     except KeyError:
@@ -2278,14 +2279,14 @@ def _property__location(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__location.setter
-def _property__location(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__location(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, location=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__lock_max(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__lock_max(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["lock_max"]
     except KeyError:
@@ -2293,14 +2294,14 @@ def _property__lock_max(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__lock_max.setter
-def _property__lock_max(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__lock_max(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, lock_max=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__lock_min(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__lock_min(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["lock_min"]
     except KeyError:
@@ -2308,14 +2309,14 @@ def _property__lock_min(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__lock_min.setter
-def _property__lock_min(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__lock_min(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, lock_min=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__loop(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__loop(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["loop"]
     except KeyError:
@@ -2323,14 +2324,14 @@ def _property__loop(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__loop.setter
-def _property__loop(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__loop(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, loop=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__max_clamped(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__max_clamped(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["max_clamped"]
     except KeyError:
@@ -2338,14 +2339,14 @@ def _property__max_clamped(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__max_clamped.setter
-def _property__max_clamped(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__max_clamped(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, max_clamped=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__max_query_rects(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__max_query_rects(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["max_query_rects"]
     except KeyError:
@@ -2353,14 +2354,14 @@ def _property__max_query_rects(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__max_query_rects.setter
-def _property__max_query_rects(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__max_query_rects(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, max_query_rects=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__max_range(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__max_range(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["max_range"]
     except KeyError:
@@ -2368,14 +2369,14 @@ def _property__max_range(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__max_range.setter
-def _property__max_range(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__max_range(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, max_range=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__max_scale(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__max_scale(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["max_scale"]
     except KeyError:
@@ -2383,14 +2384,14 @@ def _property__max_scale(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__max_scale.setter
-def _property__max_scale(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__max_scale(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, max_scale=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__max_size(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__max_size(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["max_size"]
     except KeyError:
@@ -2398,14 +2399,14 @@ def _property__max_size(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__max_size.setter
-def _property__max_size(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__max_size(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, max_size=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__max_x(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__max_x(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["max_x"]
     except KeyError:
@@ -2413,14 +2414,14 @@ def _property__max_x(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__max_x.setter
-def _property__max_x(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__max_x(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, max_x=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__max_y(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__max_y(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["max_y"]
     except KeyError:
@@ -2428,14 +2429,14 @@ def _property__max_y(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__max_y.setter
-def _property__max_y(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__max_y(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, max_y=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__max_z(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__max_z(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["max_z"]
     except KeyError:
@@ -2443,14 +2444,14 @@ def _property__max_z(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__max_z.setter
-def _property__max_z(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__max_z(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, max_z=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__menubar(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__menubar(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["menubar"]
     except KeyError:
@@ -2458,14 +2459,14 @@ def _property__menubar(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__menubar.setter
-def _property__menubar(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__menubar(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, menubar=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__min_clamped(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__min_clamped(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["min_clamped"]
     except KeyError:
@@ -2473,14 +2474,14 @@ def _property__min_clamped(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__min_clamped.setter
-def _property__min_clamped(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__min_clamped(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, min_clamped=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__min_query_rects(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__min_query_rects(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["min_query_rects"]
     except KeyError:
@@ -2488,14 +2489,14 @@ def _property__min_query_rects(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__min_query_rects.setter
-def _property__min_query_rects(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__min_query_rects(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, min_query_rects=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__min_range(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__min_range(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["min_range"]
     except KeyError:
@@ -2503,14 +2504,14 @@ def _property__min_range(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__min_range.setter
-def _property__min_range(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__min_range(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, min_range=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__min_scale(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__min_scale(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["min_scale"]
     except KeyError:
@@ -2518,14 +2519,14 @@ def _property__min_scale(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__min_scale.setter
-def _property__min_scale(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__min_scale(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, min_scale=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__min_size(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__min_size(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["min_size"]
     except KeyError:
@@ -2533,14 +2534,14 @@ def _property__min_size(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__min_size.setter
-def _property__min_size(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__min_size(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, min_size=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__min_x(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__min_x(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["min_x"]
     except KeyError:
@@ -2548,14 +2549,14 @@ def _property__min_x(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__min_x.setter
-def _property__min_x(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__min_x(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, min_x=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__min_y(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__min_y(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["min_y"]
     except KeyError:
@@ -2563,14 +2564,14 @@ def _property__min_y(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__min_y.setter
-def _property__min_y(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__min_y(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, min_y=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__min_z(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__min_z(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["min_z"]
     except KeyError:
@@ -2578,14 +2579,14 @@ def _property__min_z(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__min_z.setter
-def _property__min_z(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__min_z(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, min_z=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__minimap(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__minimap(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["minimap"]
     except KeyError:
@@ -2593,14 +2594,14 @@ def _property__minimap(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__minimap.setter
-def _property__minimap(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__minimap(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, minimap=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__minimap_location(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__minimap_location(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["minimap_location"]
     except KeyError:
@@ -2608,14 +2609,14 @@ def _property__minimap_location(self, /, *, __func=_dearpygui.get_item_configura
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__minimap_location.setter
-def _property__minimap_location(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__minimap_location(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, minimap_location=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__mirror(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__mirror(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["mirror"]
     except KeyError:
@@ -2623,14 +2624,14 @@ def _property__mirror(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__mirror.setter
-def _property__mirror(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__mirror(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, mirror=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__modal(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__modal(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["modal"]
     except KeyError:
@@ -2638,14 +2639,14 @@ def _property__modal(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__modal.setter
-def _property__modal(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__modal(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, modal=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__multicolor(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__multicolor(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["multicolor"]
     except KeyError:
@@ -2653,14 +2654,14 @@ def _property__multicolor(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__multicolor.setter
-def _property__multicolor(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__multicolor(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, multicolor=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__multiline(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__multiline(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["multiline"]
     except KeyError:
@@ -2668,14 +2669,14 @@ def _property__multiline(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__multiline.setter
-def _property__multiline(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__multiline(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, multiline=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_align(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_align(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_align"]
     except KeyError:
@@ -2683,14 +2684,14 @@ def _property__no_align(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_align.setter
-def _property__no_align(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_align(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_align=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_alpha(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_alpha(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_alpha"]
     except KeyError:
@@ -2698,14 +2699,14 @@ def _property__no_alpha(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_alpha.setter
-def _property__no_alpha(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_alpha(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_alpha=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_arrow_button(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_arrow_button(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_arrow_button"]
     except KeyError:
@@ -2713,14 +2714,14 @@ def _property__no_arrow_button(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_arrow_button.setter
-def _property__no_arrow_button(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_arrow_button(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_arrow_button=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_background(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_background(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_background"]
     except KeyError:
@@ -2728,14 +2729,14 @@ def _property__no_background(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_background.setter
-def _property__no_background(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_background(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_background=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_border(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_border(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_border"]
     except KeyError:
@@ -2743,14 +2744,14 @@ def _property__no_border(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_border.setter
-def _property__no_border(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_border(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_border=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_box_select(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_box_select(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_box_select"]
     except KeyError:
@@ -2758,14 +2759,14 @@ def _property__no_box_select(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_box_select.setter
-def _property__no_box_select(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_box_select(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_box_select=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_bring_to_front_on_focus(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_bring_to_front_on_focus(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_bring_to_front_on_focus"]
     except KeyError:
@@ -2773,14 +2774,14 @@ def _property__no_bring_to_front_on_focus(self, /, *, __func=_dearpygui.get_item
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_bring_to_front_on_focus.setter
-def _property__no_bring_to_front_on_focus(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_bring_to_front_on_focus(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_bring_to_front_on_focus=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_buttons(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_buttons(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_buttons"]
     except KeyError:
@@ -2788,14 +2789,14 @@ def _property__no_buttons(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_buttons.setter
-def _property__no_buttons(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_buttons(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_buttons=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_clip(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_clip(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_clip"]
     except KeyError:
@@ -2803,14 +2804,14 @@ def _property__no_clip(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_clip.setter
-def _property__no_clip(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_clip(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_clip=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_close(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_close(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_close"]
     except KeyError:
@@ -2818,14 +2819,14 @@ def _property__no_close(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_close.setter
-def _property__no_close(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_close(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_close=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_close_with_middle_click(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_close_with_middle_click(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_close_with_middle_click"]
     except KeyError:
@@ -2833,14 +2834,14 @@ def _property__no_close_with_middle_click(self, /, *, __func=_dearpygui.get_item
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_close_with_middle_click.setter
-def _property__no_close_with_middle_click(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_close_with_middle_click(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_close_with_middle_click=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_collapse(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_collapse(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_collapse"]
     except KeyError:
@@ -2848,14 +2849,14 @@ def _property__no_collapse(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_collapse.setter
-def _property__no_collapse(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_collapse(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_collapse=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_cursor(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_cursor(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_cursor"]
     except KeyError:
@@ -2863,14 +2864,14 @@ def _property__no_cursor(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_cursor.setter
-def _property__no_cursor(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_cursor(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_cursor=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_docking(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_docking(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_docking"]
     except KeyError:
@@ -2878,14 +2879,14 @@ def _property__no_docking(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_docking.setter
-def _property__no_docking(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_docking(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_docking=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_drag_drop(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_drag_drop(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_drag_drop"]
     except KeyError:
@@ -2893,14 +2894,14 @@ def _property__no_drag_drop(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_drag_drop.setter
-def _property__no_drag_drop(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_drag_drop(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_drag_drop=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_fit(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_fit(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_fit"]
     except KeyError:
@@ -2908,14 +2909,14 @@ def _property__no_fit(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_fit.setter
-def _property__no_fit(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_fit(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_fit=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_focus_on_appearing(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_focus_on_appearing(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_focus_on_appearing"]
     except KeyError:
@@ -2923,14 +2924,14 @@ def _property__no_focus_on_appearing(self, /, *, __func=_dearpygui.get_item_conf
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_focus_on_appearing.setter
-def _property__no_focus_on_appearing(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_focus_on_appearing(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_focus_on_appearing=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_frame(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_frame(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_frame"]
     except KeyError:
@@ -2938,14 +2939,14 @@ def _property__no_frame(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_frame.setter
-def _property__no_frame(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_frame(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_frame=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_gridlines(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_gridlines(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_gridlines"]
     except KeyError:
@@ -2953,14 +2954,14 @@ def _property__no_gridlines(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_gridlines.setter
-def _property__no_gridlines(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_gridlines(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_gridlines=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_header_label(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_header_label(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_header_label"]
     except KeyError:
@@ -2968,14 +2969,14 @@ def _property__no_header_label(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_header_label.setter
-def _property__no_header_label(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_header_label(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_header_label=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_header_width(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_header_width(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_header_width"]
     except KeyError:
@@ -2983,14 +2984,14 @@ def _property__no_header_width(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_header_width.setter
-def _property__no_header_width(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_header_width(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_header_width=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_hide(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_hide(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_hide"]
     except KeyError:
@@ -2998,14 +2999,14 @@ def _property__no_hide(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_hide.setter
-def _property__no_hide(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_hide(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_hide=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_highlight(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_highlight(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_highlight"]
     except KeyError:
@@ -3013,14 +3014,14 @@ def _property__no_highlight(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_highlight.setter
-def _property__no_highlight(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_highlight(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_highlight=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_highlight_axis(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_highlight_axis(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_highlight_axis"]
     except KeyError:
@@ -3028,14 +3029,14 @@ def _property__no_highlight_axis(self, /, *, __func=_dearpygui.get_item_configur
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_highlight_axis.setter
-def _property__no_highlight_axis(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_highlight_axis(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_highlight_axis=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_highlight_item(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_highlight_item(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_highlight_item"]
     except KeyError:
@@ -3043,14 +3044,14 @@ def _property__no_highlight_item(self, /, *, __func=_dearpygui.get_item_configur
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_highlight_item.setter
-def _property__no_highlight_item(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_highlight_item(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_highlight_item=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_horizontal_scroll(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_horizontal_scroll(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_horizontal_scroll"]
     except KeyError:
@@ -3058,14 +3059,14 @@ def _property__no_horizontal_scroll(self, /, *, __func=_dearpygui.get_item_confi
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_horizontal_scroll.setter
-def _property__no_horizontal_scroll(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_horizontal_scroll(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_horizontal_scroll=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_host_extendX(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_host_extendX(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_host_extendX"]
     except KeyError:
@@ -3073,14 +3074,14 @@ def _property__no_host_extendX(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_host_extendX.setter
-def _property__no_host_extendX(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_host_extendX(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_host_extendX=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_host_extendY(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_host_extendY(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_host_extendY"]
     except KeyError:
@@ -3088,14 +3089,14 @@ def _property__no_host_extendY(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_host_extendY.setter
-def _property__no_host_extendY(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_host_extendY(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_host_extendY=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_initial_fit(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_initial_fit(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_initial_fit"]
     except KeyError:
@@ -3103,14 +3104,14 @@ def _property__no_initial_fit(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_initial_fit.setter
-def _property__no_initial_fit(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_initial_fit(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_initial_fit=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_input(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_input(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_input"]
     except KeyError:
@@ -3118,14 +3119,14 @@ def _property__no_input(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_input.setter
-def _property__no_input(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_input(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_input=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_inputs(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_inputs(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_inputs"]
     except KeyError:
@@ -3133,14 +3134,14 @@ def _property__no_inputs(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_inputs.setter
-def _property__no_inputs(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_inputs(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_inputs=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_keep_columns_visible(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_keep_columns_visible(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_keep_columns_visible"]
     except KeyError:
@@ -3148,14 +3149,14 @@ def _property__no_keep_columns_visible(self, /, *, __func=_dearpygui.get_item_co
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_keep_columns_visible.setter
-def _property__no_keep_columns_visible(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_keep_columns_visible(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_keep_columns_visible=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_label(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_label(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_label"]
     except KeyError:
@@ -3163,14 +3164,14 @@ def _property__no_label(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_label.setter
-def _property__no_label(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_label(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_label=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_menus(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_menus(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_menus"]
     except KeyError:
@@ -3178,14 +3179,14 @@ def _property__no_menus(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_menus.setter
-def _property__no_menus(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_menus(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_menus=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_mouse_pos(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_mouse_pos(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_mouse_pos"]
     except KeyError:
@@ -3193,14 +3194,14 @@ def _property__no_mouse_pos(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_mouse_pos.setter
-def _property__no_mouse_pos(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_mouse_pos(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_mouse_pos=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_move(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_move(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_move"]
     except KeyError:
@@ -3208,14 +3209,14 @@ def _property__no_move(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_move.setter
-def _property__no_move(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_move(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_move=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_open_over_existing_popup(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_open_over_existing_popup(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_open_over_existing_popup"]
     except KeyError:
@@ -3223,14 +3224,14 @@ def _property__no_open_over_existing_popup(self, /, *, __func=_dearpygui.get_ite
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_open_over_existing_popup.setter
-def _property__no_open_over_existing_popup(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_open_over_existing_popup(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_open_over_existing_popup=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_options(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_options(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_options"]
     except KeyError:
@@ -3238,14 +3239,14 @@ def _property__no_options(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_options.setter
-def _property__no_options(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_options(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_options=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_pad_innerX(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_pad_innerX(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_pad_innerX"]
     except KeyError:
@@ -3253,14 +3254,14 @@ def _property__no_pad_innerX(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_pad_innerX.setter
-def _property__no_pad_innerX(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_pad_innerX(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_pad_innerX=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_pad_outerX(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_pad_outerX(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_pad_outerX"]
     except KeyError:
@@ -3268,14 +3269,14 @@ def _property__no_pad_outerX(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_pad_outerX.setter
-def _property__no_pad_outerX(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_pad_outerX(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_pad_outerX=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_picker(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_picker(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_picker"]
     except KeyError:
@@ -3283,14 +3284,14 @@ def _property__no_picker(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_picker.setter
-def _property__no_picker(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_picker(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_picker=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_preview(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_preview(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_preview"]
     except KeyError:
@@ -3298,14 +3299,14 @@ def _property__no_preview(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_preview.setter
-def _property__no_preview(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_preview(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_preview=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_reorder(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_reorder(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_reorder"]
     except KeyError:
@@ -3313,14 +3314,14 @@ def _property__no_reorder(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_reorder.setter
-def _property__no_reorder(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_reorder(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_reorder=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_resize(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_resize(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_resize"]
     except KeyError:
@@ -3328,14 +3329,14 @@ def _property__no_resize(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_resize.setter
-def _property__no_resize(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_resize(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_resize=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_saved_settings(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_saved_settings(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_saved_settings"]
     except KeyError:
@@ -3343,14 +3344,14 @@ def _property__no_saved_settings(self, /, *, __func=_dearpygui.get_item_configur
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_saved_settings.setter
-def _property__no_saved_settings(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_saved_settings(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_saved_settings=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_scroll_with_mouse(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_scroll_with_mouse(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_scroll_with_mouse"]
     except KeyError:
@@ -3358,14 +3359,14 @@ def _property__no_scroll_with_mouse(self, /, *, __func=_dearpygui.get_item_confi
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_scroll_with_mouse.setter
-def _property__no_scroll_with_mouse(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_scroll_with_mouse(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_scroll_with_mouse=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_scrollbar(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_scrollbar(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_scrollbar"]
     except KeyError:
@@ -3373,14 +3374,14 @@ def _property__no_scrollbar(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_scrollbar.setter
-def _property__no_scrollbar(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_scrollbar(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_scrollbar=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_scrolling_buttons(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_scrolling_buttons(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_scrolling_buttons"]
     except KeyError:
@@ -3388,14 +3389,14 @@ def _property__no_scrolling_buttons(self, /, *, __func=_dearpygui.get_item_confi
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_scrolling_buttons.setter
-def _property__no_scrolling_buttons(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_scrolling_buttons(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_scrolling_buttons=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_side_preview(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_side_preview(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_side_preview"]
     except KeyError:
@@ -3403,14 +3404,14 @@ def _property__no_side_preview(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_side_preview.setter
-def _property__no_side_preview(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_side_preview(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_side_preview=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_side_switch(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_side_switch(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_side_switch"]
     except KeyError:
@@ -3418,14 +3419,14 @@ def _property__no_side_switch(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_side_switch.setter
-def _property__no_side_switch(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_side_switch(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_side_switch=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_small_preview(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_small_preview(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_small_preview"]
     except KeyError:
@@ -3433,14 +3434,14 @@ def _property__no_small_preview(self, /, *, __func=_dearpygui.get_item_configura
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_small_preview.setter
-def _property__no_small_preview(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_small_preview(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_small_preview=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_sort(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_sort(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_sort"]
     except KeyError:
@@ -3448,14 +3449,14 @@ def _property__no_sort(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_sort.setter
-def _property__no_sort(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_sort(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_sort=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_sort_ascending(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_sort_ascending(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_sort_ascending"]
     except KeyError:
@@ -3463,14 +3464,14 @@ def _property__no_sort_ascending(self, /, *, __func=_dearpygui.get_item_configur
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_sort_ascending.setter
-def _property__no_sort_ascending(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_sort_ascending(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_sort_ascending=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_sort_descending(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_sort_descending(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_sort_descending"]
     except KeyError:
@@ -3478,14 +3479,14 @@ def _property__no_sort_descending(self, /, *, __func=_dearpygui.get_item_configu
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_sort_descending.setter
-def _property__no_sort_descending(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_sort_descending(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_sort_descending=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_spaces(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_spaces(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_spaces"]
     except KeyError:
@@ -3493,14 +3494,14 @@ def _property__no_spaces(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_spaces.setter
-def _property__no_spaces(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_spaces(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_spaces=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_tick_labels(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_tick_labels(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_tick_labels"]
     except KeyError:
@@ -3508,14 +3509,14 @@ def _property__no_tick_labels(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_tick_labels.setter
-def _property__no_tick_labels(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_tick_labels(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_tick_labels=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_tick_marks(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_tick_marks(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_tick_marks"]
     except KeyError:
@@ -3523,14 +3524,14 @@ def _property__no_tick_marks(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_tick_marks.setter
-def _property__no_tick_marks(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_tick_marks(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_tick_marks=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_title_bar(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_title_bar(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_title_bar"]
     except KeyError:
@@ -3538,14 +3539,14 @@ def _property__no_title_bar(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_title_bar.setter
-def _property__no_title_bar(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_title_bar(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_title_bar=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_tooltip(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_tooltip(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_tooltip"]
     except KeyError:
@@ -3553,14 +3554,14 @@ def _property__no_tooltip(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_tooltip.setter
-def _property__no_tooltip(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_tooltip(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_tooltip=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__no_undo_redo(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__no_undo_redo(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["no_undo_redo"]
     except KeyError:
@@ -3568,14 +3569,14 @@ def _property__no_undo_redo(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__no_undo_redo.setter
-def _property__no_undo_redo(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__no_undo_redo(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, no_undo_redo=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__normalize(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__normalize(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["normalize"]
     except KeyError:
@@ -3583,14 +3584,14 @@ def _property__normalize(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__normalize.setter
-def _property__normalize(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__normalize(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, normalize=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__num_items(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__num_items(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["num_items"]
     except KeyError:
@@ -3598,14 +3599,14 @@ def _property__num_items(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__num_items.setter
-def _property__num_items(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__num_items(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, num_items=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__offset(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__offset(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["offset"]
     except KeyError:
@@ -3613,14 +3614,14 @@ def _property__offset(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__offset.setter
-def _property__offset(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__offset(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, offset=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__on_close(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__on_close(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["on_close"]
     except KeyError:
@@ -3628,20 +3629,20 @@ def _property__on_close(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__on_close.setter
-def _property__on_close(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__on_close(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, on_close=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__on_close.deleter
-def _property__on_close(self, /, *, __func=_dearpygui.configure_item):
+def _property__on_close(self, /, *, __func=_cache.configure_item):
     try:
         __func(self, on_close=None)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__on_enter(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__on_enter(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["on_enter"]
     except KeyError:
@@ -3649,14 +3650,14 @@ def _property__on_enter(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__on_enter.setter
-def _property__on_enter(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__on_enter(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, on_enter=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__open_on_arrow(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__open_on_arrow(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["open_on_arrow"]
     except KeyError:
@@ -3664,14 +3665,14 @@ def _property__open_on_arrow(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__open_on_arrow.setter
-def _property__open_on_arrow(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__open_on_arrow(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, open_on_arrow=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__open_on_double_click(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__open_on_double_click(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["open_on_double_click"]
     except KeyError:
@@ -3679,14 +3680,14 @@ def _property__open_on_double_click(self, /, *, __func=_dearpygui.get_item_confi
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__open_on_double_click.setter
-def _property__open_on_double_click(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__open_on_double_click(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, open_on_double_click=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__opposite(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__opposite(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["opposite"]
     except KeyError:
@@ -3694,14 +3695,14 @@ def _property__opposite(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__opposite.setter
-def _property__opposite(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__opposite(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, opposite=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__order_mode(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__order_mode(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["order_mode"]
     except KeyError:
@@ -3709,14 +3710,14 @@ def _property__order_mode(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__order_mode.setter
-def _property__order_mode(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__order_mode(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, order_mode=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__outliers(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__outliers(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["outliers"]
     except KeyError:
@@ -3724,14 +3725,14 @@ def _property__outliers(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__outliers.setter
-def _property__outliers(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__outliers(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, outliers=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__outside(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__outside(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["outside"]
     except KeyError:
@@ -3739,14 +3740,14 @@ def _property__outside(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__outside.setter
-def _property__outside(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__outside(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, outside=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__overlay(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__overlay(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["overlay"]
     except KeyError:
@@ -3754,20 +3755,20 @@ def _property__overlay(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__overlay.setter
-def _property__overlay(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__overlay(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, overlay=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__overlay.deleter
-def _property__overlay(self, /, *, __func=_dearpygui.configure_item):
+def _property__overlay(self, /, *, __func=_cache.configure_item):
     try:
         __func(self, overlay='')
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__override_mod(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__override_mod(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["override_mod"]
     except KeyError:
@@ -3775,14 +3776,14 @@ def _property__override_mod(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__override_mod.setter
-def _property__override_mod(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__override_mod(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, override_mod=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__pad_outerX(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__pad_outerX(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["pad_outerX"]
     except KeyError:
@@ -3790,14 +3791,14 @@ def _property__pad_outerX(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__pad_outerX.setter
-def _property__pad_outerX(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__pad_outerX(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, pad_outerX=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__pan_mod(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__pan_mod(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["pan_mod"]
     except KeyError:
@@ -3805,14 +3806,14 @@ def _property__pan_mod(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__pan_mod.setter
-def _property__pan_mod(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__pan_mod(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, pan_mod=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__pan_stretch(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__pan_stretch(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["pan_stretch"]
     except KeyError:
@@ -3820,14 +3821,14 @@ def _property__pan_stretch(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__pan_stretch.setter
-def _property__pan_stretch(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__pan_stretch(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, pan_stretch=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__password(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__password(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["password"]
     except KeyError:
@@ -3835,14 +3836,14 @@ def _property__password(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__password.setter
-def _property__password(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__password(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, password=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__payload_type(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__payload_type(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["payload_type"]
     except KeyError:
@@ -3850,14 +3851,14 @@ def _property__payload_type(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__payload_type.setter
-def _property__payload_type(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__payload_type(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, payload_type=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__perspective_divide(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__perspective_divide(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["perspective_divide"]
     except KeyError:
@@ -3865,14 +3866,14 @@ def _property__perspective_divide(self, /, *, __func=_dearpygui.get_item_configu
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__perspective_divide.setter
-def _property__perspective_divide(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__perspective_divide(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, perspective_divide=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__picker_mode(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__picker_mode(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["picker_mode"]
     except KeyError:
@@ -3880,14 +3881,14 @@ def _property__picker_mode(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__picker_mode.setter
-def _property__picker_mode(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__picker_mode(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, picker_mode=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__pixel_snapH(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__pixel_snapH(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["pixel_snapH"]
     except KeyError:
@@ -3895,14 +3896,14 @@ def _property__pixel_snapH(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__pixel_snapH.setter
-def _property__pixel_snapH(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__pixel_snapH(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, pixel_snapH=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__pixel_snapV(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__pixel_snapV(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["pixel_snapV"]
     except KeyError:
@@ -3910,14 +3911,14 @@ def _property__pixel_snapV(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__pixel_snapV.setter
-def _property__pixel_snapV(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__pixel_snapV(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, pixel_snapV=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__policy(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__policy(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["policy"]
     except KeyError:
@@ -3925,14 +3926,14 @@ def _property__policy(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__policy.setter
-def _property__policy(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__policy(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, policy=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__popup(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__popup(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["popup"]
     except KeyError:
@@ -3940,14 +3941,14 @@ def _property__popup(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__popup.setter
-def _property__popup(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__popup(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, popup=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__popup_align_left(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__popup_align_left(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["popup_align_left"]
     except KeyError:
@@ -3955,14 +3956,14 @@ def _property__popup_align_left(self, /, *, __func=_dearpygui.get_item_configura
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__popup_align_left.setter
-def _property__popup_align_left(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__popup_align_left(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, popup_align_left=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__pre_step(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__pre_step(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["pre_step"]
     except KeyError:
@@ -3970,14 +3971,14 @@ def _property__pre_step(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__pre_step.setter
-def _property__pre_step(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__pre_step(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, pre_step=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__precise_widths(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__precise_widths(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["precise_widths"]
     except KeyError:
@@ -3985,14 +3986,14 @@ def _property__precise_widths(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__precise_widths.setter
-def _property__precise_widths(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__precise_widths(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, precise_widths=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__prefer_sort_ascending(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__prefer_sort_ascending(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["prefer_sort_ascending"]
     except KeyError:
@@ -4000,14 +4001,14 @@ def _property__prefer_sort_ascending(self, /, *, __func=_dearpygui.get_item_conf
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__prefer_sort_ascending.setter
-def _property__prefer_sort_ascending(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__prefer_sort_ascending(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, prefer_sort_ascending=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__prefer_sort_descending(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__prefer_sort_descending(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["prefer_sort_descending"]
     except KeyError:
@@ -4015,14 +4016,14 @@ def _property__prefer_sort_descending(self, /, *, __func=_dearpygui.get_item_con
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__prefer_sort_descending.setter
-def _property__prefer_sort_descending(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__prefer_sort_descending(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, prefer_sort_descending=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__query(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__query(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["query"]
     except KeyError:
@@ -4030,14 +4031,14 @@ def _property__query(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__query.setter
-def _property__query(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__query(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, query=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__query_color(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__query_color(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["query_color"]
     except KeyError:
@@ -4045,14 +4046,14 @@ def _property__query_color(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__query_color.setter
-def _property__query_color(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__query_color(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, query_color=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__query_toggle_mod(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__query_toggle_mod(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["query_toggle_mod"]
     except KeyError:
@@ -4060,14 +4061,14 @@ def _property__query_toggle_mod(self, /, *, __func=_dearpygui.get_item_configura
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__query_toggle_mod.setter
-def _property__query_toggle_mod(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__query_toggle_mod(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, query_toggle_mod=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__radius(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__radius(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["radius"]
     except KeyError:
@@ -4075,14 +4076,14 @@ def _property__radius(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__radius.setter
-def _property__radius(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__radius(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, radius=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__range_fit(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__range_fit(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["range_fit"]
     except KeyError:
@@ -4090,14 +4091,14 @@ def _property__range_fit(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__range_fit.setter
-def _property__range_fit(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__range_fit(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, range_fit=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__readonly(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__readonly(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["readonly"]
     except KeyError:
@@ -4105,14 +4106,14 @@ def _property__readonly(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__readonly.setter
-def _property__readonly(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__readonly(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, readonly=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__reorderable(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__reorderable(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["reorderable"]
     except KeyError:
@@ -4120,14 +4121,14 @@ def _property__reorderable(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__reorderable.setter
-def _property__reorderable(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__reorderable(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, reorderable=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__repeat(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__repeat(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["repeat"]
     except KeyError:
@@ -4135,14 +4136,14 @@ def _property__repeat(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__repeat.setter
-def _property__repeat(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__repeat(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, repeat=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__resizable(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__resizable(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["resizable"]
     except KeyError:
@@ -4150,14 +4151,14 @@ def _property__resizable(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__resizable.setter
-def _property__resizable(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__resizable(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, resizable=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__resizable_x(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__resizable_x(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["resizable_x"]
     except KeyError:
@@ -4165,14 +4166,14 @@ def _property__resizable_x(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__resizable_x.setter
-def _property__resizable_x(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__resizable_x(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, resizable_x=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__resizable_y(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__resizable_y(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["resizable_y"]
     except KeyError:
@@ -4180,14 +4181,14 @@ def _property__resizable_y(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__resizable_y.setter
-def _property__resizable_y(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__resizable_y(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, resizable_y=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__reverse_dir(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__reverse_dir(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["reverse_dir"]
     except KeyError:
@@ -4195,14 +4196,14 @@ def _property__reverse_dir(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__reverse_dir.setter
-def _property__reverse_dir(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__reverse_dir(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, reverse_dir=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__rounding(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__rounding(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["rounding"]
     except KeyError:
@@ -4210,14 +4211,14 @@ def _property__rounding(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__rounding.setter
-def _property__rounding(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__rounding(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, rounding=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__row_background(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__row_background(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["row_background"]
     except KeyError:
@@ -4225,14 +4226,14 @@ def _property__row_background(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__row_background.setter
-def _property__row_background(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__row_background(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, row_background=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__row_ratios(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__row_ratios(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["row_ratios"]
     except KeyError:
@@ -4240,14 +4241,14 @@ def _property__row_ratios(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__row_ratios.setter
-def _property__row_ratios(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__row_ratios(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, row_ratios=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__scale(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__scale(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["scale"]
     except KeyError:
@@ -4255,14 +4256,14 @@ def _property__scale(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__scale.setter
-def _property__scale(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__scale(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, scale=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__scale_max(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__scale_max(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["scale_max"]
     except KeyError:
@@ -4270,14 +4271,14 @@ def _property__scale_max(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__scale_max.setter
-def _property__scale_max(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__scale_max(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, scale_max=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__scale_min(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__scale_min(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["scale_min"]
     except KeyError:
@@ -4285,14 +4286,14 @@ def _property__scale_min(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__scale_min.setter
-def _property__scale_min(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__scale_min(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, scale_min=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__scientific(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__scientific(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["scientific"]
     except KeyError:
@@ -4300,14 +4301,14 @@ def _property__scientific(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__scientific.setter
-def _property__scientific(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__scientific(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, scientific=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__scrollX(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__scrollX(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["scrollX"]
     except KeyError:
@@ -4315,14 +4316,14 @@ def _property__scrollX(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__scrollX.setter
-def _property__scrollX(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__scrollX(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, scrollX=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__scrollY(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__scrollY(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["scrollY"]
     except KeyError:
@@ -4330,14 +4331,14 @@ def _property__scrollY(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__scrollY.setter
-def _property__scrollY(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__scrollY(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, scrollY=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__secondary_color(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__secondary_color(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["secondary_color"]
     except KeyError:
@@ -4345,14 +4346,14 @@ def _property__secondary_color(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__secondary_color.setter
-def _property__secondary_color(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__secondary_color(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, secondary_color=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__segments(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__segments(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["segments"]
     except KeyError:
@@ -4360,14 +4361,14 @@ def _property__segments(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__segments.setter
-def _property__segments(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__segments(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, segments=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__select_on_nav(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__select_on_nav(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["select_on_nav"]
     except KeyError:
@@ -4375,14 +4376,14 @@ def _property__select_on_nav(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__select_on_nav.setter
-def _property__select_on_nav(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__select_on_nav(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, select_on_nav=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__selectable(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__selectable(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["selectable"]
     except KeyError:
@@ -4390,14 +4391,14 @@ def _property__selectable(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__selectable.setter
-def _property__selectable(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__selectable(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, selectable=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__shaded(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__shaded(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["shaded"]
     except KeyError:
@@ -4405,14 +4406,14 @@ def _property__shaded(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__shaded.setter
-def _property__shaded(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__shaded(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, shaded=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__shape(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__shape(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["shape"]
     except KeyError:
@@ -4420,14 +4421,14 @@ def _property__shape(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__shape.setter
-def _property__shape(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__shape(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, shape=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__share_series(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__share_series(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["share_series"]
     except KeyError:
@@ -4435,14 +4436,14 @@ def _property__share_series(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__share_series.setter
-def _property__share_series(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__share_series(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, share_series=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__shift(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__shift(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["shift"]
     except KeyError:
@@ -4450,14 +4451,14 @@ def _property__shift(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__shift.setter
-def _property__shift(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__shift(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, shift=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__shortcut(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__shortcut(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["shortcut"]
     except KeyError:
@@ -4465,20 +4466,20 @@ def _property__shortcut(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__shortcut.setter
-def _property__shortcut(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__shortcut(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, shortcut=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__shortcut.deleter
-def _property__shortcut(self, /, *, __func=_dearpygui.configure_item):
+def _property__shortcut(self, /, *, __func=_cache.configure_item):
     try:
         __func(self, shortcut='')
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__show(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__show(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["show"]
     except KeyError:
@@ -4486,14 +4487,14 @@ def _property__show(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__show.setter
-def _property__show(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__show(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, show=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__show_label(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__show_label(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["show_label"]
     except KeyError:
@@ -4501,14 +4502,14 @@ def _property__show_label(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__show_label.setter
-def _property__show_label(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__show_label(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, show_label=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__size(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__size(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["size"]
     except KeyError:
@@ -4516,14 +4517,14 @@ def _property__size(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__size.setter
-def _property__size(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__size(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, size=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__skip_nan(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__skip_nan(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["skip_nan"]
     except KeyError:
@@ -4531,14 +4532,14 @@ def _property__skip_nan(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__skip_nan.setter
-def _property__skip_nan(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__skip_nan(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, skip_nan=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__small(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__small(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["small"]
     except KeyError:
@@ -4546,14 +4547,14 @@ def _property__small(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__small.setter
-def _property__small(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__small(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, small=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__sort(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__sort(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["sort"]
     except KeyError:
@@ -4561,14 +4562,14 @@ def _property__sort(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__sort.setter
-def _property__sort(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__sort(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, sort=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__sort_multi(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__sort_multi(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["sort_multi"]
     except KeyError:
@@ -4576,14 +4577,14 @@ def _property__sort_multi(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__sort_multi.setter
-def _property__sort_multi(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__sort_multi(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, sort_multi=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__sort_tristate(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__sort_tristate(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["sort_tristate"]
     except KeyError:
@@ -4591,14 +4592,14 @@ def _property__sort_tristate(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__sort_tristate.setter
-def _property__sort_tristate(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__sort_tristate(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, sort_tristate=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__sortable(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__sortable(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["sortable"]
     except KeyError:
@@ -4606,14 +4607,14 @@ def _property__sortable(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__sortable.setter
-def _property__sortable(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__sortable(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, sortable=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__source(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__source(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["source"]
     except KeyError:
@@ -4621,20 +4622,20 @@ def _property__source(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__source.setter
-def _property__source(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__source(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, source=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__source.deleter
-def _property__source(self, /, *, __func=_dearpygui.configure_item):
+def _property__source(self, /, *, __func=_cache.configure_item):
     try:
         __func(self, source=0)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__span_columns(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__span_columns(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["span_columns"]
     except KeyError:
@@ -4642,14 +4643,14 @@ def _property__span_columns(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__span_columns.setter
-def _property__span_columns(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__span_columns(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, span_columns=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__span_full_width(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__span_full_width(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["span_full_width"]
     except KeyError:
@@ -4657,14 +4658,14 @@ def _property__span_full_width(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__span_full_width.setter
-def _property__span_full_width(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__span_full_width(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, span_full_width=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__span_text_width(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__span_text_width(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["span_text_width"]
     except KeyError:
@@ -4672,14 +4673,14 @@ def _property__span_text_width(self, /, *, __func=_dearpygui.get_item_configurat
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__span_text_width.setter
-def _property__span_text_width(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__span_text_width(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, span_text_width=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__speed(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__speed(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["speed"]
     except KeyError:
@@ -4687,14 +4688,14 @@ def _property__speed(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__speed.setter
-def _property__speed(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__speed(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, speed=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__stacked(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__stacked(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["stacked"]
     except KeyError:
@@ -4702,14 +4703,14 @@ def _property__stacked(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__stacked.setter
-def _property__stacked(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__stacked(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, stacked=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__step(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__step(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["step"]
     except KeyError:
@@ -4717,14 +4718,14 @@ def _property__step(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__step.setter
-def _property__step(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__step(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, step=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__step_fast(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__step_fast(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["step_fast"]
     except KeyError:
@@ -4732,14 +4733,14 @@ def _property__step_fast(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__step_fast.setter
-def _property__step_fast(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__step_fast(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, step_fast=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__style(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__style(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["style"]
     except KeyError:
@@ -4747,14 +4748,14 @@ def _property__style(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__style.setter
-def _property__style(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__style(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, style=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__tab_input(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__tab_input(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["tab_input"]
     except KeyError:
@@ -4762,14 +4763,14 @@ def _property__tab_input(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__tab_input.setter
-def _property__tab_input(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__tab_input(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, tab_input=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__tab_list_popup_button(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__tab_list_popup_button(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["tab_list_popup_button"]
     except KeyError:
@@ -4777,14 +4778,14 @@ def _property__tab_list_popup_button(self, /, *, __func=_dearpygui.get_item_conf
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__tab_list_popup_button.setter
-def _property__tab_list_popup_button(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__tab_list_popup_button(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, tab_list_popup_button=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__thickness(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__thickness(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["thickness"]
     except KeyError:
@@ -4792,14 +4793,14 @@ def _property__thickness(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__thickness.setter
-def _property__thickness(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__thickness(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, thickness=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__tick_format(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__tick_format(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["tick_format"]
     except KeyError:
@@ -4807,20 +4808,20 @@ def _property__tick_format(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__tick_format.setter
-def _property__tick_format(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__tick_format(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, tick_format=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__tick_format.deleter
-def _property__tick_format(self, /, *, __func=_dearpygui.configure_item):
+def _property__tick_format(self, /, *, __func=_cache.configure_item):
     try:
         __func(self, tick_format='')
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__time_unit(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__time_unit(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["time_unit"]
     except KeyError:
@@ -4828,14 +4829,14 @@ def _property__time_unit(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__time_unit.setter
-def _property__time_unit(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__time_unit(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, time_unit=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__tint_color(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__tint_color(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["tint_color"]
     except KeyError:
@@ -4843,14 +4844,14 @@ def _property__tint_color(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__tint_color.setter
-def _property__tint_color(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__tint_color(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, tint_color=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__tooltip(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__tooltip(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["tooltip"]
     except KeyError:
@@ -4858,14 +4859,14 @@ def _property__tooltip(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__tooltip.setter
-def _property__tooltip(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__tooltip(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, tooltip=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__track_offset(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__track_offset(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["track_offset"]
     except KeyError:
@@ -4873,14 +4874,14 @@ def _property__track_offset(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__track_offset.setter
-def _property__track_offset(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__track_offset(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, track_offset=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__tracked(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__tracked(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["tracked"]
     except KeyError:
@@ -4888,14 +4889,14 @@ def _property__tracked(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__tracked.setter
-def _property__tracked(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__tracked(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, tracked=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__trailing(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__trailing(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["trailing"]
     except KeyError:
@@ -4903,14 +4904,14 @@ def _property__trailing(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__trailing.setter
-def _property__trailing(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__trailing(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, trailing=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__two_way(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__two_way(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["two_way"]
     except KeyError:
@@ -4918,14 +4919,14 @@ def _property__two_way(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__two_way.setter
-def _property__two_way(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__two_way(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, two_way=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__unsaved_document(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__unsaved_document(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["unsaved_document"]
     except KeyError:
@@ -4933,14 +4934,14 @@ def _property__unsaved_document(self, /, *, __func=_dearpygui.get_item_configura
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__unsaved_document.setter
-def _property__unsaved_document(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__unsaved_document(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, unsaved_document=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__uppercase(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__uppercase(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["uppercase"]
     except KeyError:
@@ -4948,14 +4949,14 @@ def _property__uppercase(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__uppercase.setter
-def _property__uppercase(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__uppercase(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, uppercase=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__use_24hour_clock(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__use_24hour_clock(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["use_24hour_clock"]
     except KeyError:
@@ -4963,14 +4964,14 @@ def _property__use_24hour_clock(self, /, *, __func=_dearpygui.get_item_configura
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__use_24hour_clock.setter
-def _property__use_24hour_clock(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__use_24hour_clock(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, use_24hour_clock=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__use_ISO8601(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__use_ISO8601(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["use_ISO8601"]
     except KeyError:
@@ -4978,14 +4979,14 @@ def _property__use_ISO8601(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__use_ISO8601.setter
-def _property__use_ISO8601(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__use_ISO8601(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, use_ISO8601=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__use_local_time(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__use_local_time(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["use_local_time"]
     except KeyError:
@@ -4993,14 +4994,14 @@ def _property__use_local_time(self, /, *, __func=_dearpygui.get_item_configurati
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__use_local_time.setter
-def _property__use_local_time(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__use_local_time(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, use_local_time=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__uv1(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__uv1(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["uv1"]
     except KeyError:
@@ -5008,14 +5009,14 @@ def _property__uv1(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__uv1.setter
-def _property__uv1(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__uv1(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, uv1=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__uv2(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__uv2(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["uv2"]
     except KeyError:
@@ -5023,14 +5024,14 @@ def _property__uv2(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__uv2.setter
-def _property__uv2(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__uv2(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, uv2=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__uv3(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__uv3(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["uv3"]
     except KeyError:
@@ -5038,14 +5039,14 @@ def _property__uv3(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__uv3.setter
-def _property__uv3(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__uv3(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, uv3=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__uv4(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__uv4(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["uv4"]
     except KeyError:
@@ -5053,14 +5054,14 @@ def _property__uv4(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__uv4.setter
-def _property__uv4(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__uv4(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, uv4=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__uv_max(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__uv_max(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["uv_max"]
     except KeyError:
@@ -5068,14 +5069,14 @@ def _property__uv_max(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__uv_max.setter
-def _property__uv_max(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__uv_max(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, uv_max=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__uv_min(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__uv_min(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["uv_min"]
     except KeyError:
@@ -5083,14 +5084,14 @@ def _property__uv_min(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__uv_min.setter
-def _property__uv_min(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__uv_min(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, uv_min=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__vertical(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__vertical(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["vertical"]
     except KeyError:
@@ -5098,14 +5099,14 @@ def _property__vertical(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__vertical.setter
-def _property__vertical(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__vertical(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, vertical=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__vertical_mod(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__vertical_mod(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["vertical_mod"]
     except KeyError:
@@ -5113,14 +5114,14 @@ def _property__vertical_mod(self, /, *, __func=_dearpygui.get_item_configuration
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__vertical_mod.setter
-def _property__vertical_mod(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__vertical_mod(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, vertical_mod=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__weight(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__weight(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["weight"]
     except KeyError:
@@ -5128,14 +5129,14 @@ def _property__weight(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__weight.setter
-def _property__weight(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__weight(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, weight=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__width(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__width(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["width"]
     except KeyError:
@@ -5143,14 +5144,14 @@ def _property__width(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__width.setter
-def _property__width(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__width(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, width=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__width_fixed(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__width_fixed(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["width_fixed"]
     except KeyError:
@@ -5158,14 +5159,14 @@ def _property__width_fixed(self, /, *, __func=_dearpygui.get_item_configuration)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__width_fixed.setter
-def _property__width_fixed(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__width_fixed(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, width_fixed=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__width_stretch(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__width_stretch(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["width_stretch"]
     except KeyError:
@@ -5173,14 +5174,14 @@ def _property__width_stretch(self, /, *, __func=_dearpygui.get_item_configuratio
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__width_stretch.setter
-def _property__width_stretch(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__width_stretch(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, width_stretch=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__wrap(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__wrap(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["wrap"]
     except KeyError:
@@ -5188,14 +5189,14 @@ def _property__wrap(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__wrap.setter
-def _property__wrap(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__wrap(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, wrap=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__xbins(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__xbins(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["xbins"]
     except KeyError:
@@ -5203,14 +5204,14 @@ def _property__xbins(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__xbins.setter
-def _property__xbins(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__xbins(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, xbins=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__xmax_range(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__xmax_range(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["xmax_range"]
     except KeyError:
@@ -5218,14 +5219,14 @@ def _property__xmax_range(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__xmax_range.setter
-def _property__xmax_range(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__xmax_range(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, xmax_range=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__xmin_range(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__xmin_range(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["xmin_range"]
     except KeyError:
@@ -5233,14 +5234,14 @@ def _property__xmin_range(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__xmin_range.setter
-def _property__xmin_range(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__xmin_range(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, xmin_range=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__xoffset(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__xoffset(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["xoffset"]
     except KeyError:
@@ -5248,14 +5249,14 @@ def _property__xoffset(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__xoffset.setter
-def _property__xoffset(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__xoffset(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, xoffset=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__ybins(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__ybins(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["ybins"]
     except KeyError:
@@ -5263,14 +5264,14 @@ def _property__ybins(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__ybins.setter
-def _property__ybins(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__ybins(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, ybins=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__ymax_range(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__ymax_range(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["ymax_range"]
     except KeyError:
@@ -5278,14 +5279,14 @@ def _property__ymax_range(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__ymax_range.setter
-def _property__ymax_range(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__ymax_range(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, ymax_range=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__ymin_range(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__ymin_range(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["ymin_range"]
     except KeyError:
@@ -5293,14 +5294,14 @@ def _property__ymin_range(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__ymin_range.setter
-def _property__ymin_range(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__ymin_range(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, ymin_range=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__zoom_mod(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__zoom_mod(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["zoom_mod"]
     except KeyError:
@@ -5308,14 +5309,14 @@ def _property__zoom_mod(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__zoom_mod.setter
-def _property__zoom_mod(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__zoom_mod(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, zoom_mod=value)
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 
 @property
-def _property__zoom_rate(self, /, *, __func=_dearpygui.get_item_configuration):
+def _property__zoom_rate(self, /, *, __func=_cache.get_item_configuration):
     try:
         return __func(self)["zoom_rate"]
     except KeyError:
@@ -5323,7 +5324,7 @@ def _property__zoom_rate(self, /, *, __func=_dearpygui.get_item_configuration):
     except SystemError as e:
         raise DearPyGuiError.from_exception(e)
 @_property__zoom_rate.setter
-def _property__zoom_rate(self, value, /, *, __func=_dearpygui.configure_item):
+def _property__zoom_rate(self, value, /, *, __func=_cache.configure_item):
     try:
         __func(self, zoom_rate=value)
     except SystemError as e:
@@ -5460,7 +5461,7 @@ class mvBarGroupSeries(SupportsValueArray, ChildItem, command="add_bar_group_ser
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def label_ids(self, /, *, __func=_dearpygui.get_item_configuration):
+    def label_ids(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["label_ids"]
         except KeyError:
@@ -5469,7 +5470,7 @@ class mvBarGroupSeries(SupportsValueArray, ChildItem, command="add_bar_group_ser
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def group_size(self, /, *, __func=_dearpygui.get_item_configuration):
+    def group_size(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["group_size"]
         except KeyError:
@@ -5578,7 +5579,7 @@ class mvCandleSeries(SupportsValueArray, ChildItem, command="add_candle_series",
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def dates(self, /, *, __func=_dearpygui.get_item_configuration):
+    def dates(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["dates"]
         except KeyError:
@@ -5587,7 +5588,7 @@ class mvCandleSeries(SupportsValueArray, ChildItem, command="add_candle_series",
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def opens(self, /, *, __func=_dearpygui.get_item_configuration):
+    def opens(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["opens"]
         except KeyError:
@@ -5596,7 +5597,7 @@ class mvCandleSeries(SupportsValueArray, ChildItem, command="add_candle_series",
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def closes(self, /, *, __func=_dearpygui.get_item_configuration):
+    def closes(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["closes"]
         except KeyError:
@@ -5605,7 +5606,7 @@ class mvCandleSeries(SupportsValueArray, ChildItem, command="add_candle_series",
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def lows(self, /, *, __func=_dearpygui.get_item_configuration):
+    def lows(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["lows"]
         except KeyError:
@@ -5614,7 +5615,7 @@ class mvCandleSeries(SupportsValueArray, ChildItem, command="add_candle_series",
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def highs(self, /, *, __func=_dearpygui.get_item_configuration):
+    def highs(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["highs"]
         except KeyError:
@@ -5644,7 +5645,7 @@ class mvCharRemap(ChildItem, command="add_char_remap", slot=1):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def source(self, /, *, __func=_dearpygui.get_item_configuration):
+    def source(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["source"]
         except KeyError:
@@ -5653,7 +5654,7 @@ class mvCharRemap(ChildItem, command="add_char_remap", slot=1):
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def target(self, /, *, __func=_dearpygui.get_item_configuration):
+    def target(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["target"]
         except KeyError:
@@ -5776,7 +5777,7 @@ class mvClickedHandler(ChildItem, command="add_item_clicked_handler", slot=1):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def button(self, /, *, __func=_dearpygui.get_item_configuration):
+    def button(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["button"]
         except KeyError:
@@ -5970,7 +5971,7 @@ class mvColorMap(ChildItem, command="add_colormap", slot=1):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def colors(self, /, *, __func=_dearpygui.get_item_configuration):
+    def colors(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["colors"]
         except KeyError:
@@ -5979,7 +5980,7 @@ class mvColorMap(ChildItem, command="add_colormap", slot=1):
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def qualitative(self, /, *, __func=_dearpygui.get_item_configuration):
+    def qualitative(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["qualitative"]
         except KeyError:
@@ -6273,7 +6274,7 @@ class mvCustomSeries(SupportsValueArray, ContainerItem, ChildItem, command="add_
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def channel_count(self, /, *, __func=_dearpygui.get_item_configuration):
+    def channel_count(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["channel_count"]
         except KeyError:
@@ -6405,7 +6406,7 @@ class mvDoubleClickedHandler(ChildItem, command="add_item_double_clicked_handler
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def button(self, /, *, __func=_dearpygui.get_item_configuration):
+    def button(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["button"]
         except KeyError:
@@ -6887,7 +6888,7 @@ class mvDrawCircle(ChildItem, command="draw_circle", slot=2):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def center(self, /, *, __func=_dearpygui.get_item_configuration):
+    def center(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["center"]
         except KeyError:
@@ -6896,7 +6897,7 @@ class mvDrawCircle(ChildItem, command="draw_circle", slot=2):
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def radius(self, /, *, __func=_dearpygui.get_item_configuration):
+    def radius(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["radius"]
         except KeyError:
@@ -6924,7 +6925,7 @@ class mvDrawEllipse(ChildItem, command="draw_ellipse", slot=2):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def pmin(self, /, *, __func=_dearpygui.get_item_configuration):
+    def pmin(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["pmin"]
         except KeyError:
@@ -6933,7 +6934,7 @@ class mvDrawEllipse(ChildItem, command="draw_ellipse", slot=2):
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def pmax(self, /, *, __func=_dearpygui.get_item_configuration):
+    def pmax(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["pmax"]
         except KeyError:
@@ -6961,7 +6962,7 @@ class mvDrawImage(ChildItem, command="draw_image", slot=2):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def pmin(self, /, *, __func=_dearpygui.get_item_configuration):
+    def pmin(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["pmin"]
         except KeyError:
@@ -6970,7 +6971,7 @@ class mvDrawImage(ChildItem, command="draw_image", slot=2):
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def pmax(self, /, *, __func=_dearpygui.get_item_configuration):
+    def pmax(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["pmax"]
         except KeyError:
@@ -7083,7 +7084,7 @@ class mvDrawPolygon(ChildItem, command="draw_polygon", slot=2):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def points(self, /, *, __func=_dearpygui.get_item_configuration):
+    def points(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["points"]
         except KeyError:
@@ -7110,7 +7111,7 @@ class mvDrawPolyline(ChildItem, command="draw_polyline", slot=2):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def points(self, /, *, __func=_dearpygui.get_item_configuration):
+    def points(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["points"]
         except KeyError:
@@ -7155,7 +7156,7 @@ class mvDrawRect(ChildItem, command="draw_rectangle", slot=2):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def pmin(self, /, *, __func=_dearpygui.get_item_configuration):
+    def pmin(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["pmin"]
         except KeyError:
@@ -7164,7 +7165,7 @@ class mvDrawRect(ChildItem, command="draw_rectangle", slot=2):
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def pmax(self, /, *, __func=_dearpygui.get_item_configuration):
+    def pmax(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["pmax"]
         except KeyError:
@@ -7194,7 +7195,7 @@ class mvDrawText(ChildItem, command="draw_text", slot=2):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def pos(self, /, *, __func=_dearpygui.get_item_configuration):
+    def pos(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["pos"]
         except KeyError:
@@ -7203,7 +7204,7 @@ class mvDrawText(ChildItem, command="draw_text", slot=2):
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def text(self, /, *, __func=_dearpygui.get_item_configuration):
+    def text(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["text"]
         except KeyError:
@@ -7247,7 +7248,7 @@ class mvDrawlist(ContainerItem, ChildItem, command="add_drawlist", slot=1):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def width(self, /, *, __func=_dearpygui.get_item_configuration):
+    def width(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["width"]
         except KeyError:
@@ -7256,7 +7257,7 @@ class mvDrawlist(ContainerItem, ChildItem, command="add_drawlist", slot=1):
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def height(self, /, *, __func=_dearpygui.get_item_configuration):
+    def height(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["height"]
         except KeyError:
@@ -7303,7 +7304,7 @@ class mvDynamicTexture(SupportsValueArray, ChildItem, command="add_dynamic_textu
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def width(self, /, *, __func=_dearpygui.get_item_configuration):
+    def width(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["width"]
         except KeyError:
@@ -7312,7 +7313,7 @@ class mvDynamicTexture(SupportsValueArray, ChildItem, command="add_dynamic_textu
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def height(self, /, *, __func=_dearpygui.get_item_configuration):
+    def height(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["height"]
         except KeyError:
@@ -7371,7 +7372,7 @@ class mvErrorSeries(SupportsValueArray, ChildItem, command="add_error_series", s
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def negative(self, /, *, __func=_dearpygui.get_item_configuration):
+    def negative(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["negative"]
         except KeyError:
@@ -7380,7 +7381,7 @@ class mvErrorSeries(SupportsValueArray, ChildItem, command="add_error_series", s
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def positive(self, /, *, __func=_dearpygui.get_item_configuration):
+    def positive(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["positive"]
         except KeyError:
@@ -7431,7 +7432,7 @@ class mvFileExtension(ChildItem, command="add_file_extension", slot=0):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def extension(self, /, *, __func=_dearpygui.get_item_configuration):
+    def extension(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["extension"]
         except KeyError:
@@ -7537,7 +7538,7 @@ class mvFont(ContainerItem, ChildItem, command="add_font", slot=1):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def file(self, /, *, __func=_dearpygui.get_item_configuration):
+    def file(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["file"]
         except KeyError:
@@ -7696,7 +7697,7 @@ class mvHeatSeries(SupportsValueArray, ChildItem, command="add_heat_series", slo
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def rows(self, /, *, __func=_dearpygui.get_item_configuration):
+    def rows(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["rows"]
         except KeyError:
@@ -7705,7 +7706,7 @@ class mvHeatSeries(SupportsValueArray, ChildItem, command="add_heat_series", slo
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def cols(self, /, *, __func=_dearpygui.get_item_configuration):
+    def cols(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["cols"]
         except KeyError:
@@ -7869,7 +7870,7 @@ class mvImageSeries(SupportsValueArray, ChildItem, command="add_image_series", s
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def bounds_min(self, /, *, __func=_dearpygui.get_item_configuration):
+    def bounds_min(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["bounds_min"]
         except KeyError:
@@ -7878,7 +7879,7 @@ class mvImageSeries(SupportsValueArray, ChildItem, command="add_image_series", s
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def bounds_max(self, /, *, __func=_dearpygui.get_item_configuration):
+    def bounds_max(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["bounds_max"]
         except KeyError:
@@ -8399,7 +8400,7 @@ class mvKeyDownHandler(ChildItem, command="add_key_down_handler", slot=1):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def key(self, /, *, __func=_dearpygui.get_item_configuration):
+    def key(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["key"]
         except KeyError:
@@ -8424,7 +8425,7 @@ class mvKeyPressHandler(ChildItem, command="add_key_press_handler", slot=1):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def key(self, /, *, __func=_dearpygui.get_item_configuration):
+    def key(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["key"]
         except KeyError:
@@ -8449,7 +8450,7 @@ class mvKeyReleaseHandler(ChildItem, command="add_key_release_handler", slot=1):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def key(self, /, *, __func=_dearpygui.get_item_configuration):
+    def key(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["key"]
         except KeyError:
@@ -8720,7 +8721,7 @@ class mvMouseClickHandler(ChildItem, command="add_mouse_click_handler", slot=1):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def button(self, /, *, __func=_dearpygui.get_item_configuration):
+    def button(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["button"]
         except KeyError:
@@ -8745,7 +8746,7 @@ class mvMouseDoubleClickHandler(ChildItem, command="add_mouse_double_click_handl
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def button(self, /, *, __func=_dearpygui.get_item_configuration):
+    def button(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["button"]
         except KeyError:
@@ -8770,7 +8771,7 @@ class mvMouseDownHandler(ChildItem, command="add_mouse_down_handler", slot=1):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def button(self, /, *, __func=_dearpygui.get_item_configuration):
+    def button(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["button"]
         except KeyError:
@@ -8795,7 +8796,7 @@ class mvMouseDragHandler(ChildItem, command="add_mouse_drag_handler", slot=1):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def button(self, /, *, __func=_dearpygui.get_item_configuration):
+    def button(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["button"]
         except KeyError:
@@ -8804,7 +8805,7 @@ class mvMouseDragHandler(ChildItem, command="add_mouse_drag_handler", slot=1):
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def threshold(self, /, *, __func=_dearpygui.get_item_configuration):
+    def threshold(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["threshold"]
         except KeyError:
@@ -8845,7 +8846,7 @@ class mvMouseReleaseHandler(ChildItem, command="add_mouse_release_handler", slot
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def button(self, /, *, __func=_dearpygui.get_item_configuration):
+    def button(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["button"]
         except KeyError:
@@ -9017,7 +9018,7 @@ class mvPieSeries(SupportsValueArray, ChildItem, command="add_pie_series", slot=
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def radius(self, /, *, __func=_dearpygui.get_item_configuration):
+    def radius(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["radius"]
         except KeyError:
@@ -9026,7 +9027,7 @@ class mvPieSeries(SupportsValueArray, ChildItem, command="add_pie_series", slot=
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def labels(self, /, *, __func=_dearpygui.get_item_configuration):
+    def labels(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["labels"]
         except KeyError:
@@ -9190,7 +9191,7 @@ class mvPlotAxis(ContainerItem, ChildItem, command="add_plot_axis", slot=1):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def axis(self, /, *, __func=_dearpygui.get_item_configuration):
+    def axis(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["axis"]
         except KeyError:
@@ -9475,7 +9476,7 @@ class mvRawTexture(ChildItem, command="add_raw_texture", slot=1):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def width(self, /, *, __func=_dearpygui.get_item_configuration):
+    def width(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["width"]
         except KeyError:
@@ -9484,7 +9485,7 @@ class mvRawTexture(ChildItem, command="add_raw_texture", slot=1):
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def height(self, /, *, __func=_dearpygui.get_item_configuration):
+    def height(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["height"]
         except KeyError:
@@ -10095,7 +10096,7 @@ class mvStaticTexture(SupportsValueArray, ChildItem, command="add_static_texture
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def width(self, /, *, __func=_dearpygui.get_item_configuration):
+    def width(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["width"]
         except KeyError:
@@ -10104,7 +10105,7 @@ class mvStaticTexture(SupportsValueArray, ChildItem, command="add_static_texture
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def height(self, /, *, __func=_dearpygui.get_item_configuration):
+    def height(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["height"]
         except KeyError:
@@ -10178,7 +10179,7 @@ class mvSubPlots(ContainerItem, ChildItem, command="add_subplots", slot=1):
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def rows(self, /, *, __func=_dearpygui.get_item_configuration):
+    def rows(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["rows"]
         except KeyError:
@@ -10187,7 +10188,7 @@ class mvSubPlots(ContainerItem, ChildItem, command="add_subplots", slot=1):
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def columns(self, /, *, __func=_dearpygui.get_item_configuration):
+    def columns(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["columns"]
         except KeyError:
@@ -10695,7 +10696,7 @@ class mvThemeColor(SupportsValueArray, ChildItem, command="add_theme_color", slo
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def target(self, /, *, __func=_dearpygui.get_item_configuration):
+    def target(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["target"]
         except KeyError:
@@ -10704,7 +10705,7 @@ class mvThemeColor(SupportsValueArray, ChildItem, command="add_theme_color", slo
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def category(self, /, *, __func=_dearpygui.get_item_configuration):
+    def category(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["category"]
         except KeyError:
@@ -10728,7 +10729,7 @@ class mvThemeComponent(ContainerItem, ChildItem, command="add_theme_component",
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def item_type(self, /, *, __func=_dearpygui.get_item_configuration):
+    def item_type(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["item_type"]
         except KeyError:
@@ -10768,7 +10769,7 @@ class mvThemeStyle(SupportsValueArray, ChildItem, command="add_theme_style", slo
             raise DearPyGuiError.from_exception(e)
 
     @property
-    def target(self, /, *, __func=_dearpygui.get_item_configuration):
+    def target(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["target"]
         except KeyError:
@@ -10777,7 +10778,7 @@ class mvThemeStyle(SupportsValueArray, ChildItem, command="add_theme_style", slo
             raise DearPyGuiError.from_exception(e)
     
     @property
-    def category(self, /, *, __func=_dearpygui.get_item_configuration):
+    def category(self, /, *, __func=_cache.get_item_configuration):
         try:
             return __func(self)["category"]
         except KeyError:
@@ -1,10 +1,10 @@
 import typing
-import inspect
 import threading
 
 from dearpygui import dearpygui, _dearpygui
 
 from dearpypixl.core import management
+from dearpypixl.core import dispatch
 from dearpypixl.core import interface
 from dearpypixl.core import metautil
 from dearpypixl.core.protocols import ItemCallback
@@ -437,48 +437,9 @@ def set_exit_callback(callback: ItemCallback | None, *, user_data: typing.Any =
         _FRAME_CALLBACKS.set(-1, callback, user_data=user_data)
 
 
-_JOB_ARGCOUNTS = {}
-
 @management.patch(dearpygui.run_callbacks)
-def run_callbacks(jobs: typing.Sequence[tuple[typing.Callable | None, typing.Any, typing.Any, typing.Any]]) -> None:
-    global _JOB_ARGCOUNTS
-
-    for callback, *args in jobs:
-        if callback is None:
-            continue
-
-        key = id(callback)
-
-        arg_count = _JOB_ARGCOUNTS.get(key, None)
-        if arg_count is None:
-            parameters = inspect.signature(callback).parameters.values()
-
-            arg_count = 0
-            for param in parameters:
-                if (
-                    arg_count > 3 or
-                    param.kind != param.POSITIONAL_ONLY or
-                    param.kind != param.POSITIONAL_OR_KEYWORD
-                ):
-                    break
-                arg_count += 1
-
-            _JOB_ARGCOUNTS[key] = arg_count
-
-        if arg_count == 3:
-            callback(*args)
-        else:
-            callback(*args[:arg_count])
-
-    cache_size = len(_JOB_ARGCOUNTS)
-    if cache_size > 10_000:
-        d = dict(_JOB_ARGCOUNTS.popitem() for _ in range(cache_size // 2))
-        # even though we created a new dict, we're going to keep
-        # using the old one since the interpreter has already
-        # allocated enough memory for it at its largest size
-        _JOB_ARGCOUNTS.clear()
-        _JOB_ARGCOUNTS.update(d)
-        d.clear()
+def run_callbacks(jobs: typing.Sequence[tuple[typing.Callable | None, typing.Any, typing.Any, typing.Any]], *, __dispatch=dispatch.dispatcher) -> None:
+    __dispatch(jobs)
 
 
 
@@ -1,14 +1,28 @@
 import typing
 import sys
+import json
 import time
+import array
+import heapq
+import inspect
+import itertools
+import threading
 import collections
+import concurrent.futures
 
 from dearpygui import dearpygui, _dearpygui
 
+from dearpypixl.core import cache
+from dearpypixl.core import dispatch
 from dearpypixl.core import management
+from dearpypixl.core import metautil
+from dearpypixl.core import redraw
 
+if typing.TYPE_CHECKING:
+    import asyncio
 
-__all__ = ("Runtime",)
+
+__all__ = ("Runtime", "FrameTimings")
 
 
 
@@ -39,8 +53,10 @@ class PAUSE(Signal):
     __slots__ = ()
 
     def __call__(self, runtime: Runtime, /) -> None:
+        signaled = runtime._signaled
         while True:
-            time.sleep(0)
+            signaled.wait()
+            signaled.clear()
             try:
                 runtime._emit_signal()
             except Signal as signal:
@@ -48,22 +64,231 @@ class PAUSE(Signal):
                 return
 
 
+class TimerHandle:
+    __slots__ = ("when", "interval", "callback", "args", "invalidate", "_cancelled", "_runtime")
+
+    def __init__(self, runtime: Runtime, when: int, interval: int, callback: typing.Callable, args: tuple, /) -> None:
+        self.when       = when
+        self.interval   = interval
+        self.callback   = callback
+        self.args       = args
+        self.invalidate = False
+        self._cancelled = False
+        self._runtime   = runtime
+
+    def __repr__(self, /) -> str:
+        state = " cancelled" if self._cancelled else ""
+        return f"<{type(self).__name__}{state} when={self.when} interval={self.interval} callback={self.callback!r}>"
+
+    def cancel(self, /) -> None:
+        if not self._cancelled:
+            self._cancelled = True
+            if self._runtime is not None:
+                self._runtime._timer_cancelled()
+
+    def cancelled(self, /) -> bool:
+        return self._cancelled
+
+
+class RuntimeFuture[R](concurrent.futures.Future):
+    def __init__(self, runtime: Runtime, source: concurrent.futures.Future[R], /) -> None:
+        super().__init__()
+        self._runtime = runtime
+        self._source  = source
+
+    def add_done_callback(self, fn: typing.Callable[[typing.Self], typing.Any], /) -> None:
+        # done callbacks are run by the runtime during updates
+        super().add_done_callback(lambda future, *, __post=self._runtime._completions.append: __post((fn, future)))
+
+    def cancel(self, /) -> bool:
+        return self._source.cancel() and super().cancel()
+
+    def _copy_state(self, source: concurrent.futures.Future[R], /) -> None:
+        if source.cancelled():
+            super().cancel()
+        elif (exc := source.exception()) is not None:
+            self.set_exception(exc)
+        else:
+            self.set_result(source.result())
+
+
+def _report_exception(future: concurrent.futures.Future, /) -> None:
+    future.result()
+
+def _report_task_exception(task: asyncio.Task, /) -> None:
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        task.get_loop().call_exception_handler({
+            "message": f"exception in item callback {task.get_coro()!r}",
+            "exception": exc,
+            "task": task,
+        })
+
+
+class FrameTimings:
+    PHASES = ("signal", "callbacks", "updates", "render", "frame")
+
+    __slots__ = ("capacity", "exporter", "frames", "_index", "_signal", "_callbacks", "_updates", "_render", "_frame")
+
+    def __init__(self, capacity: int = 600, /, *, exporter: typing.Callable[[typing.Self], typing.Any] | None = None) -> None:
+        if capacity < 1:
+            raise ValueError(f"expected a positive capacity, got {capacity!r}")
+        self.capacity = capacity
+        self.exporter = exporter
+        self.frames   = 0
+        self._index   = 0
+        # nanoseconds; preallocated so that recording doesn't allocate
+        self._signal    = array.array("q", bytes(8 * capacity))
+        self._callbacks = array.array("q", bytes(8 * capacity))
+        self._updates   = array.array("q", bytes(8 * capacity))
+        self._render    = array.array("q", bytes(8 * capacity))
+        self._frame     = array.array("q", bytes(8 * capacity))
+
+    def __repr__(self, /) -> str:
+        return f"{type(self).__name__}({self.capacity}, frames={self.frames})"
+
+    def __len__(self, /) -> int:
+        return min(self.frames, self.capacity)
+
+    def record(self, signal: int, callbacks: int, updates: int, render: int, frame: int, /) -> None:
+        index = self._index
+        self._signal[index]    = signal
+        self._callbacks[index] = callbacks
+        self._updates[index]   = updates
+        self._render[index]    = render
+        self._frame[index]     = frame
+        self.frames += 1
+
+        index += 1
+        if index < self.capacity:
+            self._index = index
+        else:
+            self._index = 0
+            if self.exporter is not None:
+                self.exporter(self)
+
+    def clear(self, /) -> None:
+        self.frames = self._index = 0
+
+    def get(self, phase: typing.Literal["signal", "callbacks", "updates", "render", "frame"], /) -> list[float]:
+        if phase not in self.PHASES:
+            raise ValueError(f"expected one of {self.PHASES!r}, got {phase!r}")
+        buffer = getattr(self, f"_{phase}")
+        if self.frames < self.capacity:
+            values = buffer[:self._index]
+        else:
+            values = buffer[self._index:] + buffer[:self._index]
+        return [ns / 1_000_000 for ns in values]
+
+    def summary(self, /) -> dict[str, dict[str, float]]:
+        summary = {}
+        for phase in self.PHASES:
+            values = sorted(self.get(phase))
+            if not values:
+                summary[phase] = dict.fromkeys(("p50", "p95", "p99", "max"), 0.0)
+                continue
+            last = len(values) - 1
+            summary[phase] = {
+                "p50": values[round(last * 0.50)],
+                "p95": values[round(last * 0.95)],
+                "p99": values[round(last * 0.99)],
+                "max": values[last],
+            }
+        return summary
+
+    def to_json(self, /, **kwargs) -> str:
+        return json.dumps({"frames": self.frames, "capacity": self.capacity, "summary": self.summary()}, **kwargs)
+
+
+class _IteratorTask:
+    # Advances an iterator by one step per call, then pushes itself back
+    # onto the runtime's queue until the iterator is exhausted.
+    __slots__ = ("_next", "_runtime", "_priority")
+
+    def __init__(self, iterator: typing.Iterator, runtime: Runtime, priority: int, /) -> None:
+        self._next     = iterator.__next__
+        self._runtime  = runtime
+        self._priority = priority
+
+    def __call__(self, /) -> None:
+        try:
+            self._next()
+        except StopIteration:
+            return
+        self._runtime.push(self, priority=self._priority)
+
+
 def _debug_process_callbacks(*, _get_callbacks=_dearpygui.get_callback_queue, _run_callbacks=dearpygui.run_callbacks) -> None:
     _run_callbacks(_get_callbacks())
 
 def _do_nothing() -> None: pass
 
+def _get_viewport_client_size(*, __func=_dearpygui.get_viewport_configuration) -> tuple[int, int]:
+    config = __func()
+    return config["client_width"], config["client_height"]
+
+
+# Frames rendered after the UI is marked as changed when rendering on
+# demand, giving Dear ImGui time to settle layout (auto-sized windows,
+# tables, etc. take more than one frame).
+_REDRAW_FRAMES = 3
+
+_INPUT_HANDLER_COMMANDS = (
+    dearpygui.add_mouse_move_handler,
+    dearpygui.add_mouse_wheel_handler,
+    dearpygui.add_mouse_click_handler,
+    dearpygui.add_mouse_down_handler,
+    dearpygui.add_mouse_release_handler,
+    dearpygui.add_key_press_handler,
+    dearpygui.add_key_down_handler,
+    dearpygui.add_key_release_handler,
+)
+
 class Runtime[T: typing.Callable]:
-    def __init__(self, /, *, frame_rate_limit: int = 0, update_interval: float = 2.0) -> None:
+    def __init__(self, /, *, frame_rate_limit: int = 0, update_interval: float = 2.0, pacing: bool = True, spin_interval: float = 1.0, on_demand: bool = False, min_refresh_rate: float = 4.0, task_budget: float = 0.0, event_loop_budget: float = 1000.0, max_workers: int | None = None, frame_timings: FrameTimings | None = None) -> None:
         self.queue = collections.deque[T]()
         self.ts_last_update = 0
         self.ts_last_render = 0
 
+        # (-priority, count, task)
+        self._prioritized: list[tuple[int, int, typing.Callable]] = []
+        self._task_lock = threading.Lock()
+        self._task_count = itertools.count()
+        self._tb_tasks = 0
+        self._tb_tasks_last_frame = 0
+
+        self._timers: list[tuple[int, int, TimerHandle]] = []
+        self._frame_timers: list[tuple[int, int, TimerHandle]] = []
+        self._timer_lock = threading.Lock()
+        self._timer_count = itertools.count()
+        self._timers_cancelled = 0
+
+        self._event_loop = None
+        self._owns_event_loop = False
+        self._coroutine_handler = None
+
+        self.frame_timings: FrameTimings | None = frame_timings
+
+        self._executors: dict[str, concurrent.futures.Executor] = {}
+        self._completions = collections.deque[tuple[typing.Callable, concurrent.futures.Future]]()
+        self.max_workers = max_workers
+
+        self._input_handlers = 0
+        self._idle_task = None
+        self._redraw_frames = _REDRAW_FRAMES
+        self._viewport_size = (0, 0)
+
         self.frame_rate_limit = frame_rate_limit
         self.update_interval = update_interval
+        self.pacing = pacing
+        self.spin_interval = spin_interval
+        self.on_demand = on_demand
+        self.min_refresh_rate = min_refresh_rate
+        self.task_budget = task_budget
+        self.event_loop_budget = event_loop_budget
 
         self._is_running = False
         self._emit_signal = _do_nothing
+        self._signaled = threading.Event()
         self._dpg_queue_processor = _do_nothing
 
     @property
@@ -87,16 +312,133 @@ class Runtime[T: typing.Callable]:
         else:
             self._update_interval = int(value * 1_000_000)
 
+    @property
+    def spin_interval(self, /) -> float:
+        return self._spin_interval / 1_000_000
+    @spin_interval.setter
+    def spin_interval(self, value: float, /) -> None:
+        # convert to nanoseconds
+        self._spin_interval = max(0, int(value * 1_000_000))
+
+    @property
+    def task_budget(self, /) -> float:
+        return self._task_budget / 1_000
+    @task_budget.setter
+    def task_budget(self, value: float, /) -> None:
+        # convert to nanoseconds
+        self._task_budget = max(0, int(value * 1_000))
+
+    @property
+    def task_time(self, /) -> float:
+        return self._tb_tasks_last_frame / 1_000
+
+    @property
+    def event_loop(self, /) -> asyncio.AbstractEventLoop | None:
+        return self._event_loop
+    @event_loop.setter
+    def event_loop(self, value: asyncio.AbstractEventLoop | None, /) -> None:
+        self._event_loop = value
+        self._owns_event_loop = False
+        self._set_coroutine_handler()
+    @event_loop.deleter
+    def event_loop(self, /) -> None:
+        self.event_loop = None
+
+    def new_event_loop(self, /) -> asyncio.AbstractEventLoop:
+        import asyncio  # not imported unless used (slow)
+        self.event_loop = loop = asyncio.new_event_loop()
+        self._owns_event_loop = True
+        return loop
+
+    def _set_coroutine_handler(self, /) -> None:
+        # The handler is only set while running; item callbacks are run on
+        # the runtime's thread (manual callback management), which is also
+        # the loop's thread.
+        loop = self._event_loop
+        if loop is None or not self._is_running:
+            if dispatch.dispatcher.coroutine_handler is self._coroutine_handler:
+                dispatch.dispatcher.coroutine_handler = None
+            self._coroutine_handler = None
+        else:
+            def _create_task(coroutine, *, __loop=loop, __report=_report_task_exception):
+                task = __loop.create_task(coroutine)
+                task.add_done_callback(__report)
+                return task
+            self._coroutine_handler = dispatch.dispatcher.coroutine_handler = _create_task
+
+    def _close_event_loop(self, /) -> None:
+        import asyncio
+        loop = self._event_loop
+        del self.event_loop
+        try:
+            if tasks := asyncio.all_tasks(loop):  # type: ignore
+                for task in tasks:
+                    task.cancel()
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))  # type: ignore
+            loop.run_until_complete(loop.shutdown_asyncgens())  # type: ignore
+        finally:
+            loop.close()  # type: ignore
+
+    @property
+    def event_loop_budget(self, /) -> float:
+        return self._event_loop_budget / 1_000
+    @event_loop_budget.setter
+    def event_loop_budget(self, value: float, /) -> None:
+        # convert to nanoseconds
+        self._event_loop_budget = max(0, int(value * 1_000))
+
+    @property
+    def on_demand(self, /) -> bool:
+        return self._on_demand
+    @on_demand.setter
+    def on_demand(self, value: bool, /) -> None:
+        self._on_demand = value = bool(value)
+        self._redraw_frames = _REDRAW_FRAMES
+        if self._input_handlers:
+            try:
+                _dearpygui.configure_item(self._input_handlers, show=value)
+            except SystemError:  # context was destroyed
+                self._input_handlers = 0
+
+    @property
+    def min_refresh_rate(self, /) -> float:
+        return 1_000_000_000 / self._idle_render_interval
+    @min_refresh_rate.setter
+    def min_refresh_rate(self, value: float, /) -> None:
+        # convert to an interval in nanoseconds
+        self._idle_render_interval = int(1_000_000_000 / max(0.1, value))
+
     @typing.overload
-    def configure(self, /, *, frame_rate_limit: int = ..., update_interval: float = ...) -> None: ...  # type: ignore
-    def configure(self, /, *, frame_rate_limit: int | None = None, update_interval: float | None = None):
+    def configure(self, /, *, frame_rate_limit: int = ..., update_interval: float = ..., pacing: bool = ..., spin_interval: float = ..., on_demand: bool = ..., min_refresh_rate: float = ..., task_budget: float = ..., event_loop_budget: float = ...) -> None: ...  # type: ignore
+    def configure(self, /, *, frame_rate_limit: int | None = None, update_interval: float | None = None, pacing: bool | None = None, spin_interval: float | None = None, on_demand: bool | None = None, min_refresh_rate: float | None = None, task_budget: float | None = None, event_loop_budget: float | None = None):
         if frame_rate_limit is not None:
             self.frame_rate_limit = frame_rate_limit
         if update_interval is not None:
             self.update_interval = update_interval
+        if pacing is not None:
+            self.pacing = pacing
+        if spin_interval is not None:
+            self.spin_interval = spin_interval
+        if on_demand is not None:
+            self.on_demand = on_demand
+        if min_refresh_rate is not None:
+            self.min_refresh_rate = min_refresh_rate
+        if task_budget is not None:
+            self.task_budget = task_budget
+        if event_loop_budget is not None:
+            self.event_loop_budget = event_loop_budget
 
     def configuration(self, /) -> dict[str, typing.Any]:
-        return {"frame_rate_limit": self.frame_rate_limit, "update_interval": self.update_interval}
+        return {
+            "frame_rate_limit": self.frame_rate_limit,
+            "update_interval": self.update_interval,
+            "pacing": self.pacing,
+            "spin_interval": self.spin_interval,
+            "on_demand": self.on_demand,
+            "min_refresh_rate": self.min_refresh_rate,
+            "task_budget": self.task_budget,
+            "event_loop_budget": self.event_loop_budget,
+        }
 
     @property
     def frame_rate(self, /) -> float:
@@ -110,59 +452,290 @@ class Runtime[T: typing.Callable]:
     def time_elapsed(self, /) -> float:
         return _dearpygui.get_total_time()
 
-    def update(self, /) -> None:
+    def get_executor(self, executor: typing.Literal["thread", "process"] | concurrent.futures.Executor = "thread", /) -> concurrent.futures.Executor:
+        if isinstance(executor, concurrent.futures.Executor):
+            return executor
         try:
-            task = self.queue.popleft()
-        except IndexError:
-            # This implementation does not "look" before popping the queue. This
-            # makes task-heavy applications more performant overall, but task-light
-            # applications take a performance hit from repeatedly handling
-            # `IndexError`. This function helps limit the latter by ensuring there's
-            # always a task to pop.
-            def _internal_runtime_task(*, __queue=self.queue):
-                __queue.append(_internal_runtime_task)  # type: ignore
-            _internal_runtime_task.__name__ = "_internal_runtime_task"
-
-            self.queue.append(_internal_runtime_task)  # type: ignore
+            return self._executors[executor]
+        except KeyError:
+            pass
+        match executor:
+            case "thread":
+                pool = concurrent.futures.ThreadPoolExecutor(self.max_workers, thread_name_prefix="dearpypixl")
+            case "process":
+                pool = concurrent.futures.ProcessPoolExecutor(self.max_workers)
+            case _:
+                raise ValueError(f"expected 'thread', 'process' or an executor, got {executor!r}")
+        return self._executors.setdefault(executor, pool)
+
+    def submit[R](self, fn: typing.Callable[..., R], /, *args, executor: typing.Literal["thread", "process"] | concurrent.futures.Executor = "thread", **kwargs) -> RuntimeFuture[R]:
+        source = self.get_executor(executor).submit(fn, *args, **kwargs)
+        future = RuntimeFuture(self, source)
+        source.add_done_callback(future._copy_state)
+        return future
+
+    def set_callback_executor(self, item: typing.Any, executor: typing.Literal["thread", "process"] | concurrent.futures.Executor | None, /) -> None:
+        offloaded = dispatch.dispatcher.executors
+        # keyed by UUID, as senders may be reported as UUIDs or aliases
+        if isinstance(item, str):
+            uuid = cache.get_alias_id(item)
+            if not uuid:
+                raise ValueError(f"no item is aliased {item!r}")
+        else:
+            uuid = int(item)
+        if executor is None:
+            offloaded.pop(uuid, None)
+            return
+        self.get_executor(executor)  # validate
+
+        def submit_callback(callback, sender, app_data, user_data, /, *, __arity=metautil.get_positional_arity):
+            args = (sender, app_data, user_data)
+            if 0 <= (arity := __arity(callback)) < 3:
+                args = args[:arity]
+            self.submit(callback, *args, executor=executor).add_done_callback(_report_exception)
+
+        offloaded[uuid] = submit_callback
+
+    def shutdown_executors(self, /, *, wait: bool = True, cancel_futures: bool = False) -> None:
+        executors = list(self._executors.values())
+        self._executors.clear()
+        for executor in executors:
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def _run_completions(self, /) -> None:
+        completions = self._completions
+        while completions:
+            fn, future = completions.popleft()
+            try:
+                fn(future)
+            except Exception:
+                sys.excepthook(*sys.exc_info())
+        redraw.mark()
+
+    def push(self, task: typing.Callable | typing.Iterator, /, *, priority: int = 0) -> None:
+        if inspect.isgeneratorfunction(task):
+            task = task()
+        if not callable(task):
+            task = _IteratorTask(iter(task), self, priority)
+
+        if priority:
+            with self._task_lock:
+                heapq.heappush(self._prioritized, (-priority, next(self._task_count), task))
+        else:
+            self.queue.append(task)
 
+    def update(self, /, *, __timer=time.perf_counter_ns) -> None:
+        budget = self._task_budget
+        if budget and self._tb_tasks >= budget:
             return
-        task()
+
+        prioritized = self._prioritized
+        ts_start = ts_end = __timer()
+        try:
+            while True:
+                if prioritized and prioritized[0][0] < 0:
+                    with self._task_lock:
+                        task = heapq.heappop(prioritized)[2]
+                else:
+                    try:
+                        task = self.queue.popleft()
+                    except IndexError:
+                        # This implementation does not "look" before popping the queue. This
+                        # makes task-heavy applications more performant overall, but task-light
+                        # applications take a performance hit from repeatedly handling
+                        # `IndexError`. This function helps limit the latter by ensuring there's
+                        # always a task to pop.
+                        def _internal_runtime_task(*, __queue=self.queue):
+                            __queue.append(_internal_runtime_task)  # type: ignore
+                        _internal_runtime_task.__name__ = "_internal_runtime_task"
+
+                        self._idle_task = task = _internal_runtime_task
+
+                    if task is self._idle_task:
+                        self.queue.append(task)  # type: ignore
+                        if not prioritized:
+                            # tasks queued behind the sentinel run if the
+                            # budget allows
+                            if budget and len(self.queue) > 1:
+                                continue
+                            return
+                        with self._task_lock:
+                            task = heapq.heappop(prioritized)[2]
+
+                task()
+                redraw.mark()
+
+                ts_end = __timer()
+                if not budget or self._tb_tasks + ts_end - ts_start >= budget:
+                    return
+        finally:
+            self._tb_tasks += ts_end - ts_start
+
+    def _step_event_loop(self, /, *, __timer=time.perf_counter_ns) -> None:
+        loop = self._event_loop
+        if loop is None:
+            return
+
+        # Stopping the loop before it runs makes `run_forever()` run exactly
+        # one iteration: ready callbacks are run and I/O is polled without
+        # blocking. Iterations are repeated while callbacks are ready and the
+        # budget allows. There is no public API to tell whether any are, so
+        # this relies on the `_ready` queue of `asyncio.BaseEventLoop`; other
+        # loops (e.g. uvloop) run one iteration per update.
+        ready = getattr(loop, "_ready", None)
+        if ready is None:
+            loop.call_soon(loop.stop)
+            loop.run_forever()
+            return
+
+        deadline = __timer() + self._event_loop_budget
+        stop = loop.stop
+        while True:
+            loop.call_soon(stop)
+            loop.run_forever()
+            if not ready or __timer() >= deadline:
+                return
 
     # native C Python functions don't support the descriptor protocol,
     # so they'll always be "static" (although the type checker doesn't
     # know that)
     render = typing.cast(staticmethod, _dearpygui.render_dearpygui_frame)
 
+    _is_dearpygui_running = typing.cast(staticmethod, _dearpygui.is_dearpygui_running)
+
+    _get_viewport_size = staticmethod(_get_viewport_client_size)
+
+    _get_frame_count = typing.cast(staticmethod, _dearpygui.get_frame_count)
+
+    def invalidate(self, /) -> None:
+        redraw.mark()
+
+    def call_at(self, when: int, callback: typing.Callable, /, *args) -> TimerHandle:
+        handle = TimerHandle(self, when, 0, callback, args)
+        with self._timer_lock:
+            heapq.heappush(self._timers, (when, next(self._timer_count), handle))
+        return handle
+
+    def call_later(self, delay: float, callback: typing.Callable, /, *args) -> TimerHandle:
+        return self.call_at(time.perf_counter_ns() + int(delay * 1_000_000), callback, *args)
+
+    def call_every(self, interval: float, callback: typing.Callable, /, *args) -> TimerHandle:
+        if interval <= 0:
+            raise ValueError(f"expected a positive interval, got {interval!r}")
+        interval = max(1, int(interval * 1_000_000))
+        handle = TimerHandle(self, time.perf_counter_ns() + interval, interval, callback, args)
+        with self._timer_lock:
+            heapq.heappush(self._timers, (handle.when, next(self._timer_count), handle))
+        return handle
+
+    def call_on_frame(self, frame: int, callback: typing.Callable, /, *args) -> TimerHandle:
+        handle = TimerHandle(self, frame, 0, callback, args)
+        with self._timer_lock:
+            heapq.heappush(self._frame_timers, (frame, next(self._timer_count), handle))
+        return handle
+
+    def _timer_cancelled(self, /) -> None:
+        with self._timer_lock:
+            self._timers_cancelled += 1
+
+    def _run_timers(self, timers: list[tuple[int, int, TimerHandle]], now: int, /) -> None:
+        # Due timers are popped in one go so that callbacks can schedule (and
+        # cancel) timers freely. Periodic timers are rescheduled relative to
+        # their previous deadline rather than `now` so that they don't drift;
+        # missed periods are skipped instead of being run back-to-back.
+        due = []
+        with self._timer_lock:
+            while timers and timers[0][0] <= now:
+                handle = heapq.heappop(timers)[2]
+                if handle._cancelled:
+                    self._timers_cancelled -= 1
+                else:
+                    # not in a heap; cancelling it must not be counted
+                    handle._runtime = None
+                    due.append(handle)
+
+            cancelled = self._timers_cancelled
+            if cancelled > 64 and cancelled * 2 > len(self._timers) + len(self._frame_timers):
+                for heap in (self._timers, self._frame_timers):
+                    heap[:] = [entry for entry in heap if not entry[2]._cancelled]
+                    heapq.heapify(heap)
+                self._timers_cancelled = 0
+
+        index = 0
+        try:
+            for index, handle in enumerate(due, 1):
+                if handle._cancelled:
+                    continue
+                if interval := handle.interval:
+                    when = handle.when + interval
+                    if when <= now:
+                        when += (now - when) // interval * interval + interval
+                    handle.when = when
+                    handle._runtime = self
+                    with self._timer_lock:
+                        heapq.heappush(self._timers, (when, next(self._timer_count), handle))
+                handle.callback(*handle.args)
+                if handle.invalidate:
+                    redraw.mark()
+        finally:
+            if index < len(due):
+                # a callback raised; the timers it was run with are still due
+                with self._timer_lock:
+                    for handle in due[index:]:
+                        if not handle._cancelled:
+                            handle._runtime = self
+                            heapq.heappush(timers, (handle.when, next(self._timer_count), handle))
+
     def is_running(self, /) -> bool:
         return self._is_running
 
     def run(self, /) -> None:
         self._is_running = True
+        self._set_coroutine_handler()
 
         try:
             timer   = time.perf_counter_ns
+            sleep   = time.sleep
             render  = self.render
             update  = self.update
-            running = _dearpygui.is_dearpygui_running
+            step_event_loop = self._step_event_loop
+            completions     = self._completions
+            running = self._is_dearpygui_running
+            consume = redraw.consume
+            vp_size = self._get_viewport_size
+            timers  = self._timers
+            frames  = self._frame_timers
+            frame   = self._get_frame_count
 
             process_backend_queue = self._dpg_queue_processor
 
             tb_updates = 0
             tb_idle    = 0
 
-            self.ts_last_update = self.ts_last_render = timer()
+            # time spent per phase since the last render (`frame_timings`)
+            tb_signal    = 0
+            tb_callbacks = 0
+            tb_ticks     = 0
+
+            self.ts_last_update = self.ts_last_render = ts_last_frame = timer()
             render()
 
             while True:
 
                 while running():
+                    ts_loop = timer()
                     try:
                         self._emit_signal()
                     except Signal as e:
                         signal = e
                         break
 
+                    ts_signal = timer()
                     process_backend_queue()
+                    ts_callbacks = timer()
+
+                    if timers and timers[0][0] <= ts_callbacks:
+                        self._run_timers(timers, ts_callbacks)
 
                     ts_this_update      = timer() - tb_idle
                     tb_updates          = tb_updates + ts_this_update - self.ts_last_update
@@ -171,12 +744,58 @@ class Runtime[T: typing.Callable]:
                     update_interval = self._update_interval
                     while tb_updates >= update_interval:
                         update()
+                        step_event_loop()
+                        if completions:
+                            self._run_completions()
                         tb_updates -= update_interval
 
-                    ts_this_render = timer()
-                    if ts_this_render - self.ts_last_render >= self._render_interval:
+                    ts_this_render  = timer()
+                    render_interval = self._render_interval
+
+                    tb_signal    += ts_signal - ts_loop
+                    tb_callbacks += ts_callbacks - ts_signal
+                    tb_ticks     += ts_this_render - ts_callbacks
+                    if self._on_demand:
+                        # Render at the frame rate limit for a few frames after
+                        # something changed, otherwise at the minimum refresh rate.
+                        # Input and viewport resizes are only seen while rendering.
+                        if consume():
+                            self._redraw_frames = _REDRAW_FRAMES
+                        elif not self._redraw_frames:
+                            render_interval = max(render_interval, self._idle_render_interval)
+
+                    if ts_this_render - self.ts_last_render >= render_interval:
                         self.ts_last_render = ts_this_render
                         render()
+                        ts_rendered = timer()
+                        if (timings := self.frame_timings) is not None:
+                            timings.record(tb_signal, tb_callbacks, tb_ticks, ts_rendered - ts_this_render, ts_rendered - ts_last_frame)
+                        tb_signal = tb_callbacks = tb_ticks = 0
+                        ts_last_frame = ts_rendered
+
+                        self._tb_tasks_last_frame = self._tb_tasks
+                        self._tb_tasks = 0
+                        if frames and frames[0][0] <= (frame_count := frame()):
+                            self._run_timers(frames, frame_count)
+                        if self._on_demand:
+                            if self._redraw_frames:
+                                self._redraw_frames -= 1
+                            if (size := vp_size()) != self._viewport_size:
+                                self._viewport_size = size
+                                self._redraw_frames = _REDRAW_FRAMES
+                    elif self.pacing:
+                        # Sleep until the next update is due or shortly before the
+                        # next render is due, then spin the rest of the way to the
+                        # render (sleeping alone is not precise enough to meet it).
+                        # Late updates are caught up by the fixed time step.
+                        ts_next_render = self.ts_last_render + render_interval - self._spin_interval
+                        ts_next_update = self.ts_last_update + tb_idle + update_interval - tb_updates
+                        if timers:
+                            tb_sleep = min(ts_next_render, ts_next_update, timers[0][0]) - timer()
+                        else:
+                            tb_sleep = min(ts_next_render, ts_next_update) - timer()
+                        if tb_sleep > 0:
+                            sleep(tb_sleep / 1_000_000_000)
 
                 ts_idle = timer()
                 try:
@@ -189,10 +808,15 @@ class Runtime[T: typing.Callable]:
                 except RuntimeExit:
                     break
                 finally:
-                    tb_idle += timer() - ts_idle
+                    tb_paused = timer() - ts_idle
+                    tb_idle += tb_paused
+                    ts_last_frame += tb_paused
 
         finally:
             self._is_running = False
+            self._set_coroutine_handler()
+            if self._owns_event_loop:
+                self._close_event_loop()
 
     PAUSE  = PAUSE
     RESUME = RESUME
@@ -206,6 +830,7 @@ class Runtime[T: typing.Callable]:
                 self._emit_signal = _do_nothing
 
         self._emit_signal = emitter
+        self._signaled.set()
 
     @management.initializer
     def start(self, *, debug: bool | None = False):
@@ -213,7 +838,7 @@ class Runtime[T: typing.Callable]:
             return self.signal(self.RESUME)
 
         if (
-            (debug or dearpygui.get_app_configuration()["manual_callback_management"]) or
+            (debug or self._event_loop is not None or dearpygui.get_app_configuration()["manual_callback_management"]) or
             debug is None and sys.gettrace() is not None
         ):
             processor = _debug_process_callbacks
@@ -233,8 +858,15 @@ class Runtime[T: typing.Callable]:
             if not dearpygui.is_viewport_ok():
                 raise RuntimeError("cannot create and/or initialize viewport")
 
+        if not self._input_handlers or not _dearpygui.does_item_exist(self._input_handlers):
+            # marks the UI as changed on input while rendering on demand
+            self._input_handlers = _dearpygui.add_handler_registry(show=self._on_demand)
+            for command in _INPUT_HANDLER_COMMANDS:
+                command(callback=redraw.mark, parent=self._input_handlers)
+
         self._dpg_queue_processor = processor
         self._emit_signal = _do_nothing
+        self._signaled.clear()
 
         self.run()
 
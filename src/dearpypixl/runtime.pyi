@@ -26,9 +26,12 @@ dpg.start_dearpygui()
 """
 from typing import *
 from collections import deque
+import asyncio
+import concurrent.futures
+from dearpypixl.core.protocols import Item
 
 
-__all__ = ("Runtime",)
+__all__ = ("Runtime", "FrameTimings")
 
 
 
@@ -46,7 +49,8 @@ class Signal(StopIteration):
 class PAUSE(Signal):
     """A signal processed by a :py:class:`Runtime` object. When
     processed, the runtime will halt until it receives another
-    signal.
+    signal. The paused runtime blocks (without polling) while
+    waiting.
     """
 
 @final
@@ -76,6 +80,111 @@ class RuntimeExit(StopIteration):
     """
 
 
+class TimerHandle:
+    """Returned when scheduling a callback via :py:meth:`Runtime.call_at()`,
+    :py:meth:`Runtime.call_later()`, :py:meth:`Runtime.call_every()` or
+    :py:meth:`Runtime.call_on_frame()`.
+
+    :vartype when: `int`
+    :var when: The deadline of the next call; a `time.perf_counter_ns()`
+        timestamp, or a frame number for :py:meth:`Runtime.call_on_frame()`.
+
+    :vartype interval: `int`
+    :var interval: The period of a :py:meth:`Runtime.call_every()` timer in
+        nanoseconds, or `0` for one-shot timers.
+
+    :vartype invalidate: `bool`
+    :var invalidate: If `True`, the UI is considered changed each time the
+        callback runs (see :py:attr:`Runtime.on_demand`). Defaults to `False`;
+        writes made by the callback through DearPyPixl are detected either way.
+    """
+    when: int
+    interval: int
+    callback: Callable
+    args: tuple
+    invalidate: bool
+    def cancel(self, /) -> None:
+        """Prevent the callback from being called again. Does nothing if
+        the timer was already cancelled or has run."""
+    def cancelled(self, /) -> bool:
+        """Return `True` if the timer was cancelled."""
+
+
+class RuntimeFuture[R](concurrent.futures.Future[R]):
+    """Returned by :py:meth:`Runtime.submit()`. Mirrors the state of the
+    future returned by the executor, but callbacks added via
+    :py:meth:`add_done_callback()` are run by the runtime during its
+    updates (on the thread running the event loop) instead of by the
+    worker that completed the future. These callbacks can safely interact
+    with items without locking DearPyGui's mutex.
+
+    Exceptions raised by done callbacks are reported via `sys.excepthook`.
+    """
+    def add_done_callback(self, fn: Callable[[Self], Any], /) -> None: ...
+    def cancel(self, /) -> bool: ...
+
+
+class FrameTimings:
+    """Records where a :py:class:`Runtime` event loop spends its time, per
+    rendered frame, in a fixed-size ring buffer. Assign an instance to
+    :py:attr:`Runtime.frame_timings` to start recording.
+
+    The following phases are recorded for each frame:
+        - "signal": checking for signals
+        - "callbacks": processing DearPyGui's callback queue (under manual
+        callback management)
+        - "updates": running timers, tasks, the asyncio event loop and the
+        done callbacks of futures
+        - "render": rendering the frame
+        - "frame": the total time since the previous frame was rendered,
+        including time spent sleeping (but not while paused)
+
+    Buffers are allocated up front; recording a frame does not allocate.
+
+    :vartype PHASES: `tuple[str, ...]`
+    :var PHASES: The names of the recorded phases.
+
+    :vartype capacity: `int`
+    :var capacity: The number of most recent frames kept.
+
+    :vartype frames: `int`
+    :var frames: The number of frames recorded since creation or the last
+        :py:meth:`clear()`.
+
+    :vartype exporter: `Callable[[FrameTimings], Any] | None`
+    :var exporter: Called with the instance each time *capacity* frames have
+        been recorded, e.g. to send :py:meth:`summary()` or :py:meth:`to_json()`
+        to a dashboard. It is called from the event loop.
+    """
+    PHASES: ClassVar[tuple[str, ...]]
+    capacity: int
+    frames: int
+    exporter: Callable[[Self], Any] | None
+    def __init__(self, capacity: int = 600, /, *, exporter: Callable[[Self], Any] | None = None) -> None:
+        """
+        :raises `ValueError`: *capacity* is not positive.
+        """
+    def __len__(self, /) -> int:
+        """Return the number of frames kept in the buffer."""
+    def record(self, signal: int, callbacks: int, updates: int, render: int, frame: int, /) -> None:
+        """Record the timings (in nanoseconds) of a frame. Called by the
+        runtime."""
+    def clear(self, /) -> None:
+        """Discard all recorded frames."""
+    def get(self, phase: Literal["signal", "callbacks", "updates", "render", "frame"], /) -> list[float]:
+        """Return the timings of *phase* for the frames in the buffer, oldest
+        first, in milliseconds.
+
+        :raises `ValueError`: *phase* is not one of :py:attr:`PHASES`.
+        """
+    def summary(self, /) -> dict[str, dict[Literal["p50", "p95", "p99", "max"], float]]:
+        """Return the 50th, 95th and 99th percentile and maximum timings of
+        each phase for the frames in the buffer, in milliseconds."""
+    def to_json(self, /, **kwargs) -> str:
+        """Return the frame count, capacity and :py:meth:`summary()` as a
+        JSON string. Keyword arguments are passed to `json.dumps()`."""
+
+
 class Runtime[T: Callable]:
     """Minimalistic event loop implementation for DearPyGui and
     DearPyPixl. Users can push tasks to run within the loop.
@@ -107,6 +216,50 @@ class Runtime[T: Callable]:
     updates or affecting frame rate, consider breaking it up into smaller
     functions.
 
+    Alternatively, a per-frame time budget can be set via
+    :py:attr:`Runtime.task_budget`. Each update then runs queued tasks until
+    the time spent running tasks since the last rendered frame exceeds the
+    budget, after which updates run nothing until the next frame. Tasks
+    pushed via :py:meth:`Runtime.push()` may be prioritized, and may be
+    iterators (such as generators) that are advanced one step per task run,
+    allowing heavy work to be split across frames by yielding.
+
+    Callbacks can also be scheduled to run at or after a point in time,
+    periodically, or once a frame is rendered via :py:meth:`Runtime.call_at()`,
+    :py:meth:`Runtime.call_later()`, :py:meth:`Runtime.call_every()` and
+    :py:meth:`Runtime.call_on_frame()`. Timers are kept in a heap ordered by
+    deadline, so scheduling and cancelling a timer costs `O(log n)` regardless
+    of how many timers are active. Due timers run in deadline order once per
+    event loop iteration, before updates. These methods are thread-safe.
+
+    The runtime can also drive an asyncio event loop (:py:attr:`Runtime.event_loop`)
+    on the same thread. The loop is stepped once per update: ready callbacks
+    are run and I/O is polled without blocking, repeating while callbacks are
+    ready and :py:attr:`Runtime.event_loop_budget` allows (loops not derived
+    from `asyncio.BaseEventLoop`, such as uvloop's, are stepped once). When
+    a loop is attached before :py:meth:`Runtime.start()` is called,
+    DearPyGui's manual callback management is enabled, and item callbacks
+    declared with `async def` are scheduled on the loop instead of being
+    called. Code running on the loop can safely interact with items without
+    locking DearPyGui's mutex.
+
+    Slow work can be offloaded to a thread or process pool via
+    :py:meth:`Runtime.submit()`. The done callbacks of the returned futures
+    are run during updates, so they can apply results to items directly.
+
+    When :py:attr:`Runtime.on_demand` is `True`, frames are only rendered
+    (at up to :py:attr:`Runtime.frame_rate_limit`) for a few frames after
+    the UI changed, and at :py:attr:`Runtime.min_refresh_rate` otherwise.
+    The UI is considered changed when a queued task runs, when a timer whose
+    handle's :py:attr:`TimerHandle.invalidate` is set runs, when an
+    item is configured or has its value set through DearPyPixl
+    (`AppItem.configure()`, property and value setters, `ValueArray` mutators,
+    etc), on mouse or keyboard input, and when the viewport is resized. Input and resizes are
+    detected while rendering, so the first frame following idle input is
+    delayed by up to one minimum refresh interval. Writes made by calling
+    DearPyGui directly are not detected; call :py:meth:`Runtime.invalidate()`
+    after making them.
+
     :vartype PAUSE: `ClassVar[type[PAUSE]]`
     :var PAUSE: A built-in signal. Refer to :py:meth:`Runtime.signal()`
         and :py:class:`PAUSE` for more information.
@@ -128,6 +281,47 @@ class Runtime[T: Callable]:
         number of milliseconds each update will "consume" (min. `0.1`).
         Serves as the upper limit for updates churned over a length of time.
 
+    :vartype pacing: `bool`
+    :var pacing: If `True` and a frame rate limit is set (or rendering on
+        demand), the event loop sleeps between the deadlines of renders and
+        updates instead of polling for them. Defaults to `True`.
+
+    :vartype spin_interval: `float`
+    :var spin_interval: When pacing, the number of milliseconds before a
+        deadline that the event loop stops sleeping and polls instead. Higher
+        values trade CPU time for more accurate frame pacing.
+
+    :vartype on_demand: `bool`
+    :var on_demand: If `True`, only render frames when the UI has changed
+        or at the minimum refresh rate. Defaults to `False`.
+
+    :vartype min_refresh_rate: `float`
+    :var min_refresh_rate: When rendering on demand, the number of frames to
+        render per second while the UI is unchanged (min. `0.1`). Defaults to
+        `4.0`.
+
+    :vartype task_budget: `float`
+    :var task_budget: The number of microseconds per frame that updates may
+        spend running tasks. When `0` (the default), one task is run per
+        update.
+
+    :vartype event_loop_budget: `float`
+    :var event_loop_budget: The number of microseconds each update may spend
+        stepping the asyncio event loop (one step always runs). Only applies
+        to loops derived from `asyncio.BaseEventLoop`, since others cannot
+        report whether callbacks are ready; those are stepped once per
+        update. Defaults to `1000.0`.
+
+    :vartype max_workers: `int | None`
+    :var max_workers: The maximum number of workers of the thread and process
+        pools created by :py:meth:`Runtime.get_executor()`. When `None`,
+        defaults to the `concurrent.futures` defaults. Changes do not affect
+        pools that were already created.
+
+    :vartype frame_timings: `FrameTimings | None`
+    :var frame_timings: When set, the time spent in each phase of the event
+        loop is recorded per rendered frame. Defaults to `None`.
+
     :vartype queue: `deque[Callable]`
     :var queue: Contains updates to be processed by the runtime.
         Internally, it is only referenced by :py:meth:`Runtime.update()`.
@@ -153,7 +347,10 @@ class Runtime[T: Callable]:
     queue: deque[T]
     ts_last_update: float
     ts_last_render: float
-    def __init__(self, /, *, frame_rate_limit: int = 0, update_interval: float = 2.0) -> None: ...
+    pacing: bool
+    max_workers: int | None
+    frame_timings: FrameTimings | None
+    def __init__(self, /, *, frame_rate_limit: int = 0, update_interval: float = 2.0, pacing: bool = True, spin_interval: float = 1.0, on_demand: bool = False, min_refresh_rate: float = 4.0, task_budget: float = 0.0, event_loop_budget: float = 1000.0, max_workers: int | None = None, frame_timings: FrameTimings | None = None) -> None: ...
     @property
     def frame_rate_limit(self) -> int:
         """[**get**, **set**] the upper limit of frames to render per second.
@@ -167,8 +364,63 @@ class Runtime[T: Callable]:
         window of time."""
     @update_interval.setter
     def update_interval(self, value: float, /) -> None: ...
-    def configure(self, /, *, frame_rate_limit: int = ..., update_interval: float = ...) -> None: ...
-    def configuration(self, /) -> dict[Literal["frame_rate_limit", "update_interval"], Any]: ...
+    @property
+    def spin_interval(self, /) -> float:
+        """[**get**, **set**] the number of milliseconds before a render or
+        update deadline that a pacing event loop stops sleeping (min. `0`)."""
+    @spin_interval.setter
+    def spin_interval(self, value: float, /) -> None: ...
+    @property
+    def task_budget(self, /) -> float:
+        """[**get**, **set**] the number of microseconds per frame that updates
+        may spend running tasks, or `0` to run one task per update."""
+    @task_budget.setter
+    def task_budget(self, value: float, /) -> None: ...
+    @property
+    def task_time(self, /) -> float:
+        """[**get**] the number of microseconds spent running tasks between
+        the two most recently rendered frames."""
+    @property
+    def event_loop(self, /) -> asyncio.AbstractEventLoop | None:
+        """[**get**, **set**, **del**] the asyncio event loop driven by the
+        runtime, or `None` (the default). Deleting (or setting to `None`)
+        detaches the loop without closing it.
+
+        The loop must not be running in another thread. A loop set here is
+        not stopped or closed when the runtime stops; use
+        :py:meth:`Runtime.new_event_loop()` for a loop owned by the runtime.
+        While the runtime is running, coroutines of `async def` item callbacks
+        are scheduled on the loop as tasks. Exceptions raised by these tasks
+        are reported through the loop's exception handler.
+        """
+    @event_loop.setter
+    def event_loop(self, value: asyncio.AbstractEventLoop | None, /) -> None: ...
+    @event_loop.deleter
+    def event_loop(self, /) -> None: ...
+    def new_event_loop(self, /) -> asyncio.AbstractEventLoop:
+        """Create an asyncio event loop, attach it as :py:attr:`Runtime.event_loop`,
+        and return it. The loop is owned by the runtime; when the runtime stops,
+        its pending tasks are cancelled and the loop is detached and closed."""
+    @property
+    def event_loop_budget(self, /) -> float:
+        """[**get**, **set**] the number of microseconds each update may spend
+        stepping the asyncio event loop."""
+    @event_loop_budget.setter
+    def event_loop_budget(self, value: float, /) -> None: ...
+    @property
+    def on_demand(self, /) -> bool:
+        """[**get**, **set**] if `True`, only render frames when the UI has
+        changed or at the minimum refresh rate."""
+    @on_demand.setter
+    def on_demand(self, value: bool, /) -> None: ...
+    @property
+    def min_refresh_rate(self, /) -> float:
+        """[**get**, **set**] the number of frames to render per second while
+        rendering on demand and the UI is unchanged (min. `0.1`)."""
+    @min_refresh_rate.setter
+    def min_refresh_rate(self, value: float, /) -> None: ...
+    def configure(self, /, *, frame_rate_limit: int = ..., update_interval: float = ..., pacing: bool = ..., spin_interval: float = ..., on_demand: bool = ..., min_refresh_rate: float = ..., task_budget: float = ..., event_loop_budget: float = ...) -> None: ...
+    def configuration(self, /) -> dict[Literal["frame_rate_limit", "update_interval", "pacing", "spin_interval", "on_demand", "min_refresh_rate", "task_budget", "event_loop_budget"], Any]: ...
     @property
     def frame_rate(self, /) -> float:
         """[**get**] the average frame rate across 120 frames."""
@@ -181,15 +433,82 @@ class Runtime[T: Callable]:
         runtime was started. By default, this returns the result of
         `dearpygui.get_total_time()`.
         """
+    def get_executor(self, executor: Literal["thread", "process"] | concurrent.futures.Executor = "thread", /) -> concurrent.futures.Executor:
+        """Return the runtime's thread pool (`"thread"`) or process pool
+        (`"process"`), creating it if needed. Executor instances are returned
+        as-is.
+
+        :raises `ValueError`: *executor* is not a recognized pool name.
+        """
+    def submit[R](self, fn: Callable[..., R], /, *args, executor: Literal["thread", "process"] | concurrent.futures.Executor = "thread", **kwargs) -> RuntimeFuture[R]:
+        """Schedule `fn(*args, **kwargs)` to run in *executor* and return a
+        :py:class:`RuntimeFuture` whose done callbacks run during the runtime's
+        updates. When using the process pool, *fn* and its arguments must be
+        picklable.
+        """
+    def set_callback_executor(self, item: Item, executor: Literal["thread", "process"] | concurrent.futures.Executor | None, /) -> None:
+        """Run the callbacks of *item* in *executor* instead of in the event
+        loop, or stop doing so when *executor* is `None`.
+
+        This applies to callbacks processed by the runtime under manual
+        callback management (without it, DearPyGui already runs callbacks
+        outside of the event loop). *item* may be the item's UUID, alias or
+        interface; it is matched to the *sender* of each callback by UUID.
+        Exceptions raised by offloaded callbacks are reported via
+        `sys.excepthook`.
+
+        :raises `ValueError`: *item* is an alias that is not assigned.
+        """
+    def shutdown_executors(self, /, *, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Shut down the pools created by :py:meth:`Runtime.get_executor()`.
+        New pools are created when needed."""
+    def push(self, task: Callable | Iterable, /, *, priority: int = 0) -> None:
+        """Add a task to the runtime.
+
+        Tasks with a *priority* of `0` are appended to :py:attr:`Runtime.queue`.
+        Other tasks are run before (when positive) or after (when negative)
+        those in the queue, highest priority first. Tasks of the same priority
+        run in the order they were pushed.
+
+        If *task* is a generator function, it is called. Iterables that are not
+        callable (e.g. generators) are advanced one step each time the task is
+        run, and are pushed back with the same priority until exhausted.
+        """
     def update(self, /) -> None:
         """"Tick" the runtime, processing one update.
 
         The default implementation expects the runtime queue to be an
         instance of `collections.deque` and calls the result of its
-        `popleft()` method.
+        `popleft()` method. It runs one task, or, when a
+        :py:attr:`Runtime.task_budget` is set, as many as the budget allows.
         """
     def render() -> None:
         """Renders one frame."""
+    def call_at(self, when: int, callback: Callable, /, *args) -> TimerHandle:
+        """Schedule `callback(*args)` to run once `time.perf_counter_ns()`
+        reaches *when*."""
+    def call_later(self, delay: float, callback: Callable, /, *args) -> TimerHandle:
+        """Schedule `callback(*args)` to run once *delay* milliseconds
+        have passed."""
+    def call_every(self, interval: float, callback: Callable, /, *args) -> TimerHandle:
+        """Schedule `callback(*args)` to run every *interval* milliseconds,
+        starting one interval from now, until the returned handle is
+        cancelled.
+
+        Each deadline is relative to the previous deadline rather than the
+        time of the previous call, so the timer does not drift. Periods
+        missed (e.g. while a long task ran) are skipped instead of being run
+        back-to-back.
+
+        :raises `ValueError`: *interval* is not positive.
+        """
+    def call_on_frame(self, frame: int, callback: Callable, /, *args) -> TimerHandle:
+        """Schedule `callback(*args)` to run after frame number *frame* (as
+        reported by :py:attr:`Runtime.frame_count`) is rendered, or after the
+        next frame if *frame* was already rendered."""
+    def invalidate(self, /) -> None:
+        """Mark the UI as changed, so that a runtime rendering on demand
+        renders the next frame at its frame rate limit."""
     def is_running() -> bool:
         """Return `True` if the runtime's event loop is running."""
     def run(self, /) -> None:
@@ -207,7 +526,9 @@ class Runtime[T: Callable]:
             management setting and process those callbacks in the
             event loop (separate from the runtime's updates). If
             `None`, enable manual callback management only when a
-            debugging trace is set. Defaults to `False`.
+            debugging trace is set. Manual callback management is
+            always enabled when an asyncio event loop is attached.
+            Defaults to `False`.
         """
     def signal(self, signal: type[Signal] | Signal, /) -> None:
         """Briefly halt the event loop and execute a subroutine.
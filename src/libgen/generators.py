@@ -282,6 +282,9 @@ class _ItemsGenerator(FileGenerator):
 
 
 class ItemsCodeGenerator(_ItemsGenerator):
+    # When set, each type is defined (and registered) on first access
+    # via a PEP 562 module `__getattr__` instead of on import.
+    lazy: typing.ClassVar[bool] = False
 
     class _NodeTransformer(ast.NodeTransformer):
         def visit_arg(self, node: ast.arg):
@@ -332,7 +335,7 @@ class ItemsCodeGenerator(_ItemsGenerator):
 
         buffer = [
             f"@property",
-            f"def {identifier}(self, /, *, __func=_dearpygui.{getter}):",
+            f"def {identifier}(self, /, *, __func=_cache.{getter}):",
             f"    try:",
             f"        return __func(self)[\"{name}\"]",
             f"    except KeyError:",
@@ -346,7 +349,7 @@ class ItemsCodeGenerator(_ItemsGenerator):
                 setter = setter.__name__
             buffer.extend((
                 f"@{identifier}.setter",
-                f"def {identifier}(self, value, /, *, __func=_dearpygui.{setter}):",
+                f"def {identifier}(self, value, /, *, __func=_cache.{setter}):",
                 f'    try:',
                 f"        __func(self, {name}=value)",
                 f'    except SystemError as e:',
@@ -356,7 +359,7 @@ class ItemsCodeGenerator(_ItemsGenerator):
             if default is not MISSING:
                 buffer.extend((
                     f"@{identifier}.deleter",
-                    f"def {identifier}(self, /, *, __func=_dearpygui.{setter}):",
+                    f"def {identifier}(self, /, *, __func=_cache.{setter}):",
                     f'    try:',
                     f"        __func(self, {name}={default})",
                     f'    except SystemError as e:',
@@ -518,8 +521,14 @@ class ItemsCodeGenerator(_ItemsGenerator):
         content.extend(self._generate_banner("DearPyPixl Type Definitions Library"))
 
 
+        if self.lazy:
+            content.append("import threading as _threading")
+            content.append("")
         content.append("from dearpypixl.core.appitem import *")
         content.append("from dearpypixl.core.errors import DearPyGuiError")
+        content.append("from dearpypixl.core import cache as _cache")
+        if self.lazy:
+            content.append("from dearpypixl.core import interface as _interface")
         content.append("")
         content.append("from dearpygui import dearpygui, _dearpygui")
         content.append("")
@@ -531,10 +540,18 @@ class ItemsCodeGenerator(_ItemsGenerator):
         # populates `self._symbols`
         buffer = []
         for type_info in self.metadata.typedef:
-            buffer.extend(self._generate_class(type_info))
-
             type_name = type_info.name
 
+            if self.lazy:
+                buffer.append(f"def _define_{type_name}():")
+                buffer.extend(self._generate_class(type_info, level=1))
+                buffer.append(f"    return {type_name}")
+                buffer.append('')
+                buffer.append('')
+                continue
+
+            buffer.extend(self._generate_class(type_info))
+
             commands = self._get_command_names(type_info)
             if len(commands) > 1:
                 command, command2 = commands
@@ -562,14 +579,14 @@ class ItemsCodeGenerator(_ItemsGenerator):
 
 
         content.append('@property')
-        content.append('def _property__rect_min2(self, /, *, __func=_dearpygui.get_item_state):')
+        content.append('def _property__rect_min2(self, /, *, __func=_cache.get_item_state):')
         content.append('    try:')
         content.append('        return __func(self)["pos"]')
         content.append('    except SystemError as e:')
         content.append('        raise DearPyGuiError.from_exception(e)')
         content.append('')
         content.append('@property')
-        content.append('def _property__rect_max2(self, /, *, __func=_dearpygui.get_item_state):')
+        content.append('def _property__rect_max2(self, /, *, __func=_cache.get_item_state):')
         content.append('    try:')
         content.append('        state = __func(self)')
         content.append('    except SystemError as e:')
@@ -630,6 +647,12 @@ class ItemsCodeGenerator(_ItemsGenerator):
         content.append('')
         content.extend(buffer)
         content.append('')
+
+        if self.lazy:
+            content.extend(self._generate_lazy_loader(buffer))
+            apply_newlines(content)
+            return content
+
         content.append("# late assignments")
         content.append('')
 
@@ -668,6 +691,175 @@ class ItemsCodeGenerator(_ItemsGenerator):
         return content
 
 
+    def _generate_lazy_loader(self, definitions: list[str], /) -> list[str]:
+        content = []
+
+        type_names = [ti.name for ti in self.metadata.typedef]
+        type_name_set = set(type_names)
+        symbol = re.compile(r"\bmv[A-Za-z0-9]+\b")
+
+        # types referenced by a type's definition or late assignments; these are
+        # defined alongside it since its methods refer to them as globals
+        references = collections.defaultdict(set)
+        type_name = ''
+        for ln in definitions:
+            if ln.startswith("def _define_"):
+                type_name = ln.removeprefix("def _define_").partition("(")[0]
+            elif type_name:
+                references[type_name].update(symbol.findall(ln))
+        for type_name, assignments in self._late_assignments.items():
+            for value in assignments.values():
+                references[type_name].update(symbol.findall(value))
+
+        content.append("# late assignments")
+        content.append('')
+
+        for type_name, assignments in self._late_assignments.items():
+            content.append(f"def _finalize_{type_name}():")
+            for var, value in assignments.items():
+                content.append(f"    {type_name}.{var} = {value}  # type: ignore")
+            content.append('')
+        content.append('')
+
+        content.append("# [ lazy loading ]")
+        content.append('')
+
+        content.append("_TYPE_DEPENDENCIES = {")
+        for type_name in type_names:
+            closure = {type_name}
+            stack = [type_name]
+            while stack:
+                for name in references[stack.pop()] & type_name_set:
+                    if name not in closure:
+                        closure.add(name)
+                        stack.append(name)
+            closure.discard(type_name)
+            dependencies = ', '.join(f'"{name}"' for name in (type_name, *sorted(closure)))
+            content.append(f'    "{type_name}": ({dependencies},),')
+        content.append("}")
+        content.append('')
+
+        content.append("_TYPE_COMMANDS = {")
+        for type_info in self.metadata.typedef:
+            commands = ', '.join(f'"{command}"' for command in self._get_command_names(type_info))
+            content.append(f'    "{type_info.name}": ({commands},),')
+        content.append("}")
+        content.append('')
+
+        content.append("_COMMAND_TYPES = {command:type_name for type_name, commands in _TYPE_COMMANDS.items() for command in commands}")
+        content.append('')
+        content.append("_TYPE_NAMES = {getattr(_dearpygui, type_name):type_name for type_name in _TYPE_DEPENDENCIES}")
+        content.append('')
+        content.append('')
+
+        content.extend((
+            "class _TypeTuple:",
+            "    # resolves to a tuple of types on first access",
+            "    __slots__ = (\"names\", \"value\")",
+            "",
+            "    def __init__(self, names, /):",
+            "        self.names = names",
+            "        self.value = None",
+            "",
+            "    def __get__(self, instance, owner=None, /):",
+            "        value = self.value",
+            "        if value is None:",
+            "            value = self.value = tuple(map(_load, self.names))",
+            "        return value",
+            "",
+            "",
+        ))
+
+        local_vars = (
+            ("parents", self._is_common_parent, self._is_common_child, FeatureFlag.CHILD),
+            ("children", self._is_common_child, self._is_common_parent, FeatureFlag.PARENT),
+        )
+        for var, pred_global_value, filter_mthd, filter_flag in local_vars:
+            global_name  = f"_COMMON_{var.upper()}"
+            global_value = ', '.join(f'"{ti.name}"' for ti in self.metadata.typedef if pred_global_value(ti))
+            content.append(f"{global_name} = _TypeTuple(({global_value}))")
+            content.append(f"_ITEM_{var.upper()} = {{")
+
+            for type_info in self.metadata.typedef:
+                if filter_mthd(type_info):
+                    value = global_name
+                elif type_info.flags & filter_flag:
+                    s = ', '.join(f'"{symbol}"' for symbol in getattr(type_info, var))
+                    value = f"_TypeTuple(({s},))" if s else "()"
+                else:
+                    continue
+                content.append(f'    "{type_info.name}": {value},')
+
+            content.append("}")
+            content.append(f"del {global_name}")
+            content.append('')
+        content.append('')
+
+        content.extend((
+            "_lock = _threading.RLock()",
+            "",
+            "",
+            "def _load(type_name, /):",
+            "    namespace = globals()",
+            "    with _lock:",
+            "        try:",
+            "            return namespace[type_name]",
+            "        except KeyError:",
+            "            pass",
+            "",
+            "        pending = [name for name in _TYPE_DEPENDENCIES[type_name] if name not in namespace]",
+            "        for name in pending:",
+            "            item_type = namespace[name] = namespace.pop(f\"_define_{name}\")()",
+            "            item_type.__qualname__ = name",
+            "",
+            "        for name in pending:",
+            "            item_type = namespace[name]",
+            "            finalize = namespace.pop(f\"_finalize_{name}\", None)",
+            "            if finalize is not None:",
+            "                finalize()",
+            "            if name in _ITEM_PARENTS:",
+            "                item_type.__item_parents__ = _ITEM_PARENTS[name]",
+            "            if name in _ITEM_CHILDREN:",
+            "                item_type.__item_children__ = _ITEM_CHILDREN[name]",
+            "            for command in _TYPE_COMMANDS[name]:",
+            "                namespace[command] = item_type.create",
+            "",
+            "        return namespace[type_name]",
+            "",
+            "",
+            "def _load_registered(key, /):",
+            "    if isinstance(key, str):",
+            "        type_name = key.removeprefix(\"mvAppItemType::\")",
+            "    else:",
+            "        type_name = _TYPE_NAMES.get(key, '')",
+            "    if type_name not in _TYPE_DEPENDENCIES:",
+            "        raise KeyError(key)",
+            "    _load(type_name)",
+            "    return _interface.Interface.__item_registry__[key]",
+            "",
+            "_interface.Interface.__item_registry__.loader = _load_registered",
+            "",
+            "",
+            "def __getattr__(name, /):",
+            "    type_name = _COMMAND_TYPES.get(name, name)",
+            "    if type_name in _TYPE_DEPENDENCIES:",
+            "        _load(type_name)",
+            "        return globals()[name]",
+            "    raise AttributeError(f\"module {__name__!r} has no attribute {name!r}\")",
+            "",
+            "",
+            "def __dir__():",
+            "    return sorted({*globals(), *_TYPE_DEPENDENCIES, *_COMMAND_TYPES})",
+            "",
+        ))
+
+        return content
+
+
+class LazyItemsCodeGenerator(ItemsCodeGenerator):
+    lazy = True
+
+
 class ItemsStubGenerator(_ItemsGenerator):
 
     class _NodeTransformer(ast.NodeTransformer):
@@ -1144,9 +1336,15 @@ items_spec = FileSpec("items", 'lib', ItemsCodeGenerator, ItemsStubGenerator).re
 class ConstantsCodeGenerator(FileGenerator):
     module_name = "dearpypixl_lib_constants.py"
 
+    # When set, generated enum groups are built on first access instead of
+    # at import. Their constants are bound eagerly as plain integers. The
+    # hand-written definitions (`mvKey`, `mvMouseButton`, etc) are unaffected.
+    lazy: typing.ClassVar[bool] = False
+
     def __init__(self, metadata: DearPyGuiMetadata, /) -> None:
         super().__init__(metadata)
         self._exports = []
+        self._lazy_enums = []
 
     class _NodeTransformer(ast.NodeTransformer):
         def __init__(self, *args, **kwargs) -> None:
@@ -1229,6 +1427,23 @@ class ConstantsCodeGenerator(FileGenerator):
     def _generate_enum(self, enum_name, constants, /):
         buffer = []
 
+        if self.lazy:
+            buffer.append(f"def _define_{enum_name}():")
+            buffer.append(f"    class {enum_name}(enum.IntEnum):")
+            for (member, const) in constants:
+                buffer.append(f"        {member or const} = _dearpygui.{const}")
+            buffer.append(f"    return {enum_name}")
+            buffer.append('')
+
+            for (member, const) in constants:
+                buffer.append(f"{const} = _dearpygui.{const}")
+                self._exports.append(const)
+            buffer.append('')
+
+            self._lazy_enums.append(enum_name)
+            buffer.append('')
+            return buffer
+
         buffer.append(f"class {enum_name}(enum.IntEnum):")
         for (member, const) in constants:
             buffer.append(f"    {member or const} = _dearpygui.{const}")
@@ -1248,6 +1463,8 @@ class ConstantsCodeGenerator(FileGenerator):
         content.extend(self._generate_banner("DearPyPixl Constants Library"))
 
         content.append('import enum')
+        if self.lazy:
+            content.append('import threading as _threading')
         content.append('')
         content.append('from dearpypixl.core.errors import mvErrorCode as mvErrorCode')
         content.append('')
@@ -1290,6 +1507,11 @@ class ConstantsCodeGenerator(FileGenerator):
                     buffer.append('')
             buffer.append(ln)
 
+        if self.lazy:
+            buffer.append('')
+            buffer.append('')
+            buffer.extend(self._generate_lazy_loader())
+
         content.append('__all__ = (')
         for name in self._exports:
             content.append(f'    "{name}",')
@@ -1304,6 +1526,45 @@ class ConstantsCodeGenerator(FileGenerator):
         apply_newlines(content)
         return content
 
+    def _generate_lazy_loader(self, /) -> list[str]:
+        content = []
+
+        content.append("# [ lazy loading ]")
+        content.append('')
+        content.append("_LAZY_ENUMS = (")
+        for enum_name in self._lazy_enums:
+            content.append(f'    "{enum_name}",')
+        content.append(")")
+        content.append('')
+        content.extend((
+            "_lock = _threading.Lock()",
+            "",
+            "",
+            "def __getattr__(name, /):",
+            "    if name not in _LAZY_ENUMS:",
+            "        raise AttributeError(f\"module {__name__!r} has no attribute {name!r}\")",
+            "    namespace = globals()",
+            "    with _lock:",
+            "        try:",
+            "            return namespace[name]",
+            "        except KeyError:",
+            "            pass",
+            "        enum_type = namespace[name] = namespace.pop(f\"_define_{name}\")()",
+            "        enum_type.__qualname__ = name",
+            "        return enum_type",
+            "",
+            "",
+            "def __dir__():",
+            "    return sorted({*globals(), *_LAZY_ENUMS})",
+            "",
+        ))
+
+        return content
+
+
+class LazyConstantsCodeGenerator(ConstantsCodeGenerator):
+    lazy = True
+
 
 constants_spec = FileSpec("constants", 'lib', ConstantsCodeGenerator).register()
 
@@ -1497,6 +1758,13 @@ if __name__ == "__main__":
     md = metadata.parse(archive, version)
     dp = Path("./src/dearpypixl")
 
+    # Lazy libraries are opt-in. The shipped `lib/items.py` and
+    # `lib/constants.py` are generated without these flags (eagerly).
+    if "--lazy-items" in sys.argv:
+        items_spec = dataclasses.replace(items_spec, codegen=LazyItemsCodeGenerator)
+    if "--lazy-constants" in sys.argv:
+        constants_spec = dataclasses.replace(constants_spec, codegen=LazyConstantsCodeGenerator)
+
     for spec in (
         items_spec,
         color_spec,
@@ -0,0 +1,81 @@
+"""Tests for the ring buffer behind `VirtualConsole`. Its lines are
+compared against a `collections.deque` with the same *maxlen*.
+
+Run from the repository root with `python -m unittest discover tests`.
+"""
+import random
+import unittest
+import collections
+
+from dearpygui import dearpygui
+
+from dearpypixl.console import VirtualConsole
+
+
+
+
+class VirtualConsoleTest(unittest.TestCase):
+    def setUp(self) -> None:
+        dearpygui.create_context()
+        self.addCleanup(dearpygui.destroy_context)
+        self.window = dearpygui.add_window()
+
+    def create(self, max_len: int | None = None, /) -> VirtualConsole:
+        return VirtualConsole.create('', max_len, parent=self.window)
+
+    def test_write(self) -> None:
+        console = self.create()
+        console.write("a\nb\n")
+        console.write("c")
+        console.writelines(["d\ne", "f\n"])
+        self.assertEqual(console.lines, ["a", "b", "c", "d", "e", "f"])
+        self.assertEqual(str(console), "a\nb\nc\nd\ne\nf")
+
+    def test_max_len_larger_than_lines(self) -> None:
+        console = self.create()
+        console.writelines(["a", "b"])
+        console.max_len = 5
+        self.assertEqual(console.lines, ["a", "b"])
+
+        console.writelines(["c", "d", "e", "f"])
+        console.max_len = 9
+        self.assertEqual(console.lines, ["b", "c", "d", "e", "f"])
+        console.max_len = 2
+        self.assertEqual(console.lines, ["e", "f"])
+        console.max_len = 0
+        self.assertEqual(console.lines, [])
+
+        with self.assertRaises(ValueError):
+            console.max_len = -1
+
+    def test_matches_deque(self) -> None:
+        for seed in range(100):
+            rng = random.Random(seed)
+            max_len = rng.choice([None, 0, 1, 3, 7])
+            console = self.create(max_len)
+            model = collections.deque(maxlen=max_len)
+            for _ in range(30):
+                match rng.randrange(4):
+                    case 0:
+                        lines = [str(rng.randrange(100)) for _ in range(rng.randrange(10))]
+                        console.writelines(lines)
+                        model.extend(lines)
+                    case 1:
+                        lines = [str(rng.randrange(100)) for _ in range(rng.randint(1, 5))]
+                        console.write("\n".join(lines) + rng.choice(["", "\n"]))
+                        model.extend(lines)
+                    case 2:
+                        max_len = rng.choice([None, 0, 2, 5, 9])
+                        console.max_len = max_len
+                        model = collections.deque(model, maxlen=max_len)
+                    case 3:
+                        console.clear()
+                        model.clear()
+                self.assertEqual(console.lines, list(model), f"seed {seed}")
+                self.assertEqual(len(console), len(model))
+
+
+
+
+if __name__ == "__main__":
+    unittest.main()
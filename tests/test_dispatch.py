@@ -0,0 +1,97 @@
+"""Tests for the callback dispatcher used under manual callback
+management.
+
+Run from the repository root with `python -m unittest discover tests`.
+"""
+import gc
+import weakref
+import unittest
+
+from dearpygui import dearpygui
+
+from dearpypixl.core import dispatch
+
+
+
+
+class _Callback:
+    def __init__(self, calls: list, /) -> None:
+        self.calls = calls
+
+    def __call__(self, sender, app_data, /) -> None:
+        self.calls.append((sender, app_data))
+
+
+class CallbackDispatcherTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.dispatcher = dispatch.CallbackDispatcher()
+
+    def test_arguments_match_arity(self) -> None:
+        calls = []
+        jobs = [
+            (lambda: calls.append(()), 1, 2, 3),
+            (lambda s: calls.append((s,)), 1, 2, 3),
+            (_Callback(calls), 1, 2, 3),
+            (lambda *args: calls.append(args), 1, 2, 3),
+            (None, 1, 2, 3),
+        ]
+        self.dispatcher(jobs)
+        self.dispatcher(jobs)  # cached
+        self.assertEqual(calls, [(), (1,), (1, 2), (1, 2, 3)] * 2)
+        self.assertEqual(self.dispatcher.jobs, 4)
+
+    def test_dropped_callback_is_collected(self) -> None:
+        calls = []
+        for factory in (_Callback, lambda calls: lambda s, a, u: calls.append(u)):
+            callback = factory(calls)
+            with self.subTest(type(callback).__name__):
+                ref = weakref.ref(callback)
+                self.dispatcher([(callback, 1, 2, 3)])
+                self.dispatcher.get_invoker(callback)(1, 2, 3)
+                self.assertEqual(len(self.dispatcher._callers), 1)
+
+                del callback
+                gc.collect()
+                self.assertIsNone(ref())
+                self.assertFalse(self.dispatcher._callers)
+
+    def test_coroutine_callback(self) -> None:
+        calls = []
+
+        async def callback(sender, /):
+            calls.append(sender)
+
+        ref = weakref.ref(callback)
+        self.dispatcher.coroutine_handler = lambda coroutine: coroutine.send(None)
+        with self.assertRaises(StopIteration):
+            self.dispatcher([(callback, 1, 2, 3)])
+        self.assertEqual(calls, [1])
+
+        self.dispatcher.coroutine_handler = None
+        with self.assertRaises(RuntimeError):
+            self.dispatcher([(callback, 1, 2, 3)])
+
+        del callback
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertFalse(self.dispatcher._callers)
+
+    def test_executors_match_sender_uuid(self) -> None:
+        dearpygui.create_context()
+        self.addCleanup(dearpygui.destroy_context)
+        uuid = dearpygui.add_window(tag="window")
+        uuid = dearpygui.get_alias_id(uuid) if isinstance(uuid, str) else uuid
+
+        calls, submitted = [], []
+        self.dispatcher.executors[uuid] = lambda *job: submitted.append(job[1:])
+        callback = _Callback(calls)
+        # DearPyGui reports the alias of items created with one
+        self.dispatcher([(callback, "window", 1, 2), (callback, uuid, 3, 4), (callback, 0, 5, 6)])
+        self.assertEqual(submitted, [("window", 1, 2), (uuid, 3, 4)])
+        self.assertEqual(calls, [(0, 5)])
+
+
+
+
+if __name__ == "__main__":
+    unittest.main()
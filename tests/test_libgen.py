@@ -0,0 +1,219 @@
+"""Tests for the lazily-loaded libraries emitted by `libgen`. Each lazy
+module is compared against the eager module generated from the same
+metadata.
+
+Run from the repository root with `python -m unittest discover tests`.
+"""
+import sys
+import enum
+import types
+import pathlib
+import unittest
+
+import dearpypixl
+from dearpypixl.core import interface
+from dearpypixl.lib import items as dpx_items
+from dearpypixl.lib import constants as dpx_constants
+
+from dearpygui import _dearpygui
+
+sys.path.insert(0, str(pathlib.Path(__file__).parents[1] / "src" / "libgen"))
+
+import generators  # noqa: E402
+from metadata import DearPyGuiMetadata, FeatureFlag, ItemTypeInfo, Parameter  # noqa: E402
+
+
+
+
+def _parameters(*names: str) -> list[Parameter]:
+    return [Parameter.keyword(name, "int | str", "0") for name in names]
+
+
+_ROOT   = FeatureFlag.ROOT | FeatureFlag.PARENT
+_PARENT = FeatureFlag.PARENT | FeatureFlag.CHILD
+_CHILD  = FeatureFlag.CHILD
+
+# common parents/children, a parent-only chain (`mvTheme` -> `mvThemeComponent`
+# -> `mvThemeColor`) and a late assignment (`mvTheme.__item_index_type__`)
+ITEMS_METADATA = DearPyGuiMetadata("", typedef=[
+    ItemTypeInfo("mvButton", "add_button", parameters=_parameters("tag", "parent"), flags=_CHILD),
+    ItemTypeInfo("mvGroup", "add_group", parameters=_parameters("tag", "parent"), flags=_PARENT),
+    ItemTypeInfo("mvText", "add_text", parameters=_parameters("tag", "parent"), flags=_CHILD),
+    ItemTypeInfo("mvTheme", "add_theme", parameters=_parameters("tag"), flags=_ROOT, children=["mvThemeComponent"]),
+    ItemTypeInfo("mvThemeColor", "add_theme_color", parameters=_parameters("tag", "parent"), flags=_CHILD, parents=["mvThemeComponent"]),
+    ItemTypeInfo("mvThemeComponent", "add_theme_component", parameters=_parameters("tag", "parent"), flags=_PARENT, parents=["mvTheme"], children=["mvThemeColor"]),
+    ItemTypeInfo("mvWindowAppItem", "add_window", parameters=_parameters("tag"), flags=_ROOT),
+])
+
+TYPE_NAMES = [type_info.name for type_info in ITEMS_METADATA.typedef]
+
+
+def _names(item_types) -> list[str]:
+    return [item_type.__name__ for item_type in item_types]
+
+
+
+
+class LazyItemsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # generated modules register their types in the shared registry
+        registry = self.registry = interface.Interface.__item_registry__
+        saved, loader = dict(registry), registry.loader
+
+        def restore():
+            registry.clear()
+            registry.update(saved)
+            registry.loader = loader
+
+        self.addCleanup(restore)
+
+    def load(self, codegen: type[generators.ItemsCodeGenerator], /) -> types.ModuleType:
+        self.registry.clear()
+        self.registry.loader = None
+        module = types.ModuleType(f"_test_{codegen.__name__}")
+        source = "\n".join(codegen(ITEMS_METADATA).generate())
+        exec(compile(source, module.__name__, "exec"), vars(module))
+        return module
+
+    def test_types_are_built_on_access(self) -> None:
+        lazy = self.load(generators.LazyItemsCodeGenerator)
+        self.assertFalse(self.registry)
+        self.assertTrue(all(name not in vars(lazy) for name in TYPE_NAMES))
+
+        mvButton = lazy.mvButton
+        self.assertIs(self.registry[_dearpygui.mvButton], mvButton)
+        self.assertEqual(mvButton.__qualname__, "mvButton")
+        self.assertNotIn("mvTheme", vars(lazy))
+
+    def test_registry_builds_untouched_types(self) -> None:
+        lazy = self.load(generators.LazyItemsCodeGenerator)
+
+        mvThemeColor = self.registry[_dearpygui.mvThemeColor]
+        self.assertIs(mvThemeColor, lazy.mvThemeColor)
+        self.assertIs(self.registry["mvAppItemType::mvGroup"], lazy.mvGroup)
+
+        # `mvTheme` is only reachable through the parents of its parent
+        self.assertNotIn("mvTheme", vars(lazy))
+        (mvThemeComponent,) = mvThemeColor.__item_parents__
+        self.assertIs(mvThemeComponent, lazy.mvThemeComponent)
+        (mvTheme,) = mvThemeComponent.__item_parents__
+        self.assertIs(mvTheme, self.registry[_dearpygui.mvTheme])
+        self.assertIs(mvTheme.__item_index_type__, mvThemeComponent)
+
+        for key in (_dearpygui.mvSliderFloat, "mvAppItemType::mvSliderFloat", -1):
+            with self.assertRaises(KeyError):
+                self.registry[key]
+
+    def test_relationships_match_eager_library(self) -> None:
+        eager = self.load(generators.ItemsCodeGenerator)
+        lazy  = self.load(generators.LazyItemsCodeGenerator)
+
+        for name in TYPE_NAMES:
+            with self.subTest(name):
+                eager_type = getattr(eager, name)
+                # built through the registry, as when looked up by item type
+                lazy_type = self.registry[getattr(_dearpygui, name)]
+                self.assertEqual(_names(lazy_type.__item_parents__), _names(eager_type.__item_parents__))
+                self.assertEqual(_names(lazy_type.__item_children__), _names(eager_type.__item_children__))
+                self.assertEqual(lazy_type.__item_command__, eager_type.__item_command__)
+                self.assertEqual(lazy_type.__item_slot__, eager_type.__item_slot__)
+                self.assertEqual(
+                    getattr(getattr(lazy_type, "__item_index_type__", None), "__name__", None),
+                    getattr(getattr(eager_type, "__item_index_type__", None), "__name__", None),
+                )
+                self.assertEqual(
+                    sorted(n for n in vars(lazy_type) if not n.startswith("__")),
+                    sorted(n for n in vars(eager_type) if not n.startswith("__")),
+                )
+
+    def test_commands(self) -> None:
+        eager = self.load(generators.ItemsCodeGenerator)
+        lazy  = self.load(generators.LazyItemsCodeGenerator)
+
+        public = {name for name in vars(eager) if not name.startswith("_")}
+        self.assertLessEqual(public, set(dir(lazy)))
+        for name in ("add_button", "add_group", "group", "theme_component"):
+            with self.subTest(name):
+                command = getattr(lazy, name)
+                self.assertEqual(command.__self__.__name__, getattr(eager, name).__self__.__name__)
+                self.assertEqual(command, command.__self__.create)
+
+        with self.assertRaises(AttributeError):
+            lazy.mvNotAType
+
+    def test_package_getattr(self) -> None:
+        # only defined when the shipped item library is the lazy one
+        self.assertEqual("__getattr__" in vars(dearpypixl), "__getattr__" in vars(dpx_items))
+
+
+
+# the constants of the shipped library, which was generated from DearPyGui's sources
+CONSTANTS_METADATA = DearPyGuiMetadata("", constants=[name for name in dpx_constants.__all__ if name != "mvErrorCode"])
+
+
+def _enums(module: types.ModuleType, /) -> dict[str, type[enum.IntEnum]]:
+    return {
+        name: value for name, value in vars(module).items()
+        if isinstance(value, type) and issubclass(value, enum.IntEnum)
+    }
+
+
+class LazyConstantsTest(unittest.TestCase):
+    def load(self, codegen: type[generators.ConstantsCodeGenerator], /) -> types.ModuleType:
+        module = types.ModuleType(f"_test_{codegen.__name__}")
+        source = "\n".join(codegen(CONSTANTS_METADATA).generate())
+        exec(compile(source, module.__name__, "exec"), vars(module))
+        return module
+
+    def setUp(self) -> None:
+        self.eager = self.load(generators.ConstantsCodeGenerator)
+        self.lazy  = self.load(generators.LazyConstantsCodeGenerator)
+
+    def test_exports_match(self) -> None:
+        self.assertEqual(self.lazy.__all__, self.eager.__all__)
+        self.assertLessEqual({n for n in vars(self.eager) if not n.startswith("_")}, set(dir(self.lazy)))
+
+    def test_constants_are_plain_ints(self) -> None:
+        lazy_vars = vars(self.lazy)
+        for name in CONSTANTS_METADATA.constants:
+            with self.subTest(name):
+                # bound at import; reading them must not build a group
+                self.assertIn(name, lazy_vars)
+                eager_value = getattr(self.eager, name)
+                self.assertEqual(lazy_vars[name], getattr(_dearpygui, name))
+                self.assertEqual(lazy_vars[name], eager_value)
+                if type(eager_value).__name__ in self.lazy._LAZY_ENUMS:
+                    self.assertIs(type(lazy_vars[name]), int)
+
+    def test_groups_are_built_on_access(self) -> None:
+        lazy_vars = vars(self.lazy)
+        self.assertTrue(self.lazy._LAZY_ENUMS)
+        self.assertFalse(set(self.lazy._LAZY_ENUMS) & lazy_vars.keys())
+
+        name = self.lazy._LAZY_ENUMS[0]
+        group = getattr(self.lazy, name)
+        self.assertIs(lazy_vars[name], group)
+        self.assertIs(getattr(self.lazy, name), group)
+        self.assertEqual(len(set(self.lazy._LAZY_ENUMS) & lazy_vars.keys()), 1)
+
+        with self.assertRaises(AttributeError):
+            self.lazy.mvNotAConstant
+
+    def test_groups_match_eager_library(self) -> None:
+        eager_enums = _enums(self.eager)
+        self.assertLessEqual(set(self.lazy._LAZY_ENUMS), eager_enums.keys())
+        for name, eager_enum in eager_enums.items():
+            with self.subTest(name):
+                lazy_enum = getattr(self.lazy, name)
+                self.assertTrue(issubclass(lazy_enum, enum.IntEnum))
+                self.assertEqual(lazy_enum.__qualname__, eager_enum.__qualname__)
+                self.assertEqual(
+                    {member: int(value) for member, value in lazy_enum.__members__.items()},
+                    {member: int(value) for member, value in eager_enum.__members__.items()},
+                )
+
+
+
+
+if __name__ == "__main__":
+    unittest.main()